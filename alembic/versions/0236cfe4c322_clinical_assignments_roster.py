@@ -0,0 +1,30 @@
+"""Clinical assignments roster
+
+Revision ID: 0236cfe4c322
+Revises: b1490a88cac7
+Create Date: 2026-10-17 17:32:36.841707
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0236cfe4c322'
+down_revision: Union[str, Sequence[str], None] = 'b1490a88cac7'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column("clinical_assignments", sa.Column("lastViewedAt", sa.DateTime(), nullable=True))
+    op.create_index("idx_clinical_assignments_clinicianId", "clinical_assignments", ["clinicianId"])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("idx_clinical_assignments_clinicianId", table_name="clinical_assignments")
+    op.drop_column("clinical_assignments", "lastViewedAt")
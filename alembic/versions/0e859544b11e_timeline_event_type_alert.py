@@ -0,0 +1,32 @@
+"""Timeline event type alert
+
+Revision ID: 0e859544b11e
+Revises: d5b04d49c660
+Create Date: 2026-10-17 17:27:29.469362
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0e859544b11e'
+down_revision: Union[str, Sequence[str], None] = 'd5b04d49c660'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # SQLite stores the enum as VARCHAR; only Postgres has a type to extend
+    if op.get_bind().dialect.name == "postgresql":
+        with op.get_context().autocommit_block():
+            op.execute("ALTER TYPE timeline_event_type_enum ADD VALUE IF NOT EXISTS 'ALERT'")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    # Postgres cannot drop a value from an enum type; ALERT rows stay readable
+    pass
@@ -0,0 +1,36 @@
+"""Service request feed indexes
+
+Revision ID: 3181b54bb086
+Revises: e98a44ced981
+Create Date: 2026-10-17 17:42:24.880003
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3181b54bb086'
+down_revision: Union[str, Sequence[str], None] = 'e98a44ced981'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index("idx_service_requests_status_createdAt", "service_requests", ["status", "createdAt", "id"])
+    op.create_index("idx_service_requests_volunteerId_createdAt", "service_requests", ["volunteerId", "createdAt", "id"])
+    op.create_index("idx_service_requests_organizationId_createdAt", "service_requests", ["organizationId", "createdAt", "id"])
+    op.create_index("idx_service_requests_patientId_createdAt", "service_requests", ["patientId", "createdAt", "id"])
+    op.create_index("idx_service_requests_createdAt", "service_requests", ["createdAt", "id"])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("idx_service_requests_createdAt", table_name="service_requests")
+    op.drop_index("idx_service_requests_patientId_createdAt", table_name="service_requests")
+    op.drop_index("idx_service_requests_organizationId_createdAt", table_name="service_requests")
+    op.drop_index("idx_service_requests_volunteerId_createdAt", table_name="service_requests")
+    op.drop_index("idx_service_requests_status_createdAt", table_name="service_requests")
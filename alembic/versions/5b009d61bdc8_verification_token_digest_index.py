@@ -0,0 +1,28 @@
+"""Verification token digest index
+
+Revision ID: 5b009d61bdc8
+Revises: 22583a80dde2
+Create Date: 2026-10-17 17:07:55.117597
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5b009d61bdc8'
+down_revision: Union[str, Sequence[str], None] = '22583a80dde2'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index("idx_verification_tokens_tokenHash", "verification_tokens", ["tokenHash"], unique=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("idx_verification_tokens_tokenHash", table_name="verification_tokens")
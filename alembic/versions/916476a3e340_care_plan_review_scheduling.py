@@ -0,0 +1,30 @@
+"""Care plan review scheduling
+
+Revision ID: 916476a3e340
+Revises: 0236cfe4c322
+Create Date: 2026-10-17 17:33:39.116227
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '916476a3e340'
+down_revision: Union[str, Sequence[str], None] = '0236cfe4c322'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column("care_plans", sa.Column("reviewNotifiedAt", sa.DateTime(), nullable=True))
+    op.create_index("idx_care_plans_status_reviewDate", "care_plans", ["status", "reviewDate"])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("idx_care_plans_status_reviewDate", table_name="care_plans")
+    op.drop_column("care_plans", "reviewNotifiedAt")
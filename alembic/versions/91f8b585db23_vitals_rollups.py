@@ -0,0 +1,97 @@
+"""Vitals rollups
+
+Revision ID: 91f8b585db23
+Revises: ee233815aeda
+Create Date: 2026-10-17 17:23:14.301114
+
+"""
+from typing import Sequence, Union
+
+import re
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '91f8b585db23'
+down_revision: Union[str, Sequence[str], None] = 'ee233815aeda'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+BATCH_SIZE = 5000
+_BLOOD_PRESSURE = re.compile(r"^\s*(\d{2,3})\s*/\s*(\d{2,3})\s*$")
+
+
+def _backfill(rollups_table) -> None:
+    # Stream readings patient by patient; a patient's groups are complete
+    # once the next patient starts, so only one patient's rollups are held in memory.
+    vitals = sa.table(
+        "vitals_records",
+        sa.column("patientId", sa.Uuid), sa.column("recordedAt", sa.DateTime),
+        sa.column("heartRate"), sa.column("temperature"), sa.column("oxygenSaturation"), sa.column("bloodPressure")
+    )
+    result = op.get_bind().execution_options(stream_results=True, yield_per=BATCH_SIZE).execute(
+        sa.select(vitals).order_by(vitals.c.patientId, vitals.c.recordedAt)
+    )
+    rollups, patient_id = {}, None
+    for row in result:
+        if row.patientId != patient_id and rollups:
+            op.bulk_insert(rollups_table, list(rollups.values()))
+            rollups = {}
+        patient_id = row.patientId
+        match = _BLOOD_PRESSURE.match(row.bloodPressure or "")
+        values = {
+            "heartRate": row.heartRate,
+            "temperature": row.temperature,
+            "oxygenSaturation": row.oxygenSaturation,
+            "systolic": int(match.group(1)) if match else None,
+            "diastolic": int(match.group(2)) if match else None,
+        }
+        hour_start = row.recordedAt.replace(minute=0, second=0, microsecond=0)
+        buckets = (("hour", hour_start), ("day", hour_start.replace(hour=0)))
+        for metric, value in values.items():
+            if value is None:
+                continue
+            for resolution, bucket_start in buckets:
+                key = (resolution, bucket_start, metric)
+                if key not in rollups:
+                    rollups[key] = {
+                        "patientId": patient_id, "resolution": resolution, "bucketStart": bucket_start,
+                        "metric": metric, "readingCount": 0, "total": 0.0, "minValue": value,
+                        "maxValue": value, "lastValue": value, "lastAt": row.recordedAt,
+                    }
+                rollup = rollups[key]
+                rollup["readingCount"] += 1
+                rollup["total"] += value
+                rollup["minValue"] = min(rollup["minValue"], value)
+                rollup["maxValue"] = max(rollup["maxValue"], value)
+                rollup["lastValue"], rollup["lastAt"] = value, row.recordedAt
+    if rollups:
+        op.bulk_insert(rollups_table, list(rollups.values()))
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index("idx_vitals_records_patientId_recordedAt", "vitals_records", ["patientId", "recordedAt"])
+    rollups_table = op.create_table(
+        "vitals_rollups",
+        sa.Column("patientId", sa.Uuid(), sa.ForeignKey("users.id", ondelete="CASCADE"), primary_key=True),
+        sa.Column("resolution", sa.String(length=8), primary_key=True),
+        sa.Column("bucketStart", sa.DateTime(), primary_key=True),
+        sa.Column("metric", sa.String(length=32), primary_key=True),
+        sa.Column("readingCount", sa.Integer(), nullable=False),
+        sa.Column("total", sa.Float(), nullable=False),
+        sa.Column("minValue", sa.Float(), nullable=False),
+        sa.Column("maxValue", sa.Float(), nullable=False),
+        sa.Column("lastValue", sa.Float(), nullable=False),
+        sa.Column("lastAt", sa.DateTime(), nullable=False),
+    )
+    _backfill(rollups_table)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table("vitals_rollups")
+    op.drop_index("idx_vitals_records_patientId_recordedAt", table_name="vitals_records")
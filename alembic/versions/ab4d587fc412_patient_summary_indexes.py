@@ -0,0 +1,32 @@
+"""Patient summary indexes
+
+Revision ID: ab4d587fc412
+Revises: 0e859544b11e
+Create Date: 2026-10-17 17:28:54.416006
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'ab4d587fc412'
+down_revision: Union[str, Sequence[str], None] = '0e859544b11e'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index("idx_care_plans_patientId_createdAt", "care_plans", ["patientId", "createdAt"])
+    op.create_index("idx_consultation_notes_patientId_consultationDate", "consultation_notes", ["patientId", "consultationDate"])
+    op.create_index("idx_prescriptions_patientId_issuedAt", "prescriptions", ["patientId", "issuedAt"])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("idx_prescriptions_patientId_issuedAt", table_name="prescriptions")
+    op.drop_index("idx_consultation_notes_patientId_consultationDate", table_name="consultation_notes")
+    op.drop_index("idx_care_plans_patientId_createdAt", table_name="care_plans")
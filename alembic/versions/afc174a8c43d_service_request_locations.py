@@ -0,0 +1,57 @@
+"""Service request locations
+
+Revision ID: afc174a8c43d
+Revises: 3181b54bb086
+Create Date: 2026-10-17 17:46:44.050694
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+from backend.geo import location_columns
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'afc174a8c43d'
+down_revision: Union[str, Sequence[str], None] = '3181b54bb086'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _backfill() -> None:
+    # Existing requests are located at their patient's current zip code
+    requests = sa.table(
+        "service_requests",
+        sa.column("id", sa.Uuid), sa.column("patientId", sa.Uuid),
+        sa.column("geoX", sa.Float), sa.column("geoY", sa.Float), sa.column("geoZ", sa.Float), sa.column("geoCell", sa.Integer)
+    )
+    users = sa.table("users", sa.column("id", sa.Uuid), sa.column("zipCode", sa.String))
+    bind = op.get_bind()
+    rows = bind.execute(
+        sa.select(requests.c.id, users.c.zipCode).join(users, users.c.id == requests.c.patientId).where(users.c.zipCode.is_not(None))
+    ).all()
+    for request_id, zip_code in rows:
+        columns = location_columns(zip_code)
+        if columns["geoCell"] is not None:
+            bind.execute(requests.update().where(requests.c.id == request_id).values(**columns))
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column("service_requests", sa.Column("geoX", sa.Float(), nullable=True))
+    op.add_column("service_requests", sa.Column("geoY", sa.Float(), nullable=True))
+    op.add_column("service_requests", sa.Column("geoZ", sa.Float(), nullable=True))
+    op.add_column("service_requests", sa.Column("geoCell", sa.Integer(), nullable=True))
+    op.create_index("idx_service_requests_geoCell_status", "service_requests", ["geoCell", "status"])
+    _backfill()
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("idx_service_requests_geoCell_status", table_name="service_requests")
+    op.drop_column("service_requests", "geoCell")
+    op.drop_column("service_requests", "geoZ")
+    op.drop_column("service_requests", "geoY")
+    op.drop_column("service_requests", "geoX")
@@ -0,0 +1,56 @@
+"""Clinical full text search
+
+Revision ID: b1490a88cac7
+Revises: ab4d587fc412
+Create Date: 2026-10-17 17:30:23.685555
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+from backend.search import SQLITE_DDL, POSTGRES_DDL
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b1490a88cac7'
+down_revision: Union[str, Sequence[str], None] = 'ab4d587fc412'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    dialect = op.get_bind().dialect.name
+    if dialect == "postgresql":
+        # Generated columns are computed for existing rows when added
+        for statement in POSTGRES_DDL:
+            op.execute(statement)
+    elif dialect == "sqlite":
+        for statement in SQLITE_DDL:
+            op.execute(statement)
+        op.execute(
+            "INSERT INTO clinical_search (body, patientKey, sourceType, sourceId, occurredAt) "
+            "SELECT coalesce(subjective, '') || char(10) || coalesce(objective, '') || char(10) || coalesce(assessment, '') || char(10) || coalesce(plan, ''), "
+            "'p' || \"patientId\", 'CONSULTATION_NOTE', id, \"consultationDate\" FROM consultation_notes"
+        )
+        op.execute(
+            "INSERT INTO clinical_search (body, patientKey, sourceType, sourceId, occurredAt) "
+            "SELECT description, 'p' || \"patientId\", 'TIMELINE_EVENT', id, \"timestamp\" FROM timeline_events"
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    dialect = op.get_bind().dialect.name
+    if dialect == "postgresql":
+        op.execute("DROP INDEX IF EXISTS idx_timeline_events_searchVector")
+        op.execute("DROP INDEX IF EXISTS idx_consultation_notes_searchVector")
+        op.execute('ALTER TABLE timeline_events DROP COLUMN IF EXISTS "searchVector"')
+        op.execute('ALTER TABLE consultation_notes DROP COLUMN IF EXISTS "searchVector"')
+    elif dialect == "sqlite":
+        for trigger in ("consultation_notes_search_insert", "consultation_notes_search_delete",
+                        "timeline_events_search_insert", "timeline_events_search_delete"):
+            op.execute(f"DROP TRIGGER IF EXISTS {trigger}")
+        op.execute("DROP TABLE IF EXISTS clinical_search")
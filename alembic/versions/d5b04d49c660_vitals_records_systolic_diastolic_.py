@@ -0,0 +1,71 @@
+"""Vitals records systolic diastolic columns
+
+Revision ID: d5b04d49c660
+Revises: 91f8b585db23
+Create Date: 2026-10-17 17:25:44.783164
+
+"""
+from typing import Sequence, Union
+
+import re
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd5b04d49c660'
+down_revision: Union[str, Sequence[str], None] = '91f8b585db23'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+BATCH_SIZE = 1000
+_BLOOD_PRESSURE = re.compile(r"^\s*(\d{2,3})\s*/\s*(\d{2,3})\s*$")
+
+
+def _backfill() -> None:
+    # Keyset over id in short batches; unparseable values are left NULL
+    bind = op.get_bind()
+    vitals = sa.table(
+        "vitals_records",
+        sa.column("id", sa.Uuid), sa.column("bloodPressure"), sa.column("systolic"), sa.column("diastolic")
+    )
+    update = (
+        sa.update(vitals)
+        .where(vitals.c.id == sa.bindparam("_id"))
+        .values(systolic=sa.bindparam("_systolic"), diastolic=sa.bindparam("_diastolic"))
+    )
+    last_id = None
+    while True:
+        query = sa.select(vitals.c.id, vitals.c.bloodPressure).where(vitals.c.bloodPressure.is_not(None))
+        if last_id is not None:
+            query = query.where(vitals.c.id > last_id)
+        rows = bind.execute(query.order_by(vitals.c.id).limit(BATCH_SIZE)).all()
+        if not rows:
+            return
+        params = []
+        for row in rows:
+            match = _BLOOD_PRESSURE.match(row.bloodPressure)
+            if match:
+                params.append({"_id": row.id, "_systolic": int(match.group(1)), "_diastolic": int(match.group(2))})
+        if params:
+            bind.execute(update, params)
+        last_id = rows[-1].id
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column("vitals_records", sa.Column("systolic", sa.Integer(), nullable=True))
+    op.add_column("vitals_records", sa.Column("diastolic", sa.Integer(), nullable=True))
+    _backfill()
+    op.create_index("idx_vitals_records_patientId_systolic", "vitals_records", ["patientId", "systolic"])
+    op.create_index("idx_vitals_records_patientId_diastolic", "vitals_records", ["patientId", "diastolic"])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("idx_vitals_records_patientId_diastolic", table_name="vitals_records")
+    op.drop_index("idx_vitals_records_patientId_systolic", table_name="vitals_records")
+    op.drop_column("vitals_records", "diastolic")
+    op.drop_column("vitals_records", "systolic")
@@ -0,0 +1,32 @@
+"""Expiry indexes for maintenance reaper
+
+Revision ID: da6b7a0880cc
+Revises: 5b009d61bdc8
+Create Date: 2026-10-17 17:09:54.717440
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'da6b7a0880cc'
+down_revision: Union[str, Sequence[str], None] = '5b009d61bdc8'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index("idx_sessions_expiresAt", "sessions", ["expiresAt"])
+    op.create_index("idx_verification_tokens_expiresAt", "verification_tokens", ["expiresAt"])
+    op.create_index("idx_family_relationships_status_createdAt", "family_relationships", ["status", "createdAt"])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("idx_family_relationships_status_createdAt", table_name="family_relationships")
+    op.drop_index("idx_verification_tokens_expiresAt", table_name="verification_tokens")
+    op.drop_index("idx_sessions_expiresAt", table_name="sessions")
@@ -0,0 +1,44 @@
+"""Care plan versions
+
+Revision ID: e98a44ced981
+Revises: 916476a3e340
+Create Date: 2026-10-17 17:35:58.103767
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e98a44ced981'
+down_revision: Union[str, Sequence[str], None] = '916476a3e340'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column("care_plans", sa.Column("version", sa.Integer(), server_default="1", nullable=False))
+    op.create_table(
+        "care_plan_versions",
+        sa.Column("id", sa.Uuid(), nullable=False),
+        sa.Column("planId", sa.Uuid(), nullable=False),
+        sa.Column("version", sa.Integer(), nullable=False),
+        sa.Column("isSnapshot", sa.Boolean(), nullable=False),
+        sa.Column("data", sa.JSON(), nullable=False),
+        sa.Column("authorId", sa.Uuid(), nullable=True),
+        sa.Column("createdAt", sa.DateTime(), nullable=False),
+        sa.ForeignKeyConstraint(["planId"], ["care_plans.id"], ondelete="CASCADE"),
+        sa.ForeignKeyConstraint(["authorId"], ["users.id"], ondelete="SET NULL"),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index("idx_care_plan_versions_planId_version", "care_plan_versions", ["planId", "version"], unique=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("idx_care_plan_versions_planId_version", table_name="care_plan_versions")
+    op.drop_table("care_plan_versions")
+    op.drop_column("care_plans", "version")
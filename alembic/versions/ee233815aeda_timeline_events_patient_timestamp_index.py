@@ -0,0 +1,32 @@
+"""Timeline events patient timestamp index
+
+Revision ID: ee233815aeda
+Revises: da6b7a0880cc
+Create Date: 2026-10-17 17:16:21.057587
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'ee233815aeda'
+down_revision: Union[str, Sequence[str], None] = 'da6b7a0880cc'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        "idx_timeline_events_patientId_timestamp",
+        "timeline_events",
+        ["patientId", sa.text('"timestamp" DESC'), sa.text("id DESC")]
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("idx_timeline_events_patientId_timestamp", table_name="timeline_events")
@@ -0,0 +1,243 @@
+import math
+import uuid
+import asyncio
+import logging
+from array import array
+from typing import Any, Dict, Iterable, List, NamedTuple, Optional, Set, Tuple, Union
+
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncSession
+from sqlalchemy.future import select
+
+from backend import metrics
+from backend.config import settings
+from backend.database import engine
+from backend.models import VitalsRecord, TimelineEvent, TimelineEventType
+from backend.vitals import METRICS, metric_values
+
+logger = logging.getLogger(__name__)
+
+# Streaming vitals anomaly detection. Each patient keeps an exponentially weighted
+# mean/variance per metric in one flat array of doubles; a reading is scored in O(1)
+# against the state from earlier readings. Scoring works on a copy, and readings are
+# folded into the shared state only once their insert has committed (observe).
+#
+# State lives per worker and is rebuilt from vitals_records at startup in a single
+# ordered pass. A patient this worker has no state for (say, one whose history was
+# recorded through another worker) is loaded from the database on first sight; after
+# that a worker folds in only the readings it records itself.
+
+# Hard clinical limits (low, high); either side may be None. Overridable via settings.ANOMALY_LIMITS.
+CLINICAL_LIMITS: Dict[str, Tuple[Optional[float], Optional[float]]] = {
+    "heartRate": (40, 130),
+    "temperature": (35.0, 39.0),
+    "oxygenSaturation": (90, None),
+    "systolic": (85, 180),
+    "diastolic": (None, 110),
+}
+
+# Floor for the EWMA standard deviation, so a flat history doesn't turn small changes into huge z-scores
+MIN_STDDEV = {"heartRate": 3.0, "temperature": 0.2, "oxygenSaturation": 1.0, "systolic": 5.0, "diastolic": 4.0}
+
+UNITS = {"heartRate": " bpm", "temperature": "C", "oxygenSaturation": "%", "systolic": " mmHg", "diastolic": " mmHg"}
+
+_FIELDS = 3  # mean, variance, count
+
+class Alert(NamedTuple):
+    metric: str
+    value: float
+    reason: str
+
+    def describe(self) -> str:
+        return f"{self.metric} {self.value:g}{UNITS[self.metric]} {self.reason}"
+
+class AnomalyDetector:
+    def __init__(self):
+        self._state: Dict[uuid.UUID, array] = {}
+        # (patientId, reading id, values) observed while a rebuild is running
+        self._pending: Optional[List[Tuple[uuid.UUID, Optional[uuid.UUID], Dict[str, Any]]]] = None
+        self.ready = False
+        self.alerts = metrics.counter("anomaly.alerts")
+        metrics.gauge("anomaly.patients", lambda: len(self._state))
+
+    def _limits(self, metric: str) -> Tuple[Optional[float], Optional[float]]:
+        limits = settings.ANOMALY_LIMITS.get(metric)
+        return tuple(limits) if limits else CLINICAL_LIMITS[metric]
+
+    def _patient_state(self, patient_id: uuid.UUID) -> array:
+        state = self._state.get(patient_id)
+        if state is None:
+            state = self._state[patient_id] = _empty_state()
+        return state
+
+    def fold(self, state: array, values: Dict[str, Any]):
+        alpha = settings.ANOMALY_EWMA_ALPHA
+        for i, metric in enumerate(METRICS):
+            value = values.get(metric)
+            if value is None:
+                continue
+            base = i * _FIELDS
+            mean, var, count = state[base], state[base + 1], state[base + 2]
+            if count == 0:
+                state[base], state[base + 1] = value, 0.0
+            else:
+                diff = value - mean
+                increment = alpha * diff
+                state[base] = mean + increment
+                state[base + 1] = (1 - alpha) * (var + diff * increment)
+            state[base + 2] = count + 1
+
+    def score(self, state: Optional[array], values: Dict[str, Any]) -> List[Alert]:
+        """Alerts for one reading against `state` (the patient's earlier readings), which
+        is left unchanged. Without state only the hard limits are checked."""
+        alerts = []
+        for i, metric in enumerate(METRICS):
+            value = values.get(metric)
+            if value is None:
+                continue
+            low, high = self._limits(metric)
+            if low is not None and value < low:
+                alerts.append(Alert(metric, value, f"below limit {low:g}"))
+                continue
+            if high is not None and value > high:
+                alerts.append(Alert(metric, value, f"above limit {high:g}"))
+                continue
+            if state is None:
+                continue
+            base = i * _FIELDS
+            mean, var, count = state[base], state[base + 1], state[base + 2]
+            if count < settings.ANOMALY_MIN_READINGS:
+                continue
+            std = max(math.sqrt(var), MIN_STDDEV[metric])
+            z = (value - mean) / std
+            if abs(z) >= settings.ANOMALY_Z_THRESHOLD:
+                direction = "above" if z > 0 else "below"
+                alerts.append(Alert(metric, value, f"is {abs(z):.1f} SD {direction} recent mean {mean:.1f}"))
+        self.alerts.inc(len(alerts))
+        return alerts
+
+    async def _load(self, db: Union[AsyncSession, AsyncConnection], patient_id: uuid.UUID, exclude: Iterable[uuid.UUID] = ()) -> Tuple[array, Set[uuid.UUID]]:
+        """One patient's state from vitals_records, and the ids of the readings in it."""
+        query = (
+            select(VitalsRecord.id, *(getattr(VitalsRecord, metric) for metric in METRICS))
+            .where(VitalsRecord.patientId == patient_id)
+            .order_by(VitalsRecord.recordedAt)
+        )
+        exclude = [reading_id for reading_id in exclude if reading_id is not None]
+        if exclude:
+            query = query.where(VitalsRecord.id.notin_(exclude))
+        state, ids = _empty_state(), set()
+        for row in await db.execute(query):
+            ids.add(row[0])
+            self.fold(state, dict(zip(METRICS, row[1:])))
+        return state, ids
+
+    async def state_for(self, db: AsyncSession, patient_id: uuid.UUID, exclude: Iterable[uuid.UUID] = ()) -> Optional[array]:
+        """The patient's shared state, loaded on first sight; `exclude` lists readings
+        the caller hasn't committed yet. None until the rebuild has finished."""
+        if not self.ready:
+            return None
+        state = self._state.get(patient_id)
+        if state is None:
+            loaded, _ = await self._load(db, patient_id, exclude)
+            # A concurrent request may have loaded it first; its state already counts
+            state = self._state.setdefault(patient_id, loaded)
+        return state
+
+    def observe(self, patient_id: uuid.UUID, readings: List[Tuple[Optional[uuid.UUID], Dict[str, Any]]]):
+        """Fold committed (id, values) readings into the shared state, oldest first."""
+        if self._pending is not None:
+            self._pending.extend((patient_id, reading_id, values) for reading_id, values in readings)
+            return
+        state = self._state.get(patient_id)
+        if state is None:
+            # Loaded from the database, these readings included, on first sight
+            return
+        for _, values in readings:
+            self.fold(state, values)
+
+    async def rebuild(self, batch_size: int = 5000):
+        """Replay vitals_records in (patientId, recordedAt) order into fresh state,
+        without alerting. Until it finishes only the hard limits are checked, and
+        readings committed meanwhile are buffered and applied after the history."""
+        self._pending = []
+        try:
+            rebuilt: Dict[uuid.UUID, array] = {}
+            columns = [VitalsRecord.patientId, *(getattr(VitalsRecord, metric) for metric in METRICS)]
+            async with engine.connect() as conn:
+                result = await conn.stream(
+                    select(*columns)
+                    .order_by(VitalsRecord.patientId, VitalsRecord.recordedAt)
+                    .execution_options(yield_per=batch_size)
+                )
+                async for partition in result.partitions():
+                    for row in partition:
+                        state = rebuilt.get(row[0])
+                        if state is None:
+                            state = rebuilt[row[0]] = _empty_state()
+                        self.fold(state, dict(zip(METRICS, row[1:])))
+                    await asyncio.sleep(0)
+
+                # A buffered reading may or may not be in the replayed snapshot, so reload
+                # those patients and apply only the readings their reload didn't include
+                reloaded: Dict[uuid.UUID, Set[uuid.UUID]] = {}
+                while True:
+                    missing = {patient_id for patient_id, _, _ in self._pending} - reloaded.keys()
+                    if not missing:
+                        break
+                    for patient_id in missing:
+                        rebuilt[patient_id], reloaded[patient_id] = await self._load(conn, patient_id)
+                for patient_id, reading_id, values in self._pending:
+                    if reading_id not in reloaded[patient_id]:
+                        self.fold(rebuilt[patient_id], values)
+                self._state, self._pending, self.ready = rebuilt, None, True
+        finally:
+            self._pending = None
+        logger.info("Anomaly detector rebuilt for %d patients", len(self._state))
+
+def _empty_state() -> array:
+    return array("d", [0.0] * (len(METRICS) * _FIELDS))
+
+detector = AnomalyDetector()
+
+async def alert_events(
+    db: AsyncSession,
+    patient_id: uuid.UUID,
+    author_id: uuid.UUID,
+    readings: Iterable[Dict[str, Any]]
+) -> List[TimelineEvent]:
+    """Score readings in recordedAt order; one ALERT timeline event per alerting reading.
+    The detector's state is unchanged until observe_readings runs after the commit."""
+    if not settings.ANOMALY_DETECTION_ENABLED:
+        return []
+    readings = sorted(readings, key=lambda r: r["recordedAt"])
+    state = await detector.state_for(db, patient_id, exclude=[reading.get("id") for reading in readings])
+    # Later readings in a batch are scored against the earlier ones
+    scratch = array("d", state) if state is not None else None
+    events = []
+    for reading in readings:
+        values = metric_values(reading)
+        alerts = detector.score(scratch, values)
+        if scratch is not None:
+            detector.fold(scratch, values)
+        if alerts:
+            events.append(TimelineEvent(
+                patientId=patient_id,
+                authorId=author_id,
+                eventType=TimelineEventType.ALERT,
+                description="Vitals alert: " + "; ".join(alert.describe() for alert in alerts),
+                relatedEntityId=reading.get("id")
+            ))
+    return events
+
+def observe_readings(patient_id: uuid.UUID, readings: Iterable[Dict[str, Any]]):
+    """Fold committed readings into the detector."""
+    if not settings.ANOMALY_DETECTION_ENABLED:
+        return
+    readings = sorted(readings, key=lambda r: r["recordedAt"])
+    detector.observe(patient_id, [(reading.get("id"), metric_values(reading)) for reading in readings])
+
+async def rebuild_in_background():
+    try:
+        await detector.rebuild()
+    except Exception:
+        logger.exception("Anomaly detector rebuild failed")
@@ -1,8 +1,119 @@
 import uuid
-from typing import Optional, Any
+import time
+import asyncio
+import logging
+from datetime import datetime
+from typing import Optional, Any, Dict, List
+from sqlalchemy import event, insert
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, SessionTransaction
+from backend import metrics
+from backend.config import settings
+from backend.database import engine
 from backend.models import AuditLog
 
+logger = logging.getLogger(__name__)
+
+# Always written inside the request transaction, even when buffering is enabled
+CRITICAL_AUDIT_ACTIONS = {"TOKEN_REUSE_DETECTED", "PASSWORD_CHANGED", "ACCOUNT_STATUS_CHANGED"}
+
+class AuditBuffer:
+    """Collects audit rows in memory and writes them with one multi-row INSERT when
+    AUDIT_BUFFER_MAX_SIZE rows are pending or every AUDIT_BUFFER_FLUSH_INTERVAL_SECONDS.
+
+    Rows reach the buffer only once the request transaction that logged them commits,
+    and are written in their own transaction after it.
+    A batch that fails (e.g. its user row was deleted meanwhile) is retried row by row
+    on the next flush; rows that still fail after MAX_ATTEMPTS are dropped and logged.
+    """
+
+    MAX_ATTEMPTS = 3
+
+    def __init__(self):
+        self._pending: List[Dict[str, Any]] = []
+        self._attempts: Dict[uuid.UUID, int] = {}
+        self._task: Optional[asyncio.Task] = None
+        self._flush_task: Optional[asyncio.Task] = None
+        self._flush_lock = asyncio.Lock()
+        self.flush_latency = metrics.histogram("audit_buffer.flush_seconds")
+        self.rows_written = metrics.counter("audit_buffer.rows_written")
+        self.rows_dropped = metrics.counter("audit_buffer.rows_dropped")
+        metrics.gauge("audit_buffer.depth", lambda: len(self._pending))
+
+    def add(self, rows: List[Dict[str, Any]]):
+        self._pending.extend(rows)
+        if len(self._pending) >= settings.AUDIT_BUFFER_MAX_SIZE and (self._flush_task is None or self._flush_task.done()):
+            self._flush_task = asyncio.get_running_loop().create_task(self.flush())
+            self._flush_task.add_done_callback(self._flush_done)
+
+    def _flush_done(self, task: asyncio.Task):
+        if not task.cancelled() and task.exception() is not None:
+            logger.error("Audit buffer flush failed", exc_info=task.exception())
+
+    async def flush(self):
+        async with self._flush_lock:
+            if not self._pending:
+                return
+            batch, self._pending = self._pending, []
+            start = time.perf_counter()
+            try:
+                async with engine.begin() as conn:
+                    await conn.execute(insert(AuditLog.__table__).values(batch))
+                self.rows_written.inc(len(batch))
+                for row in batch:
+                    self._attempts.pop(row["id"], None)
+            except Exception:
+                await self._write_individually(batch)
+            self.flush_latency.observe(time.perf_counter() - start)
+
+    async def _write_individually(self, batch: List[Dict[str, Any]]):
+        for row in batch:
+            try:
+                async with engine.begin() as conn:
+                    await conn.execute(insert(AuditLog.__table__).values(row))
+                self.rows_written.inc()
+                self._attempts.pop(row["id"], None)
+            except Exception:
+                attempts = self._attempts.get(row["id"], 0) + 1
+                if attempts >= self.MAX_ATTEMPTS:
+                    self._attempts.pop(row["id"], None)
+                    self.rows_dropped.inc()
+                    logger.exception("Dropping audit row %s after %d attempts", row["action"], attempts)
+                else:
+                    self._attempts[row["id"]] = attempts
+                    self._pending.append(row)
+
+    async def _run(self):
+        while True:
+            await asyncio.sleep(settings.AUDIT_BUFFER_FLUSH_INTERVAL_SECONDS)
+            await self.flush()
+
+    def start(self):
+        if self._task is None:
+            self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+        await self.flush()
+
+audit_buffer = AuditBuffer()
+
+# Buffered rows wait in session.info until the request transaction ends
+_BUFFERED_ROWS = "audit_rows"
+
+@event.listens_for(Session, "after_commit")
+def _buffer_committed_rows(session: Session):
+    rows = session.info.pop(_BUFFERED_ROWS, None)
+    if rows:
+        audit_buffer.add(rows)
+
+@event.listens_for(Session, "after_soft_rollback")
+def _discard_rolled_back_rows(session: Session, previous_transaction: SessionTransaction):
+    if previous_transaction.parent is None:
+        session.info.pop(_BUFFERED_ROWS, None)
+
 async def log_audit(
     db: AsyncSession,
     user_id: Optional[uuid.UUID],
@@ -11,6 +122,18 @@ async def log_audit(
     user_agent: Optional[str] = None,
     metadata: Optional[Any] = None
 ):
+    if settings.AUDIT_BUFFER_ENABLED and action not in CRITICAL_AUDIT_ACTIONS:
+        db.info.setdefault(_BUFFERED_ROWS, []).append({
+            "id": uuid.uuid4(),
+            "userId": user_id,
+            "action": action,
+            "ipAddress": ip_address,
+            "userAgent": user_agent,
+            "metadata": metadata,
+            "createdAt": datetime.utcnow()
+        })
+        return
+
     log = AuditLog(
         userId=user_id,
         action=action,
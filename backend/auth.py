@@ -1,5 +1,9 @@
 import uuid
 import hmac
+import time
+import asyncio
+import hashlib
+from concurrent.futures import Executor, ThreadPoolExecutor, ProcessPoolExecutor
 from datetime import datetime, timedelta
 from typing import Optional, List
 import jwt
@@ -7,17 +11,95 @@ from fastapi import Request, HTTPException, Depends, Response
 from passlib.context import CryptContext
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
+from sqlalchemy.orm import make_transient_to_detached
+from backend import metrics
+from backend.cache import TTLCache
 from backend.config import settings
-from backend.database import get_db
+from backend.database import get_db, read_session
 from backend.models import User, Role
 
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 
-def hash_password(password: str) -> str:
+# bcrypt is CPU-bound and would block the event loop, so all pwd_context work runs on
+# a bounded executor. Once every worker is busy and PASSWORD_HASH_MAX_QUEUE calls are
+# already waiting, further calls fail fast with 503 instead of piling up.
+_hash_executor: Optional[Executor] = None
+_hash_in_flight = 0
+
+hash_pool_wait = metrics.histogram("password_hash.pool_wait_seconds")
+hash_pool_rejected = metrics.counter("password_hash.rejected")
+metrics.gauge("password_hash.in_flight", lambda: _hash_in_flight)
+
+def _get_hash_executor() -> Executor:
+    global _hash_executor
+    if _hash_executor is None:
+        if settings.PASSWORD_HASH_EXECUTOR == "process":
+            _hash_executor = ProcessPoolExecutor(max_workers=settings.PASSWORD_HASH_WORKERS)
+        else:
+            _hash_executor = ThreadPoolExecutor(max_workers=settings.PASSWORD_HASH_WORKERS, thread_name_prefix="password-hash")
+    return _hash_executor
+
+def shutdown_hash_executor():
+    global _hash_executor
+    if _hash_executor is not None:
+        _hash_executor.shutdown(wait=False, cancel_futures=True)
+        _hash_executor = None
+
+def _timed_call(submitted_at: float, fn, *args):
+    # Runs in the worker; wall-clock time so it is comparable across processes
+    return time.time() - submitted_at, fn(*args)
+
+def _bcrypt_hash(password: str) -> str:
     return pwd_context.hash(password)
 
-def verify_password(password: str, hashed: str) -> bool:
-    return pwd_context.verify(password, hashed)
+def _bcrypt_verify(password: str, hashed: str) -> bool:
+    try:
+        return pwd_context.verify(password, hashed)
+    except ValueError:
+        return False
+
+async def _run_in_hash_pool(fn, *args):
+    global _hash_in_flight
+    if _hash_in_flight >= settings.PASSWORD_HASH_WORKERS + settings.PASSWORD_HASH_MAX_QUEUE:
+        hash_pool_rejected.inc()
+        raise HTTPException(status_code=503, detail="SERVICE_UNAVAILABLE")
+    _hash_in_flight += 1
+    try:
+        loop = asyncio.get_running_loop()
+        waited, result = await loop.run_in_executor(_get_hash_executor(), _timed_call, time.time(), fn, *args)
+        hash_pool_wait.observe(max(waited, 0.0))
+        return result
+    finally:
+        _hash_in_flight -= 1
+
+async def hash_password(password: str) -> str:
+    return await _run_in_hash_pool(_bcrypt_hash, password)
+
+async def verify_password(password: str, hashed: str) -> bool:
+    return await _run_in_hash_pool(_bcrypt_verify, password, hashed)
+
+# Refresh tokens are 512-bit random values, so a keyed SHA-256 digest is as strong
+# as bcrypt here and verifies in microseconds. Sessions created before the switch
+# still carry a bcrypt hash and are accepted until they rotate out.
+TOKEN_DIGEST_PREFIX = "hmac-sha256$"
+
+def _keyed_digest(secret: str, raw_token: str) -> str:
+    digest = hmac.new(secret.encode(), raw_token.encode(), hashlib.sha256).hexdigest()
+    return f"{TOKEN_DIGEST_PREFIX}{digest}"
+
+def hash_refresh_token(raw_token: str) -> str:
+    return _keyed_digest(settings.JWT_REFRESH_SECRET, raw_token)
+
+async def verify_refresh_token(raw_token: str, stored_hash: str) -> bool:
+    if stored_hash.startswith(TOKEN_DIGEST_PREFIX):
+        return hmac.compare_digest(hash_refresh_token(raw_token), stored_hash)
+    # Legacy bcrypt-hashed session
+    return await verify_password(raw_token, stored_hash)
+
+# Email-verification and password-reset tokens use the same deterministic digest so
+# they can be found with one indexed lookup on tokenHash instead of a bcrypt loop.
+def hash_verification_token(raw_token: str) -> str:
+    return _keyed_digest(settings.JWT_SECRET, raw_token)
 
 def create_access_token(user_id: str, role: Role, email: str) -> str:
     expire = datetime.utcnow() + timedelta(minutes=15)
@@ -95,6 +177,14 @@ async def verify_csrf(request: Request):
         if not cookie_csrf or not header_csrf or not hmac.compare_digest(cookie_csrf, header_csrf):
             raise HTTPException(status_code=403, detail="CSRF token validation failed")
 
+# Column snapshot of recently authenticated users, so get_current_user can skip the
+# per-request users SELECT. Call invalidate_principal() after committing any change
+# to a user row; the TTL bounds staleness across worker processes.
+principal_cache = TTLCache("principal_cache", settings.PRINCIPAL_CACHE_MAX_ENTRIES, settings.PRINCIPAL_CACHE_TTL_SECONDS)
+
+def invalidate_principal(user_id: uuid.UUID):
+    principal_cache.invalidate(user_id)
+
 async def get_current_user(request: Request, db: AsyncSession = Depends(get_db)) -> User:
     access_token = request.cookies.get("access_token")
     if not access_token:
@@ -108,10 +198,21 @@ async def get_current_user(request: Request, db: AsyncSession = Depends(get_db))
         raise HTTPException(status_code=401, detail="UNAUTHORIZED")
         
     uid = uuid.UUID(user_id)
-    result = await db.execute(select(User).where(User.id == uid))
-    user = result.scalars().first()
-    if not user:
-        raise HTTPException(status_code=401, detail="UNAUTHORIZED")
+    snapshot = principal_cache.get(uid)
+    if snapshot is None:
+        # Loaded on its own short-lived session, whose connection is back in the pool
+        # before the handler runs; `db` stays unconnected unless the handler uses it
+        async with read_session() as lookup:
+            result = await lookup.execute(select(User).where(User.id == uid))
+            found = result.scalars().first()
+            if not found:
+                raise HTTPException(status_code=401, detail="UNAUTHORIZED")
+            snapshot = {attr.key: getattr(found, attr.key) for attr in User.__mapper__.column_attrs}
+        principal_cache.set(uid, snapshot)
+    # Re-attach without a SELECT; handlers can still mutate and commit it
+    cached = User(**snapshot)
+    make_transient_to_detached(cached)
+    user = await db.merge(cached, load=False)
         
     if user.accountStatus in ["DELETED", "SUSPENDED"]:
         raise HTTPException(status_code=403, detail="AUTH_ACCOUNT_LOCKED")
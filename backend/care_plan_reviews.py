@@ -0,0 +1,117 @@
+import heapq
+import uuid
+import asyncio
+import logging
+from datetime import date, datetime
+from typing import Dict, List, Optional, Tuple
+
+from sqlalchemy import update
+from sqlalchemy.future import select
+
+from backend import metrics
+from backend.config import settings
+from backend.database import AsyncSessionLocal, read_session
+from backend.models import CarePlan, CarePlanStatus, TimelineEvent, TimelineEventType
+from backend.timeline_feed import publish_timeline_event
+from backend.patient_summary import invalidate_patient_summary
+
+logger = logging.getLogger(__name__)
+
+# Care-plan review scheduling. Each worker keeps a min-heap of (reviewDate, planId,
+# patientId) for open plans not yet notified, rebuilt from the (status, reviewDate)
+# index at startup and pushed to when plans are written. Entries are never removed
+# in place: a plan's current date lives in _scheduled, and popped entries that no
+# longer match it are skipped. The conditional UPDATE on reviewNotifiedAt makes sure
+# only one worker emits the FOLLOW_UP event for a given plan.
+
+OPEN_STATUSES = (CarePlanStatus.DRAFT, CarePlanStatus.ACTIVE, CarePlanStatus.UNDER_REVIEW)
+
+class ReviewScheduler:
+    def __init__(self):
+        self._heap: List[Tuple[date, uuid.UUID, uuid.UUID]] = []
+        self._scheduled: Dict[uuid.UUID, date] = {}
+        self.emitted = metrics.counter("care_plan_reviews.emitted")
+        metrics.gauge("care_plan_reviews.scheduled", lambda: len(self._scheduled))
+
+    def schedule(self, plan: CarePlan):
+        if plan.reviewDate is None or plan.status not in OPEN_STATUSES or plan.reviewNotifiedAt is not None:
+            self._scheduled.pop(plan.id, None)
+            return
+        self._scheduled[plan.id] = plan.reviewDate
+        heapq.heappush(self._heap, (plan.reviewDate, plan.id, plan.patientId))
+
+    def pop_due(self, today: date) -> List[Tuple[date, uuid.UUID, uuid.UUID]]:
+        due = []
+        while self._heap and self._heap[0][0] <= today:
+            review_date, plan_id, patient_id = heapq.heappop(self._heap)
+            if self._scheduled.get(plan_id) == review_date:
+                del self._scheduled[plan_id]
+                due.append((review_date, plan_id, patient_id))
+        return due
+
+    async def rebuild(self):
+        async with read_session() as db:
+            result = await db.execute(
+                select(CarePlan.reviewDate, CarePlan.id, CarePlan.patientId)
+                .where(
+                    CarePlan.status.in_(OPEN_STATUSES),
+                    CarePlan.reviewDate.is_not(None),
+                    CarePlan.reviewNotifiedAt.is_(None)
+                )
+            )
+            entries = [tuple(row) for row in result]
+        # Merged rather than replaced: plans scheduled while the SELECT ran are already
+        # in the heap, and their date there is at least as recent as the row read here
+        for review_date, plan_id, patient_id in entries:
+            if plan_id not in self._scheduled:
+                self._scheduled[plan_id] = review_date
+                self._heap.append((review_date, plan_id, patient_id))
+        heapq.heapify(self._heap)
+
+    async def emit_due(self, today: Optional[date] = None) -> int:
+        emitted = 0
+        for review_date, plan_id, patient_id in self.pop_due(today or datetime.utcnow().date()):
+            async with AsyncSessionLocal() as db:
+                claimed = await db.execute(
+                    update(CarePlan)
+                    .where(
+                        CarePlan.id == plan_id,
+                        CarePlan.reviewDate == review_date,
+                        CarePlan.reviewNotifiedAt.is_(None),
+                        CarePlan.status.in_(OPEN_STATUSES)
+                    )
+                    .values(reviewNotifiedAt=datetime.utcnow())
+                )
+                if claimed.rowcount == 0:
+                    # Another worker got there first, or the plan changed since it was scheduled
+                    await db.rollback()
+                    continue
+                event = TimelineEvent(
+                    patientId=patient_id,
+                    eventType=TimelineEventType.FOLLOW_UP,
+                    description=f"Care plan review due {review_date.isoformat()}",
+                    relatedEntityId=plan_id
+                )
+                db.add(event)
+                await db.commit()
+            invalidate_patient_summary(patient_id)
+            await publish_timeline_event(event)
+            emitted += 1
+        self.emitted.inc(emitted)
+        return emitted
+
+review_scheduler = ReviewScheduler()
+
+async def run_periodically():
+    try:
+        await review_scheduler.rebuild()
+    except Exception:
+        logger.exception("Care plan review scheduler rebuild failed")
+    while True:
+        try:
+            emitted = await review_scheduler.emit_due()
+            if emitted:
+                logger.info("Emitted %d care plan review reminders", emitted)
+        except Exception:
+            logger.exception("Care plan review run failed")
+        await asyncio.sleep(settings.CARE_PLAN_REVIEW_INTERVAL_SECONDS)
@@ -0,0 +1,152 @@
+import re
+import uuid
+from typing import Any, Dict, List, Optional, Sequence
+from sqlalchemy import func
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.future import select
+
+from backend.config import settings
+from backend.models import CarePlan, CarePlanVersion
+
+# Care-plan history as forward deltas. Each version row holds either a full snapshot
+# of the versioned fields or a JSON diff against the previous version; every
+# CARE_PLAN_SNAPSHOT_INTERVAL-th version is a snapshot, so rebuilding any version
+# reads at most that many rows. Lists (goals) and text (notes, split into words and
+# whitespace) are diffed as sequences, storing only the replaced ranges.
+#
+# Diffs use Myers' O(ND) algorithm, so cost follows the size of the edit rather than
+# the note; past MAX_DIFF_EDITS the whole value is stored instead.
+
+VERSIONED_FIELDS = ("status", "reviewDate", "goals", "notes")
+SEQUENCE_FIELDS = ("goals", "notes")
+MAX_DIFF_EDITS = 500
+
+_WORDS = re.compile(r"(\s+)")
+
+def plan_state(plan: CarePlan) -> Dict[str, Any]:
+    return {
+        "status": plan.status.value if plan.status is not None else None,
+        "reviewDate": plan.reviewDate.isoformat() if plan.reviewDate is not None else None,
+        "goals": list(plan.goals) if plan.goals is not None else None,
+        "notes": plan.notes,
+    }
+
+def _tokens(field: str, value: Any) -> List[Any]:
+    return _WORDS.split(value) if field == "notes" else value
+
+def _join(field: str, tokens: List[Any]) -> Any:
+    return "".join(tokens) if field == "notes" else tokens
+
+def sequence_ops(a: Sequence[Any], b: Sequence[Any], max_edits: int = MAX_DIFF_EDITS) -> Optional[List[list]]:
+    """[start, end, replacement] ops turning a into b, or None if that takes more
+    than max_edits single-item insertions/deletions."""
+    prefix = 0
+    while prefix < len(a) and prefix < len(b) and a[prefix] == b[prefix]:
+        prefix += 1
+    suffix = 0
+    while suffix < len(a) - prefix and suffix < len(b) - prefix and a[-1 - suffix] == b[-1 - suffix]:
+        suffix += 1
+    a, b = a[prefix:len(a) - suffix], b[prefix:len(b) - suffix]
+    n, m = len(a), len(b)
+
+    # Furthest-reaching x per diagonal k = x - y, one copy kept per edit count for backtracking
+    v = {1: 0}
+    trace = []
+    for d in range(min(max_edits, n + m) + 1):
+        trace.append(dict(v))
+        for k in range(-d, d + 1, 2):
+            x = v[k + 1] if k == -d or (k != d and v[k - 1] < v[k + 1]) else v[k - 1] + 1
+            y = x - k
+            while x < n and y < m and a[x] == b[y]:
+                x += 1
+                y += 1
+            v[k] = x
+            if x >= n and y >= m:
+                return _ops_from_trace(trace, b, n, m, prefix)
+    return None
+
+def _ops_from_trace(trace: List[Dict[int, int]], b: Sequence[Any], x: int, y: int, offset: int) -> List[list]:
+    edits = []
+    for d in range(len(trace) - 1, 0, -1):
+        v, k = trace[d], x - y
+        prev_k = k + 1 if k == -d or (k != d and v[k - 1] < v[k + 1]) else k - 1
+        prev_x = v[prev_k]
+        prev_y = prev_x - prev_k
+        # Coming from diagonal k + 1 means b[prev_y] was inserted, from k - 1 that a[prev_x] was deleted
+        edits.append((prev_x, prev_k == k + 1, b[prev_y] if prev_k == k + 1 else None))
+        x, y = prev_x, prev_y
+    ops: List[list] = []
+    for position, inserted, item in reversed(edits):
+        position += offset
+        if not ops or ops[-1][1] != position:
+            ops.append([position, position, []])
+        if inserted:
+            ops[-1][2].append(item)
+        else:
+            ops[-1][1] += 1
+    return ops
+
+def diff_states(old: Dict[str, Any], new: Dict[str, Any]) -> Dict[str, Any]:
+    diff = {}
+    for field in VERSIONED_FIELDS:
+        if old[field] == new[field]:
+            continue
+        ops = None
+        if field in SEQUENCE_FIELDS and old[field] is not None and new[field] is not None:
+            ops = sequence_ops(_tokens(field, old[field]), _tokens(field, new[field]))
+        diff[field] = {"ops": ops} if ops is not None else {"value": new[field]}
+    return diff
+
+def apply_diff(state: Dict[str, Any], diff: Dict[str, Any]) -> Dict[str, Any]:
+    state = dict(state)
+    for field, change in diff.items():
+        if "value" in change:
+            state[field] = change["value"]
+            continue
+        tokens = list(_tokens(field, state[field]))
+        # Ops index into the old sequence; applying from the end keeps earlier offsets valid
+        for i1, i2, replacement in reversed(change["ops"]):
+            tokens[i1:i2] = replacement
+        state[field] = _join(field, tokens)
+    return state
+
+def is_snapshot_version(version: int) -> bool:
+    return (version - 1) % settings.CARE_PLAN_SNAPSHOT_INTERVAL == 0
+
+def new_version(
+    plan_id: uuid.UUID,
+    version: int,
+    author_id: Optional[uuid.UUID],
+    state: Dict[str, Any],
+    previous: Optional[Dict[str, Any]] = None
+) -> CarePlanVersion:
+    snapshot = previous is None or is_snapshot_version(version)
+    return CarePlanVersion(
+        planId=plan_id,
+        version=version,
+        isSnapshot=snapshot,
+        data=state if snapshot else diff_states(previous, state),
+        authorId=author_id
+    )
+
+async def load_version(db: AsyncSession, plan: CarePlan, version: int) -> Optional[Dict[str, Any]]:
+    if version == plan.version:
+        return plan_state(plan)
+    base = (await db.execute(
+        select(func.max(CarePlanVersion.version))
+        .where(CarePlanVersion.planId == plan.id, CarePlanVersion.isSnapshot.is_(True), CarePlanVersion.version <= version)
+    )).scalar()
+    if base is None:
+        return None
+    result = await db.execute(
+        select(CarePlanVersion)
+        .where(CarePlanVersion.planId == plan.id, CarePlanVersion.version >= base, CarePlanVersion.version <= version)
+        .order_by(CarePlanVersion.version)
+    )
+    rows = result.scalars().all()
+    if not rows or rows[-1].version != version:
+        return None
+    state = rows[0].data
+    for row in rows[1:]:
+        state = apply_diff(state, row.data)
+    return state
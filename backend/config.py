@@ -1,11 +1,53 @@
+from typing import Dict, List, Optional
 from pydantic_settings import BaseSettings
 
 class Settings(BaseSettings):
     DATABASE_URL: str = "sqlite:///ashwasa.db"
+    DB_POOL_SIZE: int = 5
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_TIMEOUT: float = 30.0
+    DB_POOL_RECYCLE: int = 1800  # seconds; -1 disables
+    DB_POOL_PRE_PING: bool = False
+    DB_STATEMENT_CACHE_SIZE: int = 100  # asyncpg only; 0 when behind pgbouncer
     JWT_SECRET: str = "fallback-secret-do-not-use"
+    JWT_REFRESH_SECRET: str = "fallback-refresh-secret-do-not-use"
     APP_URL: str = "http://localhost:4000"
     PORT: int = 4001
     NODE_ENV: str = "development"
+    PASSWORD_HASH_EXECUTOR: str = "thread"  # "thread" or "process"
+    PASSWORD_HASH_WORKERS: int = 4
+    PASSWORD_HASH_MAX_QUEUE: int = 32
+    PRINCIPAL_CACHE_TTL_SECONDS: float = 30.0
+    PRINCIPAL_CACHE_MAX_ENTRIES: int = 10000
+    MAINTENANCE_INTERVAL_SECONDS: int = 3600  # 0 disables the in-process reaper
+    MAINTENANCE_BATCH_SIZE: int = 500
+    EXPIRED_TOKEN_RETENTION_HOURS: int = 24
+    PENDING_INVITE_RETENTION_DAYS: int = 7
+    RATE_LIMIT_ENABLED: bool = True
+    RATE_LIMIT_BACKEND: str = "memory"  # "memory" or "sqlite" (shared by workers on one host)
+    RATE_LIMIT_SQLITE_PATH: str = "ratelimit.db"
+    RATE_LIMITS: Dict[str, int] = {}  # per-route overrides, e.g. {"auth.login": 10}
+    AUDIT_BUFFER_ENABLED: bool = False
+    AUDIT_BUFFER_MAX_SIZE: int = 100
+    AUDIT_BUFFER_FLUSH_INTERVAL_SECONDS: float = 1.0
+    PUBSUB_BACKEND: str = "memory"  # "memory" or "sqlite" (shared by workers on one host)
+    PUBSUB_SQLITE_PATH: str = "pubsub.db"
+    PUBSUB_POLL_INTERVAL_SECONDS: float = 0.25
+    PUBSUB_QUEUE_SIZE: int = 100
+    TIMELINE_STREAM_HEARTBEAT_SECONDS: float = 15.0
+    TIMELINE_STREAM_RESUME_LIMIT: int = 500
+    VITALS_BULK_MAX_READINGS: int = 1000
+    ANOMALY_DETECTION_ENABLED: bool = True
+    ANOMALY_EWMA_ALPHA: float = 0.1
+    ANOMALY_Z_THRESHOLD: float = 3.5
+    ANOMALY_MIN_READINGS: int = 10  # z-scores only once a patient has this much history
+    ANOMALY_LIMITS: Dict[str, List[Optional[float]]] = {}  # metric -> [low, high]
+    PATIENT_SUMMARY_CACHE_TTL_SECONDS: float = 60.0  # 0 disables the cache
+    PATIENT_SUMMARY_CACHE_MAX_ENTRIES: int = 5000
+    CARE_PLAN_REVIEW_INTERVAL_SECONDS: float = 300  # 0 disables the review scheduler
+    CARE_PLAN_SNAPSHOT_INTERVAL: int = 10  # full snapshot every N versions, diffs in between
+    GEO_ZIP_DATASET_PATH: Optional[str] = None  # zip,latitude,longitude CSV(.gz); None uses the bundled US data
+    GEO_MAX_RADIUS_KM: float = 150
 
     class Config:
         env_file = ".env"
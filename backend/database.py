@@ -1,6 +1,11 @@
+import time
+from contextlib import asynccontextmanager
+from sqlalchemy import exc
 from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker, AsyncSession
 from sqlalchemy.orm import declarative_base
+from sqlalchemy.pool import AsyncAdaptedQueuePool
 from urllib.parse import urlparse, urlunparse, parse_qsl, urlencode
+from backend import metrics
 from backend.config import settings
 
 database_url = settings.DATABASE_URL
@@ -15,8 +20,48 @@ if database_url.startswith("postgresql://"):
 elif database_url.startswith("sqlite://"):
     database_url = database_url.replace("sqlite://", "sqlite+aiosqlite://", 1)
 
-engine = create_async_engine(database_url, future=True, echo=False)
+pool_acquire_wait = metrics.histogram("db_pool.acquire_wait_seconds")
+pool_timeouts = metrics.counter("db_pool.timeouts")
+
+class InstrumentedQueuePool(AsyncAdaptedQueuePool):
+    """Queue pool that records how long each checkout waits for a connection."""
+
+    def connect(self):
+        start = time.perf_counter()
+        try:
+            return super().connect()
+        except exc.TimeoutError:
+            pool_timeouts.inc()
+            raise
+        finally:
+            pool_acquire_wait.observe(time.perf_counter() - start)
+
+engine_options = {}
+if ":memory:" not in database_url:
+    engine_options.update(
+        poolclass=InstrumentedQueuePool,
+        pool_size=settings.DB_POOL_SIZE,
+        max_overflow=settings.DB_MAX_OVERFLOW,
+        pool_timeout=settings.DB_POOL_TIMEOUT,
+        pool_recycle=settings.DB_POOL_RECYCLE,
+        pool_pre_ping=settings.DB_POOL_PRE_PING
+    )
+if database_url.startswith("postgresql+asyncpg://"):
+    engine_options["connect_args"] = {
+        "prepared_statement_cache_size": settings.DB_STATEMENT_CACHE_SIZE,
+        "statement_cache_size": settings.DB_STATEMENT_CACHE_SIZE
+    }
+
+engine = create_async_engine(database_url, future=True, echo=False, **engine_options)
+
+if isinstance(engine.pool, InstrumentedQueuePool):
+    metrics.gauge("db_pool.size", engine.pool.size)
+    metrics.gauge("db_pool.checked_out", engine.pool.checkedout)
+    metrics.gauge("db_pool.idle", engine.pool.checkedin)
+    metrics.gauge("db_pool.overflow", lambda: max(engine.pool.overflow(), 0))
 AsyncSessionLocal = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+# Read-only sessions never flush or commit, so skip autoflush and expiry bookkeeping
+ReadOnlySessionLocal = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False, autoflush=False)
 
 Base = declarative_base()
 
@@ -30,3 +75,16 @@ async def get_db():
             raise
         finally:
             await session.close()
+
+@asynccontextmanager
+async def read_session():
+    """Session for pure reads: no COMMIT round-trip, and on Postgres the transaction
+    starts as READ ONLY (reset when the connection returns to the pool)."""
+    async with ReadOnlySessionLocal() as session:
+        if engine.dialect.name == "postgresql":
+            await session.connection(execution_options={"postgresql_readonly": True})
+        yield session
+
+async def get_read_db():
+    async with read_session() as session:
+        yield session
@@ -0,0 +1,82 @@
+import os
+import csv
+import gzip
+import math
+from typing import Dict, List, Optional, Tuple
+
+from backend.config import settings
+
+# Coarse location from zip codes. Each zip maps to its centroid from an offline
+# dataset (backend/data, loaded once on first use), and located rows carry the id
+# of the grid cell they fall in: GRID_CELL_DEGREES squares numbered row-major from
+# (-90, -180). A "within N km" lookup turns into an indexed IN over the few cells
+# covering the circle's bounding box, followed by an exact distance check.
+#
+# Rows also store their position as a unit vector. The squared chord between two
+# unit vectors is monotonic in great-circle distance, so SQL can filter and order
+# by exact distance with plain arithmetic on any backend.
+
+BUNDLED_DATASET = os.path.join(os.path.dirname(__file__), "data", "us_zip_coordinates.csv.gz")
+EARTH_RADIUS_KM = 6371.0
+KM_PER_DEGREE = math.pi * EARTH_RADIUS_KM / 180
+GRID_CELL_DEGREES = 0.25
+GRID_ROWS = int(180 / GRID_CELL_DEGREES)
+GRID_COLUMNS = int(360 / GRID_CELL_DEGREES)
+
+_zip_locations: Optional[Dict[str, Tuple[float, float]]] = None
+
+def load_zip_locations(path: str) -> Dict[str, Tuple[float, float]]:
+    opener = gzip.open if path.endswith(".gz") else open
+    with opener(path, "rt", newline="") as f:
+        return {row["zip"]: (float(row["latitude"]), float(row["longitude"])) for row in csv.DictReader(f)}
+
+def zip_location(zip_code: Optional[str]) -> Optional[Tuple[float, float]]:
+    global _zip_locations
+    if not zip_code:
+        return None
+    if _zip_locations is None:
+        _zip_locations = load_zip_locations(settings.GEO_ZIP_DATASET_PATH or BUNDLED_DATASET)
+    # ZIP+4 and stray whitespace resolve to the five-digit zip
+    return _zip_locations.get(zip_code.strip().split("-")[0])
+
+def grid_cell(latitude: float, longitude: float) -> int:
+    row = min(int((latitude + 90) / GRID_CELL_DEGREES), GRID_ROWS - 1)
+    column = int((longitude + 180) / GRID_CELL_DEGREES) % GRID_COLUMNS
+    return row * GRID_COLUMNS + column
+
+def cells_within(latitude: float, longitude: float, radius_km: float) -> List[int]:
+    """Ids of every grid cell intersecting the bounding box of the circle."""
+    lat_span = radius_km / KM_PER_DEGREE
+    low_row = max(int((latitude - lat_span + 90) / GRID_CELL_DEGREES), 0)
+    high_row = min(int((latitude + lat_span + 90) / GRID_CELL_DEGREES), GRID_ROWS - 1)
+    # Longitude degrees shrink towards the poles; size the box for the widest row it spans
+    widest = max(abs(latitude) + lat_span, 0.0)
+    lon_span = 180.0 if widest >= 89 else min(lat_span / math.cos(math.radians(widest)), 180.0)
+    low_column = int((longitude - lon_span + 180) // GRID_CELL_DEGREES)
+    high_column = int((longitude + lon_span + 180) // GRID_CELL_DEGREES)
+    columns = {c % GRID_COLUMNS for c in range(low_column, min(high_column, low_column + GRID_COLUMNS - 1) + 1)}
+    return [row * GRID_COLUMNS + column for row in range(low_row, high_row + 1) for column in sorted(columns)]
+
+def haversine_km(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
+    phi1, phi2 = math.radians(lat1), math.radians(lat2)
+    a = math.sin((phi2 - phi1) / 2) ** 2 + math.cos(phi1) * math.cos(phi2) * math.sin(math.radians(lon2 - lon1) / 2) ** 2
+    return 2 * EARTH_RADIUS_KM * math.asin(math.sqrt(min(a, 1.0)))
+
+def unit_vector(latitude: float, longitude: float) -> Tuple[float, float, float]:
+    phi, lam = math.radians(latitude), math.radians(longitude)
+    return math.cos(phi) * math.cos(lam), math.cos(phi) * math.sin(lam), math.sin(phi)
+
+def chord_squared(radius_km: float) -> float:
+    """Squared chord between unit vectors radius_km apart on the surface."""
+    return (2 * math.sin(min(radius_km / EARTH_RADIUS_KM, math.pi) / 2)) ** 2
+
+def chord_to_km(chord_sq: float) -> float:
+    return 2 * EARTH_RADIUS_KM * math.asin(min(math.sqrt(max(chord_sq, 0.0)) / 2, 1.0))
+
+def location_columns(zip_code: Optional[str]) -> Dict[str, Optional[float]]:
+    """geoX/geoY/geoZ/geoCell values for a row located at zip_code (all None if unknown)."""
+    location = zip_location(zip_code)
+    if location is None:
+        return {"geoX": None, "geoY": None, "geoZ": None, "geoCell": None}
+    x, y, z = unit_vector(*location)
+    return {"geoX": x, "geoY": y, "geoZ": z, "geoCell": grid_cell(*location)}
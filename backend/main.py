@@ -1,12 +1,18 @@
 import os
+import asyncio
 from fastapi import FastAPI, Depends, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
 from fastapi.responses import FileResponse
 from backend.config import settings
 from backend.database import engine, Base
-from backend.auth import verify_csrf
-from backend.routers import auth, users, doctors, patients, volunteers, family, caregivers, timeline, care_plans, clinical, services, directory, admin
+from backend.auth import verify_csrf, shutdown_hash_executor
+from backend.maintenance import run_periodically as run_maintenance
+from backend.audit import audit_buffer
+from backend import pubsub
+from backend.anomaly import rebuild_in_background as rebuild_anomaly_detector
+from backend.care_plan_reviews import run_periodically as run_care_plan_reviews
+from backend.routers import auth, users, doctors, patients, volunteers, family, caregivers, timeline, care_plans, clinical, patient_summary, clinical_search, services, directory, admin, internal
 
 app = FastAPI(
     title="Ashwasa Healthcare API",
@@ -19,6 +25,30 @@ app = FastAPI(
 async def on_startup():
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
+    app.state.maintenance_task = None
+    if settings.MAINTENANCE_INTERVAL_SECONDS > 0:
+        app.state.maintenance_task = asyncio.create_task(run_maintenance())
+    if settings.AUDIT_BUFFER_ENABLED:
+        audit_buffer.start()
+    await pubsub.backend.start()
+    app.state.anomaly_rebuild_task = None
+    if settings.ANOMALY_DETECTION_ENABLED:
+        app.state.anomaly_rebuild_task = asyncio.create_task(rebuild_anomaly_detector())
+    app.state.care_plan_review_task = None
+    if settings.CARE_PLAN_REVIEW_INTERVAL_SECONDS > 0:
+        app.state.care_plan_review_task = asyncio.create_task(run_care_plan_reviews())
+
+@app.on_event("shutdown")
+async def on_shutdown():
+    if app.state.maintenance_task:
+        app.state.maintenance_task.cancel()
+    if app.state.anomaly_rebuild_task:
+        app.state.anomaly_rebuild_task.cancel()
+    if app.state.care_plan_review_task:
+        app.state.care_plan_review_task.cancel()
+    await pubsub.backend.stop()
+    await audit_buffer.stop()
+    shutdown_hash_executor()
 
 # CORS
 origins = [
@@ -46,9 +76,12 @@ app.include_router(caregivers.router)
 app.include_router(timeline.router)
 app.include_router(care_plans.router)
 app.include_router(clinical.router)
+app.include_router(patient_summary.router)
+app.include_router(clinical_search.router)
 app.include_router(services.router)
 app.include_router(directory.router)
 app.include_router(admin.router)
+app.include_router(internal.router)
 
 # Mount static folder
 static_dir = os.path.join(os.path.dirname(os.path.dirname(__file__)), "frontend", "static")
@@ -0,0 +1,79 @@
+import asyncio
+import argparse
+import logging
+from datetime import datetime, timedelta
+from typing import Dict, Optional
+
+from sqlalchemy import delete, select
+
+from backend import metrics
+from backend.config import settings
+from backend.database import engine
+from backend.models import Session, VerificationToken, FamilyRelationship, FamilyRelationshipStatus
+
+logger = logging.getLogger(__name__)
+
+async def _purge_in_batches(model, *criteria, batch_size: int) -> int:
+    # Each batch is its own short transaction so SQLite/Postgres never hold a
+    # long write lock; DELETE ... WHERE id IN (SELECT id ... LIMIT n) works on both.
+    total = 0
+    while True:
+        batch = select(model.id).where(*criteria).limit(batch_size).scalar_subquery()
+        async with engine.begin() as conn:
+            result = await conn.execute(delete(model).where(model.id.in_(batch)))
+        total += result.rowcount
+        if result.rowcount < batch_size:
+            return total
+        await asyncio.sleep(0)
+
+async def purge_expired(batch_size: Optional[int] = None, now: Optional[datetime] = None) -> Dict[str, int]:
+    batch_size = batch_size or settings.MAINTENANCE_BATCH_SIZE
+    now = now or datetime.utcnow()
+    token_cutoff = now - timedelta(hours=settings.EXPIRED_TOKEN_RETENTION_HOURS)
+    invite_cutoff = now - timedelta(days=settings.PENDING_INVITE_RETENTION_DAYS)
+
+    report = {
+        "sessions": await _purge_in_batches(
+            Session, Session.expiresAt < token_cutoff, batch_size=batch_size
+        ),
+        "verification_tokens": await _purge_in_batches(
+            VerificationToken, VerificationToken.expiresAt < token_cutoff, batch_size=batch_size
+        ),
+        "family_invites": await _purge_in_batches(
+            FamilyRelationship,
+            FamilyRelationship.status == FamilyRelationshipStatus.PENDING,
+            FamilyRelationship.createdAt < invite_cutoff,
+            batch_size=batch_size
+        ),
+    }
+    for table, removed in report.items():
+        metrics.counter(f"maintenance.{table}_removed").inc(removed)
+    metrics.counter("maintenance.runs").inc()
+    return report
+
+async def run_periodically():
+    while True:
+        await asyncio.sleep(settings.MAINTENANCE_INTERVAL_SECONDS)
+        try:
+            report = await purge_expired()
+            logger.info("Maintenance purge removed %s", report)
+        except Exception:
+            logger.exception("Maintenance purge failed")
+
+def main():
+    parser = argparse.ArgumentParser(description="Purge expired sessions, verification tokens and stale family invites.")
+    parser.add_argument("--batch-size", type=int, default=settings.MAINTENANCE_BATCH_SIZE)
+    args = parser.parse_args()
+
+    async def run():
+        try:
+            return await purge_expired(batch_size=args.batch_size)
+        finally:
+            await engine.dispose()
+
+    report = asyncio.run(run())
+    for table, removed in report.items():
+        print(f"{table}: {removed} rows removed")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+import bisect
+from typing import Callable, Dict, List, Sequence
+
+# Lightweight in-process metrics. Values are per worker process and are only
+# mutated from the event loop, so no locking is needed.
+
+DEFAULT_LATENCY_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+
+class Counter:
+    def __init__(self):
+        self.value = 0
+
+    def inc(self, amount: int = 1):
+        self.value += amount
+
+    def snapshot(self):
+        return self.value
+
+class Histogram:
+    def __init__(self, buckets: Sequence[float] = DEFAULT_LATENCY_BUCKETS):
+        self.buckets = tuple(buckets)
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.count = 0
+        self.sum = 0.0
+        self.max = 0.0
+
+    def observe(self, value: float):
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.sum += value
+        if value > self.max:
+            self.max = value
+
+    def snapshot(self):
+        cumulative: List[int] = []
+        running = 0
+        for c in self.counts:
+            running += c
+            cumulative.append(running)
+        return {
+            "count": self.count,
+            "sum": round(self.sum, 6),
+            "max": round(self.max, 6),
+            "mean": round(self.sum / self.count, 6) if self.count else 0.0,
+            "buckets": {
+                **{f"le_{b}": n for b, n in zip(self.buckets, cumulative)},
+                "le_inf": cumulative[-1],
+            },
+        }
+
+class Gauge:
+    def __init__(self, fn: Callable[[], float]):
+        self.fn = fn
+
+    def snapshot(self):
+        return self.fn()
+
+_registry: Dict[str, object] = {}
+
+def counter(name: str) -> Counter:
+    return _registry.setdefault(name, Counter())
+
+def histogram(name: str, buckets: Sequence[float] = DEFAULT_LATENCY_BUCKETS) -> Histogram:
+    return _registry.setdefault(name, Histogram(buckets))
+
+def gauge(name: str, fn: Callable[[], float]) -> Gauge:
+    _registry[name] = Gauge(fn)
+    return _registry[name]
+
+def snapshot() -> Dict[str, object]:
+    return {name: metric.snapshot() for name, metric in sorted(_registry.items())}
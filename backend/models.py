@@ -58,6 +58,7 @@ class TimelineEventType(str, enum.Enum):
     VITAL = "VITAL"
     FOLLOW_UP = "FOLLOW_UP"
     REFERRAL = "REFERRAL"
+    ALERT = "ALERT"
 
 class CarePlanStatus(str, enum.Enum):
     DRAFT = "DRAFT"
@@ -260,6 +261,7 @@ class FamilyRelationship(Base):
         Index("idx_family_relationships_familyMemberId", "familyMemberId"),
         Index("idx_family_relationships_inviteCode", "inviteCode"),
         Index("idx_family_relationships_status", "status"),
+        Index("idx_family_relationships_status_createdAt", "status", "createdAt"),
     )
 
 class CaregiverPatientLink(Base):
@@ -291,6 +293,11 @@ class TimelineEvent(Base):
     patient = relationship("User", foreign_keys=[patientId])
     author = relationship("User", foreign_keys=[authorId])
 
+    __table_args__ = (
+        # Serves keyset pagination on (timestamp, id) newest-first per patient
+        Index("idx_timeline_events_patientId_timestamp", "patientId", timestamp.desc(), id.desc()),
+    )
+
 class CarePlan(Base):
     __tablename__ = "care_plans"
 
@@ -299,14 +306,38 @@ class CarePlan(Base):
     authorId = Column(Uuid, ForeignKey("users.id", ondelete="SET NULL"), nullable=True)
     status = Column(SqlEnum(CarePlanStatus, name="care_plan_status_enum"), default=CarePlanStatus.DRAFT, nullable=False)
     reviewDate = Column(Date, nullable=True)
+    # Set once the FOLLOW_UP reminder for the current reviewDate has been emitted
+    reviewNotifiedAt = Column(DateTime, nullable=True)
     goals = Column(JSON, nullable=True, default=list)
     notes = Column(Text, nullable=True)
+    version = Column(Integer, default=1, server_default="1", nullable=False)
     createdAt = Column(DateTime, default=datetime.utcnow, nullable=False)
     updatedAt = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
 
     patient = relationship("User", foreign_keys=[patientId])
     author = relationship("User", foreign_keys=[authorId])
 
+    __table_args__ = (
+        Index("idx_care_plans_patientId_createdAt", "patientId", "createdAt"),
+        Index("idx_care_plans_status_reviewDate", "status", "reviewDate"),
+    )
+
+class CarePlanVersion(Base):
+    """One entry of a care plan's history: a full snapshot of the versioned fields or
+    a diff against the previous version (see backend.care_plan_versions)."""
+    __tablename__ = "care_plan_versions"
+    id = Column(Uuid, primary_key=True, default=uuid.uuid4)
+    planId = Column(Uuid, ForeignKey("care_plans.id", ondelete="CASCADE"), nullable=False)
+    version = Column(Integer, nullable=False)
+    isSnapshot = Column(Boolean, default=False, nullable=False)
+    data = Column(JSON, nullable=False)
+    authorId = Column(Uuid, ForeignKey("users.id", ondelete="SET NULL"), nullable=True)
+    createdAt = Column(DateTime, default=datetime.utcnow, nullable=False)
+
+    __table_args__ = (
+        Index("idx_care_plan_versions_planId_version", "planId", "version", unique=True),
+    )
+
 
 class ClinicalAssignment(Base):
     __tablename__ = "clinical_assignments"
@@ -316,15 +347,24 @@ class ClinicalAssignment(Base):
     roleContext = Column(SqlEnum(ClinicalRoleContext, name="clinical_role_context_enum"), nullable=False)
     status = Column(String(50), default="ACTIVE", nullable=False)
     assignedAt = Column(DateTime, default=datetime.utcnow, nullable=False)
+    # Timeline entries after this (or assignedAt) count as unread on the roster
+    lastViewedAt = Column(DateTime, nullable=True)
     clinician = relationship("User", foreign_keys=[clinicianId])
     patient = relationship("User", foreign_keys=[patientId])
 
+    __table_args__ = (
+        Index("idx_clinical_assignments_clinicianId", "clinicianId"),
+    )
+
 class VitalsRecord(Base):
     __tablename__ = "vitals_records"
     id = Column(Uuid, primary_key=True, default=uuid.uuid4)
     patientId = Column(Uuid, ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
     recordedById = Column(Uuid, ForeignKey("users.id", ondelete="SET NULL"), nullable=True)
     bloodPressure = Column(String(20), nullable=True)
+    # Parsed from bloodPressure on write so range queries and rollups stay in SQL
+    systolic = Column(Integer, nullable=True)
+    diastolic = Column(Integer, nullable=True)
     heartRate = Column(Integer, nullable=True)
     temperature = Column(Float, nullable=True)
     oxygenSaturation = Column(Integer, nullable=True)
@@ -332,6 +372,29 @@ class VitalsRecord(Base):
     patient = relationship("User", foreign_keys=[patientId])
     recordedBy = relationship("User", foreign_keys=[recordedById])
 
+    __table_args__ = (
+        # Range scans for trend charts and rollups over one patient's readings
+        Index("idx_vitals_records_patientId_recordedAt", "patientId", "recordedAt"),
+        # A patient's "readings above threshold" lookups scan only the matching index range
+        Index("idx_vitals_records_patientId_systolic", "patientId", "systolic"),
+        Index("idx_vitals_records_patientId_diastolic", "patientId", "diastolic"),
+    )
+
+class VitalsRollup(Base):
+    """Hourly and daily per-metric aggregates of vitals_records, maintained on every
+    write so trend queries read a few thousand rollup rows instead of every reading."""
+    __tablename__ = "vitals_rollups"
+    patientId = Column(Uuid, ForeignKey("users.id", ondelete="CASCADE"), primary_key=True)
+    resolution = Column(String(8), primary_key=True)  # "hour" or "day"
+    bucketStart = Column(DateTime, primary_key=True)
+    metric = Column(String(32), primary_key=True)
+    readingCount = Column(Integer, nullable=False)
+    total = Column(Float, nullable=False)
+    minValue = Column(Float, nullable=False)
+    maxValue = Column(Float, nullable=False)
+    lastValue = Column(Float, nullable=False)
+    lastAt = Column(DateTime, nullable=False)
+
 class ConsultationNote(Base):
     __tablename__ = "consultation_notes"
     id = Column(Uuid, primary_key=True, default=uuid.uuid4)
@@ -345,6 +408,10 @@ class ConsultationNote(Base):
     patient = relationship("User", foreign_keys=[patientId])
     doctor = relationship("User", foreign_keys=[doctorId])
 
+    __table_args__ = (
+        Index("idx_consultation_notes_patientId_consultationDate", "patientId", "consultationDate"),
+    )
+
 class Prescription(Base):
     __tablename__ = "prescriptions"
     id = Column(Uuid, primary_key=True, default=uuid.uuid4)
@@ -358,6 +425,10 @@ class Prescription(Base):
     patient = relationship("User", foreign_keys=[patientId])
     doctor = relationship("User", foreign_keys=[doctorId])
 
+    __table_args__ = (
+        Index("idx_prescriptions_patientId_issuedAt", "patientId", "issuedAt"),
+    )
+
 
 class ServiceRequest(Base):
     __tablename__ = "service_requests"
@@ -370,6 +441,11 @@ class ServiceRequest(Base):
     requestType = Column(SqlEnum(ServiceRequestType, name="service_request_type_enum"), nullable=False)
     status = Column(SqlEnum(ServiceRequestStatus, name="service_request_status_enum"), default=ServiceRequestStatus.PENDING, nullable=False)
     dueDate = Column(DateTime, nullable=True)
+    # Zip-centroid location of the request as a unit vector plus its grid cell (see backend.geo)
+    geoX = Column(Float, nullable=True)
+    geoY = Column(Float, nullable=True)
+    geoZ = Column(Float, nullable=True)
+    geoCell = Column(Integer, nullable=True)
     createdAt = Column(DateTime, default=datetime.utcnow, nullable=False)
     updatedAt = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
     
@@ -377,6 +453,15 @@ class ServiceRequest(Base):
     organization = relationship("User", foreign_keys=[organizationId])
     volunteer = relationship("User", foreign_keys=[volunteerId])
 
+    __table_args__ = (
+        Index("idx_service_requests_status_createdAt", "status", "createdAt", "id"),
+        Index("idx_service_requests_volunteerId_createdAt", "volunteerId", "createdAt", "id"),
+        Index("idx_service_requests_organizationId_createdAt", "organizationId", "createdAt", "id"),
+        Index("idx_service_requests_patientId_createdAt", "patientId", "createdAt", "id"),
+        Index("idx_service_requests_createdAt", "createdAt", "id"),
+        Index("idx_service_requests_geoCell_status", "geoCell", "status"),
+    )
+
 class Session(Base):
     __tablename__ = "sessions"
 
@@ -392,6 +477,7 @@ class Session(Base):
 
     __table_args__ = (
         Index("idx_sessions_userId", "userId"),
+        Index("idx_sessions_expiresAt", "expiresAt"),
     )
 
 class VerificationToken(Base):
@@ -408,6 +494,8 @@ class VerificationToken(Base):
 
     __table_args__ = (
         Index("idx_verification_tokens_userId_type", "userId", "type"),
+        Index("idx_verification_tokens_tokenHash", "tokenHash", unique=True),
+        Index("idx_verification_tokens_expiresAt", "expiresAt"),
     )
 
 class AuditLog(Base):
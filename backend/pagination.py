@@ -0,0 +1,19 @@
+import uuid
+import base64
+from datetime import datetime
+from typing import Tuple
+from fastapi import HTTPException
+
+# Opaque keyset cursors for (timestamp, id) ordered listings.
+
+def encode_cursor(sort_value: datetime, row_id: uuid.UUID) -> str:
+    raw = f"{sort_value.isoformat()}|{row_id}"
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+def decode_cursor(cursor: str) -> Tuple[datetime, uuid.UUID]:
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)).decode()
+        sort_value, row_id = raw.split("|", 1)
+        return datetime.fromisoformat(sort_value), uuid.UUID(row_id)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="INVALID_CURSOR")
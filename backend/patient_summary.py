@@ -0,0 +1,102 @@
+import uuid
+from datetime import datetime
+from typing import Optional
+
+from sqlalchemy import func, or_
+from sqlalchemy.future import select
+from sqlalchemy.orm import aliased
+
+from backend.cache import TTLCache
+from backend.config import settings
+from backend.database import read_session
+from backend.models import User, Role, VitalsRecord, Prescription, CarePlan, CarePlanStatus, ConsultationNote, TimelineEvent
+from backend.repository import fetch_all
+from backend.schemas import PatientSummary
+
+# Everything a patient card needs in two statements on one read-only session, cached
+# per patient: one row joining the patient to their latest vitals, current care plan
+# and last consultation (each picked by an indexed LIMIT 1 subquery) plus the
+# timeline count, then the active prescriptions. Clinical writes call
+# invalidate_patient_summary; the TTL bounds staleness across workers and for
+# prescriptions that lapse with time.
+
+summary_cache = TTLCache("patient_summary_cache", settings.PATIENT_SUMMARY_CACHE_MAX_ENTRIES, settings.PATIENT_SUMMARY_CACHE_TTL_SECONDS)
+
+CURRENT_CARE_PLAN_STATUSES = (CarePlanStatus.ACTIVE, CarePlanStatus.UNDER_REVIEW, CarePlanStatus.DRAFT)
+
+def invalidate_patient_summary(patient_id: uuid.UUID):
+    summary_cache.invalidate(patient_id)
+
+def _active_prescription(dialect: str, now: datetime):
+    if dialect == "postgresql":
+        expires = Prescription.issuedAt + func.make_interval(0, 0, 0, Prescription.durationDays)
+        return or_(Prescription.durationDays.is_(None), expires > now)
+    return or_(Prescription.durationDays.is_(None), func.julianday(Prescription.issuedAt) + Prescription.durationDays > func.julianday(now))
+
+def _summary_row(patient_id: uuid.UUID):
+    # The LIMIT 1 subqueries use aliases so they don't correlate with the joined tables
+    vitals, plan, note = aliased(VitalsRecord), aliased(CarePlan), aliased(ConsultationNote)
+    latest_vitals_id = (
+        select(vitals.id)
+        .where(vitals.patientId == patient_id)
+        .order_by(vitals.recordedAt.desc())
+        .limit(1)
+        .scalar_subquery()
+    )
+    current_plan_id = (
+        select(plan.id)
+        .where(plan.patientId == patient_id, plan.status.in_(CURRENT_CARE_PLAN_STATUSES))
+        .order_by(plan.createdAt.desc())
+        .limit(1)
+        .scalar_subquery()
+    )
+    last_consultation_id = (
+        select(note.id)
+        .where(note.patientId == patient_id)
+        .order_by(note.consultationDate.desc())
+        .limit(1)
+        .scalar_subquery()
+    )
+    event_count = (
+        select(func.count())
+        .select_from(TimelineEvent)
+        .where(TimelineEvent.patientId == patient_id)
+        .scalar_subquery()
+    )
+    return (
+        select(VitalsRecord, CarePlan, ConsultationNote, event_count.label("eventCount"))
+        .select_from(User)
+        .outerjoin(VitalsRecord, VitalsRecord.id == latest_vitals_id)
+        .outerjoin(CarePlan, CarePlan.id == current_plan_id)
+        .outerjoin(ConsultationNote, ConsultationNote.id == last_consultation_id)
+        .where(User.id == patient_id, User.role == Role.PATIENT)
+    )
+
+async def get_patient_summary(patient_id: uuid.UUID) -> Optional[PatientSummary]:
+    cached = summary_cache.get(patient_id)
+    if cached is not None:
+        return cached
+
+    now = datetime.utcnow()
+    async with read_session() as db:
+        row = (await db.execute(_summary_row(patient_id))).first()
+        if row is None:
+            return None
+        prescriptions = await fetch_all(
+            db,
+            select(Prescription)
+            .where(Prescription.patientId == patient_id, _active_prescription(db.bind.dialect.name, now))
+            .order_by(Prescription.issuedAt.desc())
+        )
+
+    summary = PatientSummary(
+        patientId=patient_id,
+        latestVitals=row.VitalsRecord,
+        activePrescriptions=prescriptions,
+        currentCarePlan=row.CarePlan,
+        lastConsultation=row.ConsultationNote,
+        timelineEventCount=row.eventCount,
+        generatedAt=now
+    )
+    summary_cache.set(patient_id, summary)
+    return summary
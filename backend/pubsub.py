@@ -0,0 +1,156 @@
+import json
+import time
+import asyncio
+import sqlite3
+import logging
+import threading
+from abc import ABC, abstractmethod
+from typing import Any, Dict, List, Optional, Set
+
+from backend import metrics
+from backend.config import settings
+
+logger = logging.getLogger(__name__)
+
+class Subscription:
+    def __init__(self, channel: str, maxsize: int):
+        self.channel = channel
+        self.queue: "asyncio.Queue[Dict[str, Any]]" = asyncio.Queue(maxsize=maxsize)
+        # Set when the consumer fell behind; it gets no more messages and should resync
+        self.overflowed = False
+
+class Hub:
+    """Fans messages out to local subscribers. Each subscriber has a bounded queue;
+    one that fills up is dropped rather than slowing publishers or buffering
+    without bound."""
+
+    def __init__(self):
+        self._subscribers: Dict[str, Set[Subscription]] = {}
+        self.dropped = metrics.counter("pubsub.dropped_subscribers")
+        metrics.gauge("pubsub.subscribers", lambda: sum(len(s) for s in self._subscribers.values()))
+
+    def subscribe(self, channel: str) -> Subscription:
+        sub = Subscription(channel, settings.PUBSUB_QUEUE_SIZE)
+        self._subscribers.setdefault(channel, set()).add(sub)
+        return sub
+
+    def unsubscribe(self, sub: Subscription):
+        subs = self._subscribers.get(sub.channel)
+        if subs is not None:
+            subs.discard(sub)
+            if not subs:
+                del self._subscribers[sub.channel]
+
+    def deliver(self, channel: str, message: Dict[str, Any]):
+        for sub in list(self._subscribers.get(channel, ())):
+            try:
+                sub.queue.put_nowait(message)
+            except asyncio.QueueFull:
+                sub.overflowed = True
+                self.unsubscribe(sub)
+                self.dropped.inc()
+
+class PubSubBackend(ABC):
+    """Carries published messages to the hub of every worker."""
+
+    def __init__(self, hub: Hub):
+        self.hub = hub
+
+    @abstractmethod
+    async def publish(self, channel: str, message: Dict[str, Any]):
+        """Deliver message to the channel's subscribers on every worker."""
+
+    async def start(self):
+        pass
+
+    async def stop(self):
+        pass
+
+class MemoryPubSubBackend(PubSubBackend):
+    """Single-process delivery straight into the local hub."""
+
+    async def publish(self, channel: str, message: Dict[str, Any]):
+        self.hub.deliver(channel, message)
+
+class SQLitePubSubBackend(PubSubBackend):
+    """Cross-worker delivery for workers on one host: publishers append to a SQLite
+    log and every worker polls it. Stands in for a networked broker (e.g. Redis
+    pub/sub or Postgres LISTEN/NOTIFY) implementing the same interface."""
+
+    RETENTION_SECONDS = 60
+
+    def __init__(self, hub: Hub, path: str):
+        super().__init__(hub)
+        self.path = path
+        self._local = threading.local()
+        self._last_seq = 0
+        self._task: Optional[asyncio.Task] = None
+        self._connection().execute(
+            "CREATE TABLE IF NOT EXISTS pubsub_messages "
+            "(seq INTEGER PRIMARY KEY AUTOINCREMENT, channel TEXT NOT NULL, payload TEXT NOT NULL, created REAL NOT NULL)"
+        )
+
+    def _connection(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=5, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            self._local.conn = conn
+        return conn
+
+    def _append(self, channel: str, payload: str):
+        self._connection().execute(
+            "INSERT INTO pubsub_messages (channel, payload, created) VALUES (?, ?, ?)",
+            (channel, payload, time.time())
+        )
+
+    def _read_since(self, seq: int) -> List[tuple]:
+        return self._connection().execute(
+            "SELECT seq, channel, payload FROM pubsub_messages WHERE seq > ? ORDER BY seq", (seq,)
+        ).fetchall()
+
+    def _prune(self):
+        self._connection().execute("DELETE FROM pubsub_messages WHERE created < ?", (time.time() - self.RETENTION_SECONDS,))
+
+    async def publish(self, channel: str, message: Dict[str, Any]):
+        await asyncio.to_thread(self._append, channel, json.dumps(message))
+
+    async def _poll(self):
+        polls = 0
+        while True:
+            try:
+                for seq, channel, payload in await asyncio.to_thread(self._read_since, self._last_seq):
+                    self._last_seq = seq
+                    self.hub.deliver(channel, json.loads(payload))
+                polls += 1
+                if polls % 1000 == 0:
+                    await asyncio.to_thread(self._prune)
+            except Exception:
+                logger.exception("Pub/sub poll failed")
+            await asyncio.sleep(settings.PUBSUB_POLL_INTERVAL_SECONDS)
+
+    async def start(self):
+        if self._task is None:
+            # Only messages published after this worker started are delivered
+            row = await asyncio.to_thread(lambda: self._connection().execute("SELECT MAX(seq) FROM pubsub_messages").fetchone())
+            self._last_seq = row[0] or 0
+            self._task = asyncio.get_running_loop().create_task(self._poll())
+
+    async def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+
+hub = Hub()
+
+if settings.PUBSUB_BACKEND == "sqlite":
+    backend: PubSubBackend = SQLitePubSubBackend(hub, settings.PUBSUB_SQLITE_PATH)
+else:
+    backend = MemoryPubSubBackend(hub)
+
+async def publish(channel: str, message: Dict[str, Any]):
+    try:
+        await backend.publish(channel, message)
+    except Exception:
+        # Live push is best-effort; clients recover missed events on resume
+        logger.exception("Failed to publish to %s", channel)
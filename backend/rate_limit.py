@@ -0,0 +1,131 @@
+import time
+import asyncio
+from abc import ABC, abstractmethod
+import sqlite3
+import threading
+from collections import OrderedDict
+from typing import Optional, Tuple
+from fastapi import Request, HTTPException
+
+from backend import metrics
+from backend.config import settings
+
+# Token-bucket rate limiting. Each (route, client IP) key holds `limit` tokens
+# that refill continuously over `window` seconds; a request spends one token.
+
+class RateLimitBackend(ABC):
+    @abstractmethod
+    async def hit(self, key: str, limit: int, window: float) -> Tuple[bool, float]:
+        """Spend one token for key. Returns (allowed, seconds until a token is available)."""
+
+def _spend(tokens: float, elapsed: float, limit: int, window: float) -> Tuple[bool, float, float]:
+    tokens = min(float(limit), tokens + elapsed * limit / window)
+    if tokens >= 1:
+        return True, tokens - 1, 0.0
+    return False, tokens, (1 - tokens) * window / limit
+
+class MemoryRateLimitBackend(RateLimitBackend):
+    """Per-process buckets. O(1) per check; idle keys are dropped once their bucket
+    would have refilled, oldest first."""
+
+    def __init__(self):
+        self._buckets: "OrderedDict[str, tuple]" = OrderedDict()
+
+    async def hit(self, key: str, limit: int, window: float) -> Tuple[bool, float]:
+        now = time.monotonic()
+        tokens, updated, _ = self._buckets.pop(key, (float(limit), now, window))
+        allowed, tokens, retry_after = _spend(tokens, now - updated, limit, window)
+        self._buckets[key] = (tokens, now, window)
+
+        while self._buckets:
+            oldest_key, (_, oldest_updated, oldest_window) = next(iter(self._buckets.items()))
+            if now - oldest_updated < oldest_window:
+                break
+            del self._buckets[oldest_key]
+        return allowed, retry_after
+
+class SQLiteRateLimitBackend(RateLimitBackend):
+    """Buckets shared by every worker on the host through a SQLite file. Stands in
+    for a networked store (e.g. Redis) implementing the same interface."""
+
+    PRUNE_EVERY = 1000
+
+    def __init__(self, path: str):
+        self.path = path
+        self._local = threading.local()
+        self._hits = 0
+        conn = self._connection()
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS rate_limit_buckets "
+            "(key TEXT PRIMARY KEY, tokens REAL NOT NULL, updated REAL NOT NULL, window REAL NOT NULL)"
+        )
+
+    def _connection(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=5, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            self._local.conn = conn
+        return conn
+
+    def _hit_sync(self, key: str, limit: int, window: float) -> Tuple[bool, float]:
+        conn = self._connection()
+        now = time.time()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            row = conn.execute("SELECT tokens, updated FROM rate_limit_buckets WHERE key = ?", (key,)).fetchone()
+            tokens, updated = row if row else (float(limit), now)
+            allowed, tokens, retry_after = _spend(tokens, max(now - updated, 0.0), limit, window)
+            conn.execute(
+                "INSERT INTO rate_limit_buckets (key, tokens, updated, window) VALUES (?, ?, ?, ?) "
+                "ON CONFLICT(key) DO UPDATE SET tokens = excluded.tokens, updated = excluded.updated, window = excluded.window",
+                (key, tokens, now, window)
+            )
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+
+        self._hits += 1
+        if self._hits % self.PRUNE_EVERY == 0:
+            conn.execute("DELETE FROM rate_limit_buckets WHERE updated + window < ?", (now,))
+        return allowed, retry_after
+
+    async def hit(self, key: str, limit: int, window: float) -> Tuple[bool, float]:
+        return await asyncio.to_thread(self._hit_sync, key, limit, window)
+
+_backend: Optional[RateLimitBackend] = None
+
+def get_backend() -> RateLimitBackend:
+    global _backend
+    if _backend is None:
+        if settings.RATE_LIMIT_BACKEND == "sqlite":
+            _backend = SQLiteRateLimitBackend(settings.RATE_LIMIT_SQLITE_PATH)
+        else:
+            _backend = MemoryRateLimitBackend()
+    return _backend
+
+def set_backend(backend: RateLimitBackend):
+    global _backend
+    _backend = backend
+
+rate_limited = metrics.counter("rate_limit.rejected")
+
+def rate_limit(name: str, limit: int, window: float = 60):
+    """Dependency allowing `limit` requests per `window` seconds per client IP.
+    The limit can be overridden per route name through settings.RATE_LIMITS."""
+
+    async def dependency(request: Request):
+        if not settings.RATE_LIMIT_ENABLED:
+            return
+        route_limit = settings.RATE_LIMITS.get(name, limit)
+        client_ip = request.client.host if request.client else "unknown"
+        allowed, retry_after = await get_backend().hit(f"{name}:{client_ip}", route_limit, window)
+        if not allowed:
+            rate_limited.inc()
+            raise HTTPException(
+                status_code=429,
+                detail="RATE_LIMIT_EXCEEDED",
+                headers={"Retry-After": str(max(1, int(retry_after + 0.999)))}
+            )
+    return dependency
@@ -0,0 +1,31 @@
+import uuid
+from typing import Optional, List, TypeVar
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.future import select
+from sqlalchemy.sql import Select
+
+from backend.models import User, Role
+
+T = TypeVar("T")
+
+# Shared async query helpers for the clinical, services and admin routers.
+
+async def fetch_one(db: AsyncSession, stmt: Select) -> Optional[T]:
+    result = await db.execute(stmt)
+    return result.scalars().first()
+
+async def fetch_all(db: AsyncSession, stmt: Select) -> List[T]:
+    result = await db.execute(stmt)
+    return list(result.scalars().all())
+
+async def get_user(db: AsyncSession, user_id: uuid.UUID) -> Optional[User]:
+    return await fetch_one(db, select(User).where(User.id == user_id))
+
+async def get_patient(db: AsyncSession, patient_id: uuid.UUID) -> Optional[User]:
+    return await fetch_one(db, select(User).where(User.id == patient_id, User.role == Role.PATIENT))
+
+async def save(db: AsyncSession, obj: T) -> T:
+    db.add(obj)
+    await db.commit()
+    await db.refresh(obj)
+    return obj
@@ -0,0 +1,9 @@
+import uuid
+from sqlalchemy import delete
+from sqlalchemy.ext.asyncio import AsyncSession
+from backend.models import Session
+
+async def revoke_user_sessions(db: AsyncSession, user_id: uuid.UUID) -> int:
+    """Delete every session of a user in one statement and return how many were removed."""
+    result = await db.execute(delete(Session).where(Session.userId == user_id))
+    return result.rowcount
@@ -0,0 +1,121 @@
+import uuid
+from datetime import date, datetime
+from typing import Any, Dict, List, Optional, Tuple
+from sqlalchemy import func, or_
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.future import select
+
+from backend.models import User, PatientProfile, ClinicalAssignment, VitalsRecord, CarePlan, TimelineEvent
+
+# A clinician's caseload, enriched per patient. Two statements regardless of
+# caseload size: a count, and one SELECT joining subqueries for the latest vitals,
+# latest care plan and unread timeline events, sorted and paged in SQL.
+
+def _age(date_of_birth: Optional[date], today: date) -> Optional[int]:
+    if date_of_birth is None:
+        return None
+    return today.year - date_of_birth.year - ((today.month, today.day) < (date_of_birth.month, date_of_birth.day))
+
+async def get_roster(
+    db: AsyncSession,
+    clinician_id: uuid.UUID,
+    sort: str,
+    descending: bool,
+    limit: int,
+    offset: int
+) -> Tuple[List[Dict[str, Any]], int]:
+    mine = ClinicalAssignment.clinicianId == clinician_id
+    my_patients = select(ClinicalAssignment.patientId).where(mine)
+
+    latest_vitals = (
+        select(VitalsRecord.patientId, func.max(VitalsRecord.recordedAt).label("lastVitalsAt"))
+        .where(VitalsRecord.patientId.in_(my_patients))
+        .group_by(VitalsRecord.patientId)
+        .subquery()
+    )
+    # Exactly one plan per patient, even when two share a createdAt
+    ranked_plans = (
+        select(
+            CarePlan.patientId,
+            CarePlan.status,
+            func.row_number().over(
+                partition_by=CarePlan.patientId,
+                order_by=(CarePlan.createdAt.desc(), CarePlan.id.desc())
+            ).label("rank")
+        )
+        .where(CarePlan.patientId.in_(my_patients))
+        .subquery()
+    )
+    latest_plan = (
+        select(ranked_plans.c.patientId, ranked_plans.c.status)
+        .where(ranked_plans.c.rank == 1)
+        .subquery()
+    )
+    # Unread: entries by anyone else since the clinician last opened the patient
+    unread = (
+        select(ClinicalAssignment.id.label("assignmentId"), func.count(TimelineEvent.id).label("unread"))
+        .join(TimelineEvent, TimelineEvent.patientId == ClinicalAssignment.patientId)
+        .where(
+            mine,
+            TimelineEvent.timestamp > func.coalesce(ClinicalAssignment.lastViewedAt, ClinicalAssignment.assignedAt),
+            or_(TimelineEvent.authorId.is_(None), TimelineEvent.authorId != clinician_id)
+        )
+        .group_by(ClinicalAssignment.id)
+        .subquery()
+    )
+
+    unread_count = func.coalesce(unread.c.unread, 0)
+    sort_columns = {
+        "name": [User.lastName, User.firstName],
+        "age": [PatientProfile.dateOfBirth],
+        "lastVitals": [latest_vitals.c.lastVitalsAt],
+        "carePlanStatus": [latest_plan.c.status],
+        "unread": [unread_count],
+        "assignedAt": [ClinicalAssignment.assignedAt],
+    }[sort]
+    if sort == "age":
+        # Older patients have earlier birth dates
+        descending = not descending
+    order_by = [(column.desc() if descending else column.asc()).nulls_last() for column in sort_columns]
+
+    query = (
+        select(
+            ClinicalAssignment,
+            User.firstName,
+            User.lastName,
+            PatientProfile.dateOfBirth,
+            latest_vitals.c.lastVitalsAt,
+            latest_plan.c.status.label("carePlanStatus"),
+            unread_count.label("unreadCount")
+        )
+        .join(User, User.id == ClinicalAssignment.patientId)
+        .outerjoin(PatientProfile, PatientProfile.userId == ClinicalAssignment.patientId)
+        .outerjoin(latest_vitals, latest_vitals.c.patientId == ClinicalAssignment.patientId)
+        .outerjoin(latest_plan, latest_plan.c.patientId == ClinicalAssignment.patientId)
+        .outerjoin(unread, unread.c.assignmentId == ClinicalAssignment.id)
+        .where(mine)
+        .order_by(*order_by, ClinicalAssignment.id)
+        .limit(limit)
+        .offset(offset)
+    )
+
+    total = (await db.execute(select(func.count()).select_from(ClinicalAssignment).where(mine))).scalar_one()
+    result = await db.execute(query)
+    today = datetime.utcnow().date()
+    entries = [
+        {
+            "assignmentId": row.ClinicalAssignment.id,
+            "patientId": row.ClinicalAssignment.patientId,
+            "firstName": row.firstName,
+            "lastName": row.lastName,
+            "age": _age(row.dateOfBirth, today),
+            "roleContext": row.ClinicalAssignment.roleContext,
+            "status": row.ClinicalAssignment.status,
+            "assignedAt": row.ClinicalAssignment.assignedAt,
+            "lastVitalsAt": row.lastVitalsAt,
+            "carePlanStatus": row.carePlanStatus,
+            "unreadCount": row.unreadCount,
+        }
+        for row in result
+    ]
+    return entries, total
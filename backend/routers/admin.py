@@ -1,49 +1,52 @@
 from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
-from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.future import select
 from typing import List
 import uuid
 
-from backend.database import get_db
+from backend.database import get_db, get_read_db
 from backend.models import User, Role, VerificationStatus
 from backend.schemas import AdminUserResponse, AdminVerifyUserSchema
-from backend.auth import get_current_user
+from backend.auth import get_current_user, invalidate_principal
+from backend.repository import fetch_all, get_user
 
 router = APIRouter(prefix="/api/v1/admin", tags=["admin"])
 
-def require_admin(user: User = Depends(get_current_user)):
+async def require_admin(user: User = Depends(get_current_user)):
     if user.role != Role.ADMIN:
         raise HTTPException(status_code=403, detail="Only administrators can access this endpoint")
     return user
 
 @router.get("/users/pending", response_model=List[AdminUserResponse])
-def get_pending_users(
-    db: Session = Depends(get_db),
+async def get_pending_users(
+    db: AsyncSession = Depends(get_read_db),
     current_user: User = Depends(require_admin)
 ):
     # Fetch users who need verification (Doctors, Nurses, Organizations, Hospitals)
-    users = db.scalars(
+    users = await fetch_all(
+        db,
         select(User).where(
             User.verificationStatus == VerificationStatus.PENDING,
             User.role.in_([Role.DOCTOR, Role.NURSE, Role.ORGANIZATION, Role.HOSPITAL])
         ).order_by(User.createdAt.desc())
-    ).all()
+    )
     
     return users
 
 @router.patch("/users/{target_user_id}/verify", response_model=AdminUserResponse)
-def verify_user(
+async def verify_user(
     target_user_id: uuid.UUID,
     payload: AdminVerifyUserSchema,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_user: User = Depends(require_admin)
 ):
-    target = db.scalar(select(User).where(User.id == target_user_id))
+    target = await get_user(db, target_user_id)
     if not target:
         raise HTTPException(status_code=404, detail="User not found")
         
     target.verificationStatus = payload.verificationStatus
-    db.commit()
-    db.refresh(target)
+    await db.commit()
+    invalidate_principal(target.id)
+    await db.refresh(target)
     
     return target
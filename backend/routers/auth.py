@@ -4,6 +4,7 @@ from datetime import datetime, timedelta
 from typing import Dict, Any
 from fastapi import APIRouter, Depends, HTTPException, Request, Response, status
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import delete
 from sqlalchemy.future import select
 
 from backend.database import get_db
@@ -12,17 +13,22 @@ from backend.schemas import RegisterSchema, LoginSchema, ResetPasswordSchema, Fo
 from backend.auth import (
     hash_password,
     verify_password,
+    hash_refresh_token,
+    verify_refresh_token,
+    hash_verification_token,
     create_access_token,
     set_auth_cookies,
     clear_auth_cookies,
     get_current_user,
-    pwd_context
+    invalidate_principal
 )
 from backend.audit import log_audit
+from backend.revocation import revoke_user_sessions
+from backend.rate_limit import rate_limit
 
 router = APIRouter(prefix="/auth", tags=["auth"])
 
-@router.post("/register", status_code=status.HTTP_201_CREATED)
+@router.post("/register", status_code=status.HTTP_201_CREATED, dependencies=[Depends(rate_limit("auth.register", 3))])
 async def register(dto: RegisterSchema, request: Request, db: AsyncSession = Depends(get_db)):
     # Check existing user
     result = await db.execute(select(User).where(User.email == dto.email))
@@ -30,7 +36,7 @@ async def register(dto: RegisterSchema, request: Request, db: AsyncSession = Dep
     if existing:
         raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail="AUTH_EMAIL_ALREADY_EXISTS")
 
-    hashed = hash_password(dto.password)
+    hashed = await hash_password(dto.password)
     user = User(
         email=dto.email,
         passwordHash=hashed,
@@ -45,7 +51,7 @@ async def register(dto: RegisterSchema, request: Request, db: AsyncSession = Dep
 
     # Create verification token
     verify_token_raw = secrets.token_hex(32)
-    token_hash = pwd_context.hash(verify_token_raw)
+    token_hash = hash_verification_token(verify_token_raw)
     
     token = VerificationToken(
         userId=user.id,
@@ -77,7 +83,7 @@ async def register(dto: RegisterSchema, request: Request, db: AsyncSession = Dep
         }
     }
 
-@router.post("/login")
+@router.post("/login", dependencies=[Depends(rate_limit("auth.login", 5))])
 async def login(dto: LoginSchema, request: Request, response: Response, db: AsyncSession = Depends(get_db)):
     result = await db.execute(select(User).where(User.email == dto.email))
     user = result.scalars().first()
@@ -90,24 +96,27 @@ async def login(dto: LoginSchema, request: Request, response: Response, db: Asyn
     if user.lockoutUntil and user.lockoutUntil > datetime.utcnow():
         raise HTTPException(status_code=403, detail="AUTH_ACCOUNT_LOCKED")
 
-    is_valid = verify_password(dto.password, user.passwordHash)
+    is_valid = await verify_password(dto.password, user.passwordHash)
     if not is_valid:
         attempts = user.failedLoginAttempts + 1
         user.failedLoginAttempts = attempts
         if attempts >= 5:
             user.lockoutUntil = datetime.utcnow() + timedelta(minutes=15)
         await db.commit()
+        invalidate_principal(user.id)
         raise HTTPException(status_code=401, detail="AUTH_INVALID_CREDENTIALS")
 
     # Reset lockout and attempts
     user.failedLoginAttempts = 0
     user.lockoutUntil = None
     user.lastLoginAt = datetime.utcnow()
+    await db.commit()
+    invalidate_principal(user.id)
 
     # Create tokens
     access_token = create_access_token(str(user.id), user.role, user.email)
     refresh_token_raw = secrets.token_hex(64)
-    refresh_token_hash = pwd_context.hash(refresh_token_raw)
+    refresh_token_hash = hash_refresh_token(refresh_token_raw)
 
     session = Session(
         userId=user.id,
@@ -137,7 +146,7 @@ async def login(dto: LoginSchema, request: Request, response: Response, db: Asyn
         }
     }
 
-@router.post("/refresh")
+@router.post("/refresh", dependencies=[Depends(rate_limit("auth.refresh", 10))])
 async def refresh(request: Request, response: Response, db: AsyncSession = Depends(get_db)):
     client_token = request.cookies.get("refresh_token")
     if not client_token:
@@ -164,20 +173,18 @@ async def refresh(request: Request, response: Response, db: AsyncSession = Depen
     if not user:
         raise HTTPException(status_code=401, detail="INVALID_REFRESH_TOKEN")
 
-    is_valid = verify_password(raw_token, session.refreshTokenHash)
+    is_valid = await verify_refresh_token(raw_token, session.refreshTokenHash)
     if not is_valid:
         # Session reuse detected: delete all sessions for user
-        await db.execute(select(Session).where(Session.userId == user.id))
-        user_sessions = (await db.execute(select(Session).where(Session.userId == user.id))).scalars().all()
-        for us in user_sessions:
-            await db.delete(us)
-        
+        revoked = await revoke_user_sessions(db, user.id)
+
         await log_audit(
             db,
             user.id,
             "TOKEN_REUSE_DETECTED",
             request.client.host if request.client else None,
-            request.headers.get("user-agent")
+            request.headers.get("user-agent"),
+            {"sessionsRevoked": revoked}
         )
         await db.commit()
         raise HTTPException(status_code=401, detail="INVALID_REFRESH_TOKEN")
@@ -190,7 +197,7 @@ async def refresh(request: Request, response: Response, db: AsyncSession = Depen
     # Generate new tokens
     new_access = create_access_token(str(user.id), user.role, user.email)
     new_refresh_raw = secrets.token_hex(64)
-    new_refresh_hash = pwd_context.hash(new_refresh_raw)
+    new_refresh_hash = hash_refresh_token(new_refresh_raw)
 
     new_session = Session(
         userId=user.id,
@@ -207,7 +214,7 @@ async def refresh(request: Request, response: Response, db: AsyncSession = Depen
 
     return {"message": "Token refreshed"}
 
-@router.post("/logout")
+@router.post("/logout", dependencies=[Depends(rate_limit("auth.logout", 10))])
 async def logout(request: Request, response: Response, db: AsyncSession = Depends(get_db)):
     client_token = request.cookies.get("refresh_token")
     if client_token:
@@ -225,7 +232,7 @@ async def logout(request: Request, response: Response, db: AsyncSession = Depend
     clear_auth_cookies(response)
     return {"message": "Logged out successfully"}
 
-@router.post("/verify-email")
+@router.post("/verify-email", dependencies=[Depends(rate_limit("auth.verify_email", 5))])
 async def verify_email(dto: VerifyEmailSchema, request: Request, db: AsyncSession = Depends(get_db)):
     try:
         user_id_str, raw_token = dto.token.split(".", 1)
@@ -233,19 +240,14 @@ async def verify_email(dto: VerifyEmailSchema, request: Request, db: AsyncSessio
     except ValueError:
         raise HTTPException(status_code=400, detail="INVALID_TOKEN")
 
-    tokens_result = await db.execute(
+    token_result = await db.execute(
         select(VerificationToken).where(
+            VerificationToken.tokenHash == hash_verification_token(raw_token),
             VerificationToken.userId == user_id,
             VerificationToken.type == TokenType.EMAIL_VERIFICATION
         )
     )
-    tokens = tokens_result.scalars().all()
-
-    valid_token = None
-    for t in tokens:
-        if verify_password(raw_token, t.tokenHash):
-            valid_token = t
-            break
+    valid_token = token_result.scalars().first()
 
     if not valid_token:
         raise HTTPException(status_code=400, detail="INVALID_TOKEN")
@@ -262,8 +264,12 @@ async def verify_email(dto: VerifyEmailSchema, request: Request, db: AsyncSessio
     user.accountStatus = AccountStatus.ACTIVE
 
     # Delete verification tokens
-    for t in tokens:
-        await db.delete(t)
+    await db.execute(
+        delete(VerificationToken).where(
+            VerificationToken.userId == user_id,
+            VerificationToken.type == TokenType.EMAIL_VERIFICATION
+        )
+    )
 
     await log_audit(
         db,
@@ -273,10 +279,11 @@ async def verify_email(dto: VerifyEmailSchema, request: Request, db: AsyncSessio
         request.headers.get("user-agent")
     )
     await db.commit()
+    invalidate_principal(user.id)
 
     return {"message": "Email verified successfully"}
 
-@router.post("/forgot-password")
+@router.post("/forgot-password", dependencies=[Depends(rate_limit("auth.forgot_password", 3))])
 async def forgot_password(dto: ForgotPasswordSchema, db: AsyncSession = Depends(get_db)):
     result = await db.execute(select(User).where(User.email == dto.email))
     user = result.scalars().first()
@@ -285,7 +292,7 @@ async def forgot_password(dto: ForgotPasswordSchema, db: AsyncSession = Depends(
         return {"message": "If the email exists, a reset link has been sent"}
 
     reset_token_raw = secrets.token_hex(32)
-    token_hash = pwd_context.hash(reset_token_raw)
+    token_hash = hash_verification_token(reset_token_raw)
 
     token = VerificationToken(
         userId=user.id,
@@ -301,7 +308,7 @@ async def forgot_password(dto: ForgotPasswordSchema, db: AsyncSession = Depends(
 
     return {"message": "If the email exists, a reset link has been sent"}
 
-@router.post("/reset-password")
+@router.post("/reset-password", dependencies=[Depends(rate_limit("auth.reset_password", 3))])
 async def reset_password(dto: ResetPasswordSchema, request: Request, db: AsyncSession = Depends(get_db)):
     try:
         user_id_str, raw_token = dto.token.split(".", 1)
@@ -309,19 +316,14 @@ async def reset_password(dto: ResetPasswordSchema, request: Request, db: AsyncSe
     except ValueError:
         raise HTTPException(status_code=400, detail="INVALID_TOKEN")
 
-    tokens_result = await db.execute(
+    token_result = await db.execute(
         select(VerificationToken).where(
+            VerificationToken.tokenHash == hash_verification_token(raw_token),
             VerificationToken.userId == user_id,
             VerificationToken.type == TokenType.PASSWORD_RESET
         )
     )
-    tokens = tokens_result.scalars().all()
-
-    valid_token = None
-    for t in tokens:
-        if verify_password(raw_token, t.tokenHash):
-            valid_token = t
-            break
+    valid_token = token_result.scalars().first()
 
     if not valid_token:
         raise HTTPException(status_code=400, detail="INVALID_TOKEN")
@@ -334,24 +336,28 @@ async def reset_password(dto: ResetPasswordSchema, request: Request, db: AsyncSe
     if not user:
         raise HTTPException(status_code=400, detail="INVALID_TOKEN")
 
-    user.passwordHash = hash_password(dto.newPassword)
+    user.passwordHash = await hash_password(dto.newPassword)
     
     # Delete token and sessions
-    for t in tokens:
-        await db.delete(t)
+    await db.execute(
+        delete(VerificationToken).where(
+            VerificationToken.userId == user_id,
+            VerificationToken.type == TokenType.PASSWORD_RESET
+        )
+    )
 
-    sessions_result = await db.execute(select(Session).where(Session.userId == user_id))
-    for s in sessions_result.scalars().all():
-        await db.delete(s)
+    revoked = await revoke_user_sessions(db, user_id)
 
     await log_audit(
         db,
         user.id,
         "PASSWORD_CHANGED",
         request.client.host if request.client else None,
-        request.headers.get("user-agent")
+        request.headers.get("user-agent"),
+        {"sessionsRevoked": revoked}
     )
     await db.commit()
+    invalidate_principal(user.id)
 
     return {"message": "Password reset successfully"}
 
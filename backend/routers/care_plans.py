@@ -1,41 +1,94 @@
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
-from sqlalchemy import select
-from typing import List
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from sqlalchemy import tuple_, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.future import select
+from datetime import datetime, time, timedelta
+from typing import List, Optional
 import uuid
 
-from backend.database import get_db
-from backend.models import User, CarePlan, Role, CarePlanStatus
-from backend.schemas import CarePlanResponse, CreateCarePlanSchema
+from backend.database import get_db, get_read_db
+from backend.models import User, CarePlan, CarePlanVersion, Role, CarePlanStatus, ClinicalAssignment
+from backend.schemas import (
+    CarePlanResponse, CreateCarePlanSchema, UpdateCarePlanSchema, DueReviewsResponse,
+    CarePlanVersionsResponse, CarePlanVersionResponse, CarePlanDiffResponse
+)
 from backend.auth import get_current_user
+from backend.repository import fetch_one, fetch_all, get_patient
+from backend.patient_summary import invalidate_patient_summary
+from backend.pagination import encode_cursor, decode_cursor
+from backend.care_plan_reviews import review_scheduler, OPEN_STATUSES
+from backend.care_plan_versions import plan_state, diff_states, new_version, load_version
 
 router = APIRouter(prefix="/api/v1/clinical/care-plans", tags=["care-plans"])
 
+@router.get("/reviews/due", response_model=DueReviewsResponse)
+async def get_due_reviews(
+    days: int = Query(7, ge=0, le=90),
+    cursor: Optional[str] = Query(None),
+    limit: int = Query(50, ge=1, le=100),
+    db: AsyncSession = Depends(get_read_db),
+    current_user: User = Depends(get_current_user)
+):
+    if current_user.role not in [Role.DOCTOR, Role.NURSE]:
+        raise HTTPException(status_code=403, detail="Only doctors and nurses can access this endpoint")
+
+    # Open plans of the clinician's assigned patients due within `days`, overdue first
+    today = datetime.utcnow().date()
+    my_patients = select(ClinicalAssignment.patientId).where(ClinicalAssignment.clinicianId == current_user.id)
+    query = (
+        select(CarePlan, User.firstName, User.lastName)
+        .join(User, User.id == CarePlan.patientId)
+        .where(
+            CarePlan.patientId.in_(my_patients),
+            CarePlan.status.in_(OPEN_STATUSES),
+            CarePlan.reviewDate <= today + timedelta(days=days)
+        )
+    )
+    if cursor:
+        cursor_date, cursor_id = decode_cursor(cursor)
+        query = query.where(tuple_(CarePlan.reviewDate, CarePlan.id) > tuple_(cursor_date.date(), cursor_id))
+
+    result = await db.execute(query.order_by(CarePlan.reviewDate, CarePlan.id).limit(limit + 1))
+    rows = result.all()
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        last = rows[-1].CarePlan
+        next_cursor = encode_cursor(datetime.combine(last.reviewDate, time()), last.id)
+    return {
+        "data": [
+            {"plan": row.CarePlan, "patientFirstName": row.firstName, "patientLastName": row.lastName, "overdue": row.CarePlan.reviewDate < today}
+            for row in rows
+        ],
+        "nextCursor": next_cursor
+    }
+
 @router.get("/{patient_id}", response_model=List[CarePlanResponse])
-def get_care_plans(
+async def get_care_plans(
     patient_id: uuid.UUID,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
     current_user: User = Depends(get_current_user)
 ):
     # Todo: permissions check
-    plans = db.scalars(
+    plans = await fetch_all(
+        db,
         select(CarePlan)
         .where(CarePlan.patientId == patient_id)
         .order_by(CarePlan.createdAt.desc())
-    ).all()
+    )
     return plans
 
 @router.post("/{patient_id}", response_model=CarePlanResponse)
-def create_care_plan(
+async def create_care_plan(
     patient_id: uuid.UUID,
     payload: CreateCarePlanSchema,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
     if current_user.role not in [Role.DOCTOR, Role.NURSE, Role.ADMIN]:
         raise HTTPException(status_code=403, detail="Not authorized to create care plans")
 
-    patient = db.scalar(select(User).where(User.id == patient_id, User.role == Role.PATIENT))
+    patient = await get_patient(db, patient_id)
     if not patient:
         raise HTTPException(status_code=404, detail="Patient not found")
 
@@ -48,6 +101,110 @@ def create_care_plan(
         notes=payload.notes
     )
     db.add(plan)
-    db.commit()
-    db.refresh(plan)
+    await db.flush()
+    db.add(new_version(plan.id, 1, current_user.id, plan_state(plan)))
+    await db.commit()
+    await db.refresh(plan)
+    invalidate_patient_summary(patient_id)
+    review_scheduler.schedule(plan)
+    return plan
+
+async def get_plan_for(db: AsyncSession, plan_id: uuid.UUID, user: User) -> CarePlan:
+    plan = await fetch_one(db, select(CarePlan).where(CarePlan.id == plan_id))
+    if not plan:
+        raise HTTPException(status_code=404, detail="Care plan not found")
+    if user.role not in [Role.DOCTOR, Role.NURSE, Role.ADMIN] and user.id != plan.patientId:
+        raise HTTPException(status_code=403, detail="Not authorized to view this care plan")
     return plan
+
+@router.patch("/plans/{plan_id}", response_model=CarePlanResponse)
+async def update_care_plan(
+    plan_id: uuid.UUID,
+    payload: UpdateCarePlanSchema,
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    if current_user.role not in [Role.DOCTOR, Role.NURSE, Role.ADMIN]:
+        raise HTTPException(status_code=403, detail="Not authorized to update care plans")
+
+    plan = await get_plan_for(db, plan_id, current_user)
+    expected = payload.expectedVersion if payload.expectedVersion is not None else plan.version
+    if expected != plan.version:
+        raise HTTPException(status_code=409, detail="VERSION_CONFLICT")
+
+    changes = payload.model_dump(exclude_unset=True, exclude={"expectedVersion"})
+    old_state = plan_state(plan)
+    new_state = {**old_state, **payload.model_dump(mode="json", exclude_unset=True, exclude={"expectedVersion"})}
+    if new_state == old_state:
+        return plan
+    if "reviewDate" in changes and new_state["reviewDate"] != old_state["reviewDate"]:
+        changes["reviewNotifiedAt"] = None
+
+    # Only applies if nobody else wrote a version since we read the plan
+    result = await db.execute(
+        update(CarePlan)
+        .where(CarePlan.id == plan_id, CarePlan.version == expected)
+        .values(**changes, version=expected + 1, updatedAt=datetime.utcnow())
+    )
+    if result.rowcount == 0:
+        await db.rollback()
+        raise HTTPException(status_code=409, detail="VERSION_CONFLICT")
+
+    # Plans created before versioning have no history yet; start it from their current state
+    has_history = await fetch_one(
+        db, select(CarePlanVersion.id).where(CarePlanVersion.planId == plan_id, CarePlanVersion.version == expected)
+    )
+    if has_history is None:
+        db.add(new_version(plan_id, expected, plan.authorId, old_state))
+    db.add(new_version(plan_id, expected + 1, current_user.id, new_state, previous=old_state))
+    await db.commit()
+    await db.refresh(plan)
+
+    invalidate_patient_summary(plan.patientId)
+    review_scheduler.schedule(plan)
+    return plan
+
+@router.get("/plans/{plan_id}/versions", response_model=CarePlanVersionsResponse)
+async def list_care_plan_versions(
+    plan_id: uuid.UUID,
+    db: AsyncSession = Depends(get_read_db),
+    current_user: User = Depends(get_current_user)
+):
+    await get_plan_for(db, plan_id, current_user)
+    result = await db.execute(
+        select(CarePlanVersion.version, CarePlanVersion.isSnapshot, CarePlanVersion.authorId, CarePlanVersion.createdAt)
+        .where(CarePlanVersion.planId == plan_id)
+        .order_by(CarePlanVersion.version.desc())
+    )
+    return {"data": [row._asdict() for row in result]}
+
+@router.get("/plans/{plan_id}/versions/{version}", response_model=CarePlanVersionResponse)
+async def get_care_plan_version(
+    plan_id: uuid.UUID,
+    version: int,
+    db: AsyncSession = Depends(get_read_db),
+    current_user: User = Depends(get_current_user)
+):
+    plan = await get_plan_for(db, plan_id, current_user)
+    state = await load_version(db, plan, version) if 1 <= version <= plan.version else None
+    if state is None:
+        raise HTTPException(status_code=404, detail="Version not found")
+    return {"version": version, "data": state}
+
+@router.get("/plans/{plan_id}/diff", response_model=CarePlanDiffResponse)
+async def diff_care_plan_versions(
+    plan_id: uuid.UUID,
+    from_version: int = Query(..., alias="from", ge=1),
+    to_version: Optional[int] = Query(None, alias="to", ge=1),
+    db: AsyncSession = Depends(get_read_db),
+    current_user: User = Depends(get_current_user)
+):
+    plan = await get_plan_for(db, plan_id, current_user)
+    to_version = to_version or plan.version
+    if from_version > plan.version or to_version > plan.version:
+        raise HTTPException(status_code=404, detail="Version not found")
+    old_state = await load_version(db, plan, from_version)
+    new_state = await load_version(db, plan, to_version)
+    if old_state is None or new_state is None:
+        raise HTTPException(status_code=404, detail="Version not found")
+    return {"fromVersion": from_version, "toVersion": to_version, "changes": diff_states(old_state, new_state)}
@@ -1,25 +1,27 @@
 from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
-from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.future import select
+from sqlalchemy.orm import selectinload
 from typing import List
 import uuid
 
-from backend.database import get_db
+from backend.database import get_db, get_read_db
 from backend.models import User, Role, CaregiverPatientLink, CaregiverPermission, FamilyRelationshipStatus, PatientProfile
 from backend.schemas import CaregiverPatientLinkResponse, LinkPatientSchema
 from backend.auth import get_current_user
+from backend.repository import fetch_one, fetch_all, get_patient, save
 
 router = APIRouter(prefix="/api/v1/caregivers", tags=["caregivers"])
 
-def require_caregiver(user: User = Depends(get_current_user)):
+async def require_caregiver(user: User = Depends(get_current_user)):
     if user.role != Role.CAREGIVER:
         raise HTTPException(status_code=403, detail="Only caregivers can access this endpoint")
     return user
 
 @router.post("/link-patient", response_model=CaregiverPatientLinkResponse)
-def link_to_patient(
+async def link_to_patient(
     payload: LinkPatientSchema,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_user: User = Depends(require_caregiver)
 ):
     try:
@@ -27,11 +29,11 @@ def link_to_patient(
     except ValueError:
         raise HTTPException(status_code=400, detail="Invalid invite code format. Must be patient UUID.")
 
-    patient = db.scalar(select(User).where(User.id == patient_id, User.role == Role.PATIENT))
+    patient = await get_patient(db, patient_id)
     if not patient:
         raise HTTPException(status_code=404, detail="Patient not found")
 
-    existing = db.scalar(select(CaregiverPatientLink).where(
+    existing = await fetch_one(db, select(CaregiverPatientLink).where(
         CaregiverPatientLink.caregiverId == current_user.id,
         CaregiverPatientLink.patientId == patient_id
     ))
@@ -44,20 +46,22 @@ def link_to_patient(
         permissions=[CaregiverPermission.MEDICAL_VIEW.value, CaregiverPermission.COMMUNICATION_ONLY.value],
         status=FamilyRelationshipStatus.ACTIVE
     )
-    db.add(link)
-    db.commit()
-    db.refresh(link)
-    return link
+    return await save(db, link)
 
 @router.get("/patients")
-def get_linked_patients(
-    db: Session = Depends(get_db),
+async def get_linked_patients(
+    db: AsyncSession = Depends(get_read_db),
     current_user: User = Depends(require_caregiver)
 ):
-    links = db.scalars(select(CaregiverPatientLink).where(
-        CaregiverPatientLink.caregiverId == current_user.id,
-        CaregiverPatientLink.status == FamilyRelationshipStatus.ACTIVE
-    )).all()
+    links = await fetch_all(
+        db,
+        select(CaregiverPatientLink)
+        .options(selectinload(CaregiverPatientLink.patient))
+        .where(
+            CaregiverPatientLink.caregiverId == current_user.id,
+            CaregiverPatientLink.status == FamilyRelationshipStatus.ACTIVE
+        )
+    )
     
     result = []
     for link in links:
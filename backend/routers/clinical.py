@@ -1,28 +1,39 @@
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
-from sqlalchemy import select
-from typing import List
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import insert
+from sqlalchemy.future import select
+from pydantic import ValidationError
+from datetime import datetime, timedelta
+from typing import List, Literal, Optional
 import uuid
 
-from backend.database import get_db
+from backend.config import settings
+from backend.database import get_db, get_read_db
 from backend.models import User, Role, ClinicalAssignment, VitalsRecord, ConsultationNote, Prescription, TimelineEvent, TimelineEventType
-from backend.schemas import ClinicalAssignmentResponse, CreateClinicalAssignmentSchema, VitalsRecordResponse, CreateVitalsRecordSchema, ConsultationNoteResponse, CreateConsultationNoteSchema, PrescriptionResponse, CreatePrescriptionSchema
+from backend.schemas import ClinicalAssignmentResponse, CreateClinicalAssignmentSchema, RosterResponse, VitalsRecordResponse, CreateVitalsRecordSchema, BulkVitalsReadingSchema, CreateBulkVitalsSchema, BulkVitalsItemResult, BulkVitalsResponse, VitalsAggregateResponse, ConsultationNoteResponse, CreateConsultationNoteSchema, PrescriptionResponse, CreatePrescriptionSchema
 from backend.auth import get_current_user
+from backend.repository import fetch_one, fetch_all, get_patient, save
+from backend.timeutils import naive_utc
+from backend.timeline_feed import publish_timeline_event
+from backend.vitals import aggregate_vitals, record_rollups, parse_blood_pressure
+from backend.anomaly import alert_events, observe_readings
+from backend.patient_summary import invalidate_patient_summary
+from backend.roster import get_roster
 
 router = APIRouter(prefix="/api/v1/clinical/tools", tags=["clinical-tools"])
 
-def require_clinician(user: User = Depends(get_current_user)):
+async def require_clinician(user: User = Depends(get_current_user)):
     if user.role not in [Role.DOCTOR, Role.NURSE]:
         raise HTTPException(status_code=403, detail="Only doctors and nurses can access this endpoint")
     return user
 
 @router.post("/assignments", response_model=ClinicalAssignmentResponse)
-def assign_patient(
+async def assign_patient(
     payload: CreateClinicalAssignmentSchema,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_user: User = Depends(require_clinician)
 ):
-    patient = db.scalar(select(User).where(User.id == payload.patientId, User.role == Role.PATIENT))
+    patient = await get_patient(db, payload.patientId)
     if not patient:
         raise HTTPException(status_code=404, detail="Patient not found")
         
@@ -31,36 +42,69 @@ def assign_patient(
         patientId=payload.patientId,
         roleContext=payload.roleContext
     )
-    db.add(assignment)
-    db.commit()
-    db.refresh(assignment)
-    return assignment
+    return await save(db, assignment)
 
 @router.get("/assignments/my-patients", response_model=List[ClinicalAssignmentResponse])
-def get_my_patients(
-    db: Session = Depends(get_db),
+async def get_my_patients(
+    db: AsyncSession = Depends(get_read_db),
     current_user: User = Depends(require_clinician)
 ):
-    assignments = db.scalars(select(ClinicalAssignment).where(ClinicalAssignment.clinicianId == current_user.id)).all()
+    assignments = await fetch_all(db, select(ClinicalAssignment).where(ClinicalAssignment.clinicianId == current_user.id))
     return assignments
 
+@router.get("/assignments/roster", response_model=RosterResponse)
+async def get_my_roster(
+    sort: Literal["name", "age", "lastVitals", "carePlanStatus", "unread", "assignedAt"] = Query("name"),
+    order: Literal["asc", "desc"] = Query("asc"),
+    limit: int = Query(50, ge=1, le=200),
+    offset: int = Query(0, ge=0),
+    db: AsyncSession = Depends(get_read_db),
+    current_user: User = Depends(require_clinician)
+):
+    entries, total = await get_roster(db, current_user.id, sort, order == "desc", limit, offset)
+    next_offset = offset + limit if offset + limit < total else None
+    return {"data": entries, "total": total, "nextOffset": next_offset}
+
+@router.post("/assignments/{assignment_id}/seen", response_model=ClinicalAssignmentResponse)
+async def mark_assignment_seen(
+    assignment_id: uuid.UUID,
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(require_clinician)
+):
+    assignment = await fetch_one(
+        db, select(ClinicalAssignment).where(ClinicalAssignment.id == assignment_id, ClinicalAssignment.clinicianId == current_user.id)
+    )
+    if not assignment:
+        raise HTTPException(status_code=404, detail="Assignment not found")
+    assignment.lastViewedAt = datetime.utcnow()
+    return await save(db, assignment)
+
 @router.post("/vitals", response_model=VitalsRecordResponse)
-def log_vitals(
+async def log_vitals(
     patient_id: uuid.UUID,
     payload: CreateVitalsRecordSchema,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_user: User = Depends(require_clinician)
 ):
+    systolic, diastolic = parse_blood_pressure(payload.bloodPressure)
     record = VitalsRecord(
         patientId=patient_id,
         recordedById=current_user.id,
         bloodPressure=payload.bloodPressure,
+        systolic=systolic,
+        diastolic=diastolic,
         heartRate=payload.heartRate,
         temperature=payload.temperature,
         oxygenSaturation=payload.oxygenSaturation
     )
     db.add(record)
-    db.flush() # get record id
+    await db.flush() # get record id
+    reading = {
+        **payload.model_dump(), "id": record.id, "systolic": systolic, "diastolic": diastolic, "recordedAt": record.recordedAt
+    }
+    await record_rollups(db, patient_id, [reading])
+    alerts = await alert_events(db, patient_id, current_user.id, [reading])
+    db.add_all(alerts)
     
     # Create timeline event
     event = TimelineEvent(
@@ -71,15 +115,91 @@ def log_vitals(
         relatedEntityId=record.id
     )
     db.add(event)
-    db.commit()
-    db.refresh(record)
+    await db.commit()
+    observe_readings(patient_id, [reading])
+    invalidate_patient_summary(patient_id)
+    await publish_timeline_event(event)
+    for alert in alerts:
+        await publish_timeline_event(alert)
+    await db.refresh(record)
     return record
 
+@router.post("/vitals/bulk", response_model=BulkVitalsResponse)
+async def log_vitals_bulk(
+    patient_id: uuid.UUID,
+    payload: CreateBulkVitalsSchema,
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(require_clinician)
+):
+    if len(payload.readings) > settings.VITALS_BULK_MAX_READINGS:
+        raise HTTPException(status_code=400, detail=f"At most {settings.VITALS_BULK_MAX_READINGS} readings per batch")
+    patient = await get_patient(db, patient_id)
+    if not patient:
+        raise HTTPException(status_code=404, detail="Patient not found")
+
+    now = datetime.utcnow()
+    rows, results = [], []
+    for index, item in enumerate(payload.readings):
+        try:
+            reading = BulkVitalsReadingSchema.model_validate(item)
+        except ValidationError as e:
+            errors = [f"{'.'.join(str(p) for p in err['loc'])}: {err['msg']}" for err in e.errors()]
+            results.append(BulkVitalsItemResult(index=index, status="invalid", errors=errors))
+            continue
+        row = reading.model_dump()
+        systolic, diastolic = parse_blood_pressure(reading.bloodPressure)
+        row.update(
+            id=uuid.uuid4(), patientId=patient_id, recordedById=current_user.id,
+            systolic=systolic, diastolic=diastolic, recordedAt=reading.recordedAt or now
+        )
+        rows.append(row)
+        results.append(BulkVitalsItemResult(index=index, status="created", id=row["id"]))
+
+    if rows:
+        # One multi-row INSERT for the readings and a single summarising timeline event
+        await db.execute(insert(VitalsRecord), rows)
+        await record_rollups(db, patient_id, rows)
+        alerts = await alert_events(db, patient_id, current_user.id, rows)
+        db.add_all(alerts)
+        recorded = [row["recordedAt"] for row in rows]
+        event = TimelineEvent(
+            patientId=patient_id,
+            authorId=current_user.id,
+            eventType=TimelineEventType.VITAL,
+            description=f"Vitals batch recorded: {len(rows)} readings from {min(recorded):%Y-%m-%d %H:%M} to {max(recorded):%Y-%m-%d %H:%M}"
+        )
+        db.add(event)
+        await db.commit()
+        observe_readings(patient_id, rows)
+        invalidate_patient_summary(patient_id)
+        await publish_timeline_event(event)
+        for alert in alerts:
+            await publish_timeline_event(alert)
+
+    return {"data": results, "created": len(rows), "rejected": len(results) - len(rows)}
+
+@router.get("/vitals/aggregate", response_model=VitalsAggregateResponse)
+async def get_vitals_aggregate(
+    patient_id: uuid.UUID,
+    interval: Literal["hour", "day", "week"] = Query("day"),
+    since: Optional[datetime] = Query(None),
+    until: Optional[datetime] = Query(None),
+    db: AsyncSession = Depends(get_read_db),
+    current_user: User = Depends(require_clinician)
+):
+    # Timestamps are stored as naive UTC
+    until = naive_utc(until) or datetime.utcnow()
+    since = naive_utc(since) or until - timedelta(days=30)
+    if since >= until:
+        raise HTTPException(status_code=400, detail="since must be before until")
+    buckets = await aggregate_vitals(db, patient_id, interval, since, until)
+    return {"data": buckets, "interval": interval}
+
 @router.post("/consultations", response_model=ConsultationNoteResponse)
-def log_consultation(
+async def log_consultation(
     patient_id: uuid.UUID,
     payload: CreateConsultationNoteSchema,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
     if current_user.role != Role.DOCTOR:
@@ -94,7 +214,7 @@ def log_consultation(
         plan=payload.plan
     )
     db.add(note)
-    db.flush()
+    await db.flush()
     
     event = TimelineEvent(
         patientId=patient_id,
@@ -104,15 +224,17 @@ def log_consultation(
         relatedEntityId=note.id
     )
     db.add(event)
-    db.commit()
-    db.refresh(note)
+    await db.commit()
+    invalidate_patient_summary(patient_id)
+    await publish_timeline_event(event)
+    await db.refresh(note)
     return note
 
 @router.post("/prescriptions", response_model=PrescriptionResponse)
-def issue_prescription(
+async def issue_prescription(
     patient_id: uuid.UUID,
     payload: CreatePrescriptionSchema,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
     if current_user.role != Role.DOCTOR:
@@ -127,7 +249,7 @@ def issue_prescription(
         durationDays=payload.durationDays
     )
     db.add(prescription)
-    db.flush()
+    await db.flush()
     
     event = TimelineEvent(
         patientId=patient_id,
@@ -137,6 +259,8 @@ def issue_prescription(
         relatedEntityId=prescription.id
     )
     db.add(event)
-    db.commit()
-    db.refresh(prescription)
+    await db.commit()
+    invalidate_patient_summary(patient_id)
+    await publish_timeline_event(event)
+    await db.refresh(prescription)
     return prescription
@@ -0,0 +1,28 @@
+from fastapi import APIRouter, Depends, Query
+from sqlalchemy.ext.asyncio import AsyncSession
+import uuid
+
+from backend.database import get_read_db
+from backend.models import User
+from backend.schemas import SearchResultsResponse
+from backend.search import search_patient_records
+from backend.routers.clinical import require_clinician
+
+router = APIRouter(prefix="/api/v1/clinical/patients", tags=["clinical-search"])
+
+@router.get("/{patient_id}/search", response_model=SearchResultsResponse)
+async def search_patient(
+    patient_id: uuid.UUID,
+    q: str = Query(..., min_length=1, max_length=200),
+    limit: int = Query(20, ge=1, le=100),
+    offset: int = Query(0, ge=0, le=1000),
+    db: AsyncSession = Depends(get_read_db),
+    current_user: User = Depends(require_clinician)
+):
+    # Ranked best match first; offset paging since ranks aren't stable keyset keys
+    hits = await search_patient_records(db, patient_id, q, limit + 1, offset)
+    next_offset = None
+    if len(hits) > limit:
+        hits = hits[:limit]
+        next_offset = offset + limit
+    return {"data": hits, "nextOffset": next_offset}
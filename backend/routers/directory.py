@@ -1,21 +1,28 @@
 from fastapi import APIRouter, Depends, HTTPException, Query
-from sqlalchemy.orm import Session
-from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.future import select
+from sqlalchemy.orm import selectinload
 from typing import List, Optional
 
-from backend.database import get_db
+from backend.database import get_read_db
 from backend.models import User, Role, DoctorProfile, HospitalProfile, VerificationStatus
 from backend.schemas import DoctorDirectoryResponse, HospitalDirectoryResponse
+from backend.repository import fetch_all
 
 router = APIRouter(prefix="/api/v1/directory", tags=["directory"])
 
 @router.get("/doctors", response_model=List[DoctorDirectoryResponse])
-def get_doctors_directory(
+async def get_doctors_directory(
     specialty: Optional[str] = Query(None),
     accepting_patients: bool = Query(True),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_read_db)
 ):
-    query = select(DoctorProfile).join(User).where(User.role == Role.DOCTOR, User.verificationStatus == VerificationStatus.VERIFIED)
+    query = (
+        select(DoctorProfile)
+        .join(User)
+        .options(selectinload(DoctorProfile.user))
+        .where(User.role == Role.DOCTOR, User.verificationStatus == VerificationStatus.APPROVED)
+    )
     
     if specialty:
         query = query.where(DoctorProfile.specialty.ilike(f"%{specialty}%"))
@@ -23,7 +30,7 @@ def get_doctors_directory(
     if accepting_patients:
         query = query.where(DoctorProfile.isAcceptingPatients == True)
         
-    profiles = db.scalars(query).all()
+    profiles = await fetch_all(db, query)
     
     # We need to map firstName and lastName from User to the response
     results = []
@@ -43,16 +50,16 @@ def get_doctors_directory(
 
 
 @router.get("/hospitals", response_model=List[HospitalDirectoryResponse])
-def get_hospitals_directory(
+async def get_hospitals_directory(
     palliative_care_only: bool = Query(False),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_read_db)
 ):
-    query = select(HospitalProfile).join(User).where(User.role == Role.HOSPITAL, User.verificationStatus == VerificationStatus.VERIFIED)
+    query = select(HospitalProfile).join(User).where(User.role == Role.HOSPITAL, User.verificationStatus == VerificationStatus.APPROVED)
     
     if palliative_care_only:
         query = query.where(HospitalProfile.palliativeCareUnit == True)
         
-    profiles = db.scalars(query).all()
+    profiles = await fetch_all(db, query)
     
     results = []
     for profile in profiles:
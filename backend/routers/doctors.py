@@ -5,7 +5,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
 from sqlalchemy.orm import selectinload
 
-from backend.database import get_db
+from backend.database import get_db, get_read_db
 from backend.models import User, DoctorProfile, Role, VerificationStatus
 from backend.schemas import UpdateDoctorProfileSchema, DoctorProfileResponse
 from backend.auth import get_current_user, require_role
@@ -14,7 +14,7 @@ from backend.audit import log_audit
 router = APIRouter(prefix="/doctors", tags=["doctors"])
 
 @router.get("")
-async def get_public_doctors(db: AsyncSession = Depends(get_db)):
+async def get_public_doctors(db: AsyncSession = Depends(get_read_db)):
     result = await db.execute(
         select(User)
         .options(selectinload(User.doctorProfile))
@@ -106,7 +106,7 @@ async def update_profile(
     return {"data": profile}
 
 @router.get("/{id}")
-async def get_public_doctor_profile(id: str, db: AsyncSession = Depends(get_db)):
+async def get_public_doctor_profile(id: str, db: AsyncSession = Depends(get_read_db)):
     try:
         doc_id = uuid.UUID(id)
     except ValueError:
@@ -8,7 +8,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
 from sqlalchemy.orm import selectinload
 
-from backend.database import get_db
+from backend.database import get_db, get_read_db
 from backend.models import User, FamilyRelationship, Role, FamilyRelationshipStatus
 from backend.schemas import FamilyRelationshipResponse
 from backend.auth import get_current_user, require_role
@@ -69,7 +69,7 @@ async def accept_invite(
 @router.get("/relationships")
 async def list_relationships(
     current_user: User = Depends(require_role(Role.FAMILY_MEMBER, Role.PATIENT)),
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_read_db)
 ):
     if current_user.role == Role.PATIENT:
         result = await db.execute(
@@ -135,7 +135,7 @@ async def list_relationships(
 async def get_relationship(
     id: str,
     current_user: User = Depends(require_role(Role.FAMILY_MEMBER, Role.PATIENT)),
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_read_db)
 ):
     try:
         rel_id = uuid.UUID(id)
@@ -0,0 +1,11 @@
+from fastapi import APIRouter, Depends
+
+from backend import metrics
+from backend.models import User, Role
+from backend.auth import require_role
+
+router = APIRouter(prefix="/api/v1/internal", tags=["internal"])
+
+@router.get("/metrics")
+async def get_metrics(current_user: User = Depends(require_role(Role.ADMIN))):
+    return {"data": metrics.snapshot()}
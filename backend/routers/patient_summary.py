@@ -0,0 +1,19 @@
+from fastapi import APIRouter, Depends, HTTPException
+import uuid
+
+from backend.models import User
+from backend.schemas import PatientSummaryResponse
+from backend.patient_summary import get_patient_summary
+from backend.routers.clinical import require_clinician
+
+router = APIRouter(prefix="/api/v1/clinical/patients", tags=["clinical-summary"])
+
+@router.get("/{patient_id}/summary", response_model=PatientSummaryResponse)
+async def get_summary(
+    patient_id: uuid.UUID,
+    current_user: User = Depends(require_clinician)
+):
+    summary = await get_patient_summary(patient_id)
+    if summary is None:
+        raise HTTPException(status_code=404, detail="Patient not found")
+    return {"data": summary}
@@ -1,21 +1,28 @@
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
-from sqlalchemy import select
-from typing import List
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from sqlalchemy import update
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.future import select
+from typing import List, Literal, Optional
 import uuid
 from datetime import datetime
 
-from backend.database import get_db
+from backend.config import settings
+from backend.database import get_db, get_read_db
 from backend.models import User, Role, ServiceRequest, ServiceRequestStatus, ServiceRequestType
-from backend.schemas import ServiceRequestResponse, CreateServiceRequestSchema, ClaimServiceRequestSchema, UpdateServiceRequestStatusSchema
+from backend.schemas import ServiceRequestResponse, ServiceRequestPageResponse, CreateServiceRequestSchema, ClaimServiceRequestSchema, UpdateServiceRequestStatusSchema
 from backend.auth import get_current_user
+from backend.repository import fetch_one, fetch_all, save
+from backend.pagination import encode_cursor, decode_cursor
+from backend.service_requests import feed_query, distance_km
+from backend.geo import zip_location, location_columns
+from backend.timeutils import naive_utc
 
 router = APIRouter(prefix="/api/v1/services", tags=["services"])
 
 @router.post("/requests", response_model=ServiceRequestResponse)
-def create_service_request(
+async def create_service_request(
     payload: CreateServiceRequestSchema,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
     if current_user.role not in [Role.PATIENT, Role.CAREGIVER, Role.HOSPITAL, Role.ADMIN]:
@@ -31,84 +38,104 @@ def create_service_request(
         description=payload.description,
         requestType=payload.requestType,
         status=ServiceRequestStatus.PENDING,
-        dueDate=payload.dueDate
+        dueDate=payload.dueDate,
+        **location_columns(current_user.zipCode)
     )
-    db.add(request)
-    db.commit()
-    db.refresh(request)
-    return request
+    return await save(db, request)
 
-@router.get("/requests", response_model=List[ServiceRequestResponse])
-def get_service_requests(
-    db: Session = Depends(get_db),
+@router.get("/requests", response_model=ServiceRequestPageResponse)
+async def get_service_requests(
+    cursor: Optional[str] = Query(None),
+    limit: int = Query(50, ge=1, le=100),
+    mine: bool = Query(False),
+    status: Optional[List[ServiceRequestStatus]] = Query(None),
+    requestType: Optional[List[ServiceRequestType]] = Query(None),
+    dueAfter: Optional[datetime] = Query(None),
+    dueBefore: Optional[datetime] = Query(None),
+    city: Optional[str] = Query(None),
+    radiusKm: Optional[float] = Query(None, gt=0, le=settings.GEO_MAX_RADIUS_KM),
+    zipCode: Optional[str] = Query(None),
+    sort: Literal["recent", "distance"] = Query("recent"),
+    db: AsyncSession = Depends(get_read_db),
     current_user: User = Depends(get_current_user)
 ):
-    if current_user.role == Role.VOLUNTEER:
-        # Volunteers see pending requests and their claimed requests
-        requests = db.scalars(
-            select(ServiceRequest).where(
-                (ServiceRequest.status == ServiceRequestStatus.PENDING) |
-                (ServiceRequest.volunteerId == current_user.id)
-            ).order_by(ServiceRequest.createdAt.desc())
-        ).all()
-        return requests
-    elif current_user.role == Role.ORGANIZATION:
-        # Organizations see pending requests and their claimed requests
-        requests = db.scalars(
-            select(ServiceRequest).where(
-                (ServiceRequest.status == ServiceRequestStatus.PENDING) |
-                (ServiceRequest.organizationId == current_user.id)
-            ).order_by(ServiceRequest.createdAt.desc())
-        ).all()
-        return requests
-    elif current_user.role == Role.PATIENT:
-        # Patients see their own requests
-        requests = db.scalars(
-            select(ServiceRequest).where(ServiceRequest.patientId == current_user.id).order_by(ServiceRequest.createdAt.desc())
-        ).all()
-        return requests
-    else:
-        # Admin or others can see all
-        requests = db.scalars(select(ServiceRequest).order_by(ServiceRequest.createdAt.desc())).all()
-        return requests
+    # Distances are measured from zipCode, defaulting to the caller's own
+    location = None
+    if radiusKm is not None or sort == "distance":
+        location = zip_location(zipCode or current_user.zipCode)
+        if location is None:
+            raise HTTPException(status_code=400, detail="A valid zip code is required to filter or sort by distance")
+    # Nearest-first lists the `limit` closest requests within the radius, without further pages
+    by_distance = sort == "distance"
+    if by_distance and cursor:
+        raise HTTPException(status_code=400, detail="INVALID_CURSOR")
+    near = (location[0], location[1], radiusKm or settings.GEO_MAX_RADIUS_KM) if location else None
+
+    # Volunteers and organizations see pending requests and their claimed ones (only
+    # the claimed ones with mine), patients their own, admins and others everything
+    requests = await fetch_all(db, feed_query(
+        current_user,
+        limit + 1,
+        cursor=decode_cursor(cursor) if cursor else None,
+        mine=mine,
+        statuses=status,
+        request_types=requestType,
+        due_after=naive_utc(dueAfter),
+        due_before=naive_utc(dueBefore),
+        city=city,
+        near=near,
+        by_distance=by_distance
+    ))
+    next_cursor = None
+    if len(requests) > limit:
+        requests = requests[:limit]
+        if not by_distance:
+            next_cursor = encode_cursor(requests[-1].createdAt, requests[-1].id)
+    if location:
+        requests = [
+            ServiceRequestResponse.model_validate(r).model_copy(update={"distanceKm": distance_km(r, *location)})
+            for r in requests
+        ]
+    return {"data": requests, "nextCursor": next_cursor}
 
 @router.patch("/requests/{request_id}/claim", response_model=ServiceRequestResponse)
-def claim_service_request(
+async def claim_service_request(
     request_id: uuid.UUID,
     payload: ClaimServiceRequestSchema,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
     if current_user.role not in [Role.VOLUNTEER, Role.ORGANIZATION]:
         raise HTTPException(status_code=403, detail="Only volunteers and organizations can claim requests")
 
-    req = db.scalar(select(ServiceRequest).where(ServiceRequest.id == request_id))
-    if not req:
-        raise HTTPException(status_code=404, detail="Request not found")
-        
-    if req.status != ServiceRequestStatus.PENDING:
-        raise HTTPException(status_code=400, detail="Request is already claimed or not pending")
+    claimant = {"volunteerId": current_user.id} if current_user.role == Role.VOLUNTEER else {"organizationId": current_user.id}
 
-    if current_user.role == Role.VOLUNTEER:
-        req.volunteerId = current_user.id
-    else:
-        req.organizationId = current_user.id
-        
-    req.status = ServiceRequestStatus.ASSIGNED
-    req.updatedAt = datetime.utcnow()
-    
-    db.commit()
-    db.refresh(req)
-    return req
+    # One conditional UPDATE: of many concurrent claims exactly one matches status = PENDING
+    result = await db.execute(
+        update(ServiceRequest)
+        .where(ServiceRequest.id == request_id, ServiceRequest.status == ServiceRequestStatus.PENDING)
+        .values(status=ServiceRequestStatus.ASSIGNED, updatedAt=datetime.utcnow(), **claimant)
+        .returning(ServiceRequest)
+        .execution_options(synchronize_session=False)
+    )
+    req = result.scalars().first()
+    await db.commit()
+    if req:
+        return req
+
+    exists = await fetch_one(db, select(ServiceRequest.id).where(ServiceRequest.id == request_id))
+    if not exists:
+        raise HTTPException(status_code=404, detail="Request not found")
+    raise HTTPException(status_code=409, detail="Request is already claimed or not pending")
 
 @router.patch("/requests/{request_id}/status", response_model=ServiceRequestResponse)
-def update_service_request_status(
+async def update_service_request_status(
     request_id: uuid.UUID,
     payload: UpdateServiceRequestStatusSchema,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
-    req = db.scalar(select(ServiceRequest).where(ServiceRequest.id == request_id))
+    req = await fetch_one(db, select(ServiceRequest).where(ServiceRequest.id == request_id))
     if not req:
         raise HTTPException(status_code=404, detail="Request not found")
         
@@ -119,6 +146,6 @@ def update_service_request_status(
     req.status = payload.status
     req.updatedAt = datetime.utcnow()
     
-    db.commit()
-    db.refresh(req)
+    await db.commit()
+    await db.refresh(req)
     return req
@@ -1,42 +1,89 @@
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
-from sqlalchemy import select
-from typing import List
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
+from fastapi.responses import StreamingResponse
+from sqlalchemy import tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.future import select
+from typing import List, Optional
+from datetime import datetime
 import uuid
 
-from backend.database import get_db
+from backend.database import get_db, get_read_db
 from backend.models import User, TimelineEvent, Role, TimelineEventType
-from backend.schemas import TimelineEventResponse, CreateTimelineEventSchema
+from backend.schemas import TimelineEventResponse, TimelinePageResponse, CreateTimelineEventSchema
 from backend.auth import get_current_user
+from backend.repository import fetch_all, get_patient, save
+from backend.pagination import encode_cursor, decode_cursor
+from backend.timeutils import naive_utc
+from backend.timeline_feed import event_stream, publish_timeline_event
+from backend.patient_summary import invalidate_patient_summary
 
 router = APIRouter(prefix="/api/v1/clinical/timeline", tags=["timeline"])
 
-@router.get("/{patient_id}", response_model=List[TimelineEventResponse])
-def get_timeline(
+@router.get("/{patient_id}", response_model=TimelinePageResponse)
+async def get_timeline(
     patient_id: uuid.UUID,
-    db: Session = Depends(get_db),
+    cursor: Optional[str] = Query(None),
+    limit: int = Query(50, ge=1, le=100),
+    eventType: Optional[List[TimelineEventType]] = Query(None),
+    since: Optional[datetime] = Query(None),
+    until: Optional[datetime] = Query(None),
+    db: AsyncSession = Depends(get_read_db),
     current_user: User = Depends(get_current_user)
 ):
     # Todo: Add permission checking (is doctor, nurse, linked caregiver, or the patient themselves)
-    events = db.scalars(
-        select(TimelineEvent)
-        .where(TimelineEvent.patientId == patient_id)
-        .order_by(TimelineEvent.timestamp.desc())
-    ).all()
-    return events
+    # Newest first, keyset-paginated on (timestamp, id) so each page is an index range scan
+    query = select(TimelineEvent).where(TimelineEvent.patientId == patient_id)
+    if eventType:
+        query = query.where(TimelineEvent.eventType.in_(eventType))
+    if since:
+        query = query.where(TimelineEvent.timestamp >= naive_utc(since))
+    if until:
+        query = query.where(TimelineEvent.timestamp < naive_utc(until))
+    if cursor:
+        cursor_timestamp, cursor_id = decode_cursor(cursor)
+        query = query.where(tuple_(TimelineEvent.timestamp, TimelineEvent.id) < tuple_(cursor_timestamp, cursor_id))
+
+    events = await fetch_all(
+        db,
+        query.order_by(TimelineEvent.timestamp.desc(), TimelineEvent.id.desc()).limit(limit + 1)
+    )
+    next_cursor = None
+    if len(events) > limit:
+        events = events[:limit]
+        next_cursor = encode_cursor(events[-1].timestamp, events[-1].id)
+    return {"data": events, "nextCursor": next_cursor}
+
+@router.get("/{patient_id}/stream")
+async def stream_timeline(
+    patient_id: uuid.UUID,
+    request: Request,
+    lastEventId: Optional[str] = Query(None),
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    # Server-Sent Events; browsers send Last-Event-ID on reconnect, other clients may pass ?lastEventId=
+    last_event_id = request.headers.get("last-event-id") or lastEventId
+    resume_from = decode_cursor(last_event_id) if last_event_id else None
+    # Release the auth lookup's connection instead of holding it for the life of the stream
+    await db.close()
+    return StreamingResponse(
+        event_stream(request, patient_id, resume_from),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
 
 @router.post("/{patient_id}", response_model=TimelineEventResponse)
-def add_timeline_event(
+async def add_timeline_event(
     patient_id: uuid.UUID,
     payload: CreateTimelineEventSchema,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
     # Allow doctors and nurses to add events
     if current_user.role not in [Role.DOCTOR, Role.NURSE, Role.ADMIN]:
         raise HTTPException(status_code=403, detail="Not authorized to add clinical timeline events")
 
-    patient = db.scalar(select(User).where(User.id == patient_id, User.role == Role.PATIENT))
+    patient = await get_patient(db, patient_id)
     if not patient:
         raise HTTPException(status_code=404, detail="Patient not found")
 
@@ -47,7 +94,7 @@ def add_timeline_event(
         description=payload.description,
         relatedEntityId=payload.relatedEntityId
     )
-    db.add(event)
-    db.commit()
-    db.refresh(event)
+    event = await save(db, event)
+    invalidate_patient_summary(patient_id)
+    await publish_timeline_event(event)
     return event
@@ -8,8 +8,9 @@ from sqlalchemy.future import select
 from backend.database import get_db
 from backend.models import User, Session, AccountStatus
 from backend.schemas import UpdateUserSchema, UserResponse
-from backend.auth import get_current_user, clear_auth_cookies
+from backend.auth import get_current_user, clear_auth_cookies, invalidate_principal
 from backend.audit import log_audit
+from backend.revocation import revoke_user_sessions
 
 router = APIRouter(prefix="/users", tags=["users"])
 
@@ -41,6 +42,7 @@ async def update_profile(
         {"targetId": str(current_user.id), "targetType": "USER"}
     )
     await db.commit()
+    invalidate_principal(current_user.id)
     # Refresh to ensure object is fully updated
     await db.refresh(current_user)
     
@@ -65,6 +67,7 @@ async def update_preferences(
             {"targetId": str(current_user.id), "targetType": "USER", "action": "Update Preferences"}
         )
         await db.commit()
+        invalidate_principal(current_user.id)
         await db.refresh(current_user)
 
     return {"data": current_user}
@@ -79,20 +82,19 @@ async def deactivate_account(
     current_user.accountStatus = AccountStatus.DEACTIVATED
     
     # Invalidate sessions
-    sessions_result = await db.execute(select(Session).where(Session.userId == current_user.id))
-    for s in sessions_result.scalars().all():
-        await db.delete(s)
-        
+    revoked = await revoke_user_sessions(db, current_user.id)
+
     await log_audit(
         db,
         current_user.id,
         "ACCOUNT_STATUS_CHANGED",
         request.client.host if request.client else None,
         request.headers.get("user-agent"),
-        {"targetId": str(current_user.id), "targetType": "USER", "newStatus": AccountStatus.DEACTIVATED.value}
+        {"targetId": str(current_user.id), "targetType": "USER", "newStatus": AccountStatus.DEACTIVATED.value, "sessionsRevoked": revoked}
     )
     
     await db.commit()
+    invalidate_principal(current_user.id)
     clear_auth_cookies(response)
     
     return {"message": "Account deactivated"}
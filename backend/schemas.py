@@ -1,9 +1,10 @@
 import re
 import uuid
-from typing import List, Optional
+from typing import Any, Dict, List, Optional
 from datetime import date, datetime
 from pydantic import BaseModel, EmailStr, Field, field_validator
 from backend.models import Role, AccountStatus, VerificationStatus, FamilyRelationshipStatus, CaregiverPermission, TimelineEventType, CarePlanStatus, ClinicalRoleContext, ServiceRequestType, ServiceRequestStatus
+from backend.timeutils import naive_utc
 
 # Password validation helper
 def check_password(v: str) -> str:
@@ -269,6 +270,10 @@ class TimelineEventResponse(BaseModel):
     class Config:
         from_attributes = True
 
+class TimelinePageResponse(BaseModel):
+    data: List[TimelineEventResponse]
+    nextCursor: Optional[str] = None
+
 class CarePlanResponse(BaseModel):
     id: uuid.UUID
     patientId: uuid.UUID
@@ -277,6 +282,7 @@ class CarePlanResponse(BaseModel):
     reviewDate: Optional[date] = None
     goals: Optional[List[str]] = None
     notes: Optional[str] = None
+    version: int = 1
     createdAt: datetime
     updatedAt: datetime
 
@@ -293,6 +299,60 @@ class CreateCarePlanSchema(BaseModel):
     goals: Optional[List[str]] = None
     notes: Optional[str] = None
 
+class UpdateCarePlanSchema(BaseModel):
+    status: Optional[CarePlanStatus] = None
+    reviewDate: Optional[date] = None
+    goals: Optional[List[str]] = None
+    notes: Optional[str] = None
+    # Rejects the update with 409 if the plan has moved on since this version was read
+    expectedVersion: Optional[int] = None
+
+    @field_validator("status")
+    @classmethod
+    def status_not_null(cls, v: Optional[CarePlanStatus]) -> CarePlanStatus:
+        # Omit status to leave it unchanged; a care plan always has one
+        if v is None:
+            raise ValueError("status cannot be null")
+        return v
+
+class CarePlanVersionInfo(BaseModel):
+    version: int
+    isSnapshot: bool
+    authorId: Optional[uuid.UUID] = None
+    createdAt: datetime
+
+    class Config:
+        from_attributes = True
+
+class CarePlanVersionsResponse(BaseModel):
+    data: List[CarePlanVersionInfo]
+
+class CarePlanState(BaseModel):
+    status: Optional[CarePlanStatus] = None
+    reviewDate: Optional[date] = None
+    goals: Optional[List[str]] = None
+    notes: Optional[str] = None
+
+class CarePlanVersionResponse(BaseModel):
+    version: int
+    data: CarePlanState
+
+class CarePlanDiffResponse(BaseModel):
+    fromVersion: int
+    toVersion: int
+    # field -> {"value": new} or {"ops": [[start, end, replacement], ...]} against `from`
+    changes: Dict[str, Any]
+
+class DueReview(BaseModel):
+    plan: CarePlanResponse
+    patientFirstName: str
+    patientLastName: str
+    overdue: bool
+
+class DueReviewsResponse(BaseModel):
+    data: List[DueReview]
+    nextCursor: Optional[str] = None
+
 class LinkPatientSchema(BaseModel):
     inviteCode: str
 
@@ -304,15 +364,36 @@ class ClinicalAssignmentResponse(BaseModel):
     roleContext: ClinicalRoleContext
     status: str
     assignedAt: datetime
+    lastViewedAt: Optional[datetime] = None
 
     class Config:
         from_attributes = True
 
+class RosterEntry(BaseModel):
+    assignmentId: uuid.UUID
+    patientId: uuid.UUID
+    firstName: str
+    lastName: str
+    age: Optional[int] = None
+    roleContext: ClinicalRoleContext
+    status: str
+    assignedAt: datetime
+    lastVitalsAt: Optional[datetime] = None
+    carePlanStatus: Optional[CarePlanStatus] = None
+    unreadCount: int
+
+class RosterResponse(BaseModel):
+    data: List[RosterEntry]
+    total: int
+    nextOffset: Optional[int] = None
+
 class VitalsRecordResponse(BaseModel):
     id: uuid.UUID
     patientId: uuid.UUID
     recordedById: Optional[uuid.UUID] = None
     bloodPressure: Optional[str] = None
+    systolic: Optional[int] = None
+    diastolic: Optional[int] = None
     heartRate: Optional[int] = None
     temperature: Optional[float] = None
     oxygenSaturation: Optional[int] = None
@@ -321,6 +402,25 @@ class VitalsRecordResponse(BaseModel):
     class Config:
         from_attributes = True
 
+class VitalsStat(BaseModel):
+    count: int = 0
+    min: Optional[float] = None
+    max: Optional[float] = None
+    mean: Optional[float] = None
+    last: Optional[float] = None
+
+class VitalsBucket(BaseModel):
+    bucket: datetime
+    heartRate: VitalsStat
+    temperature: VitalsStat
+    oxygenSaturation: VitalsStat
+    systolic: VitalsStat
+    diastolic: VitalsStat
+
+class VitalsAggregateResponse(BaseModel):
+    data: List[VitalsBucket]
+    interval: str
+
 class ConsultationNoteResponse(BaseModel):
     id: uuid.UUID
     patientId: uuid.UUID
@@ -347,6 +447,29 @@ class PrescriptionResponse(BaseModel):
     class Config:
         from_attributes = True
 
+class PatientSummary(BaseModel):
+    patientId: uuid.UUID
+    latestVitals: Optional[VitalsRecordResponse] = None
+    activePrescriptions: List[PrescriptionResponse]
+    currentCarePlan: Optional[CarePlanResponse] = None
+    lastConsultation: Optional[ConsultationNoteResponse] = None
+    timelineEventCount: int
+    generatedAt: datetime
+
+class PatientSummaryResponse(BaseModel):
+    data: PatientSummary
+
+class SearchHit(BaseModel):
+    sourceType: str  # CONSULTATION_NOTE or TIMELINE_EVENT
+    sourceId: uuid.UUID
+    occurredAt: datetime
+    snippet: str
+    score: float
+
+class SearchResultsResponse(BaseModel):
+    data: List[SearchHit]
+    nextOffset: Optional[int] = None
+
 class CreateClinicalAssignmentSchema(BaseModel):
     patientId: uuid.UUID
     roleContext: ClinicalRoleContext
@@ -357,6 +480,29 @@ class CreateVitalsRecordSchema(BaseModel):
     temperature: Optional[float] = None
     oxygenSaturation: Optional[int] = None
 
+class BulkVitalsReadingSchema(CreateVitalsRecordSchema):
+    recordedAt: Optional[datetime] = None
+
+    @field_validator("recordedAt")
+    @classmethod
+    def recorded_at_utc(cls, v: Optional[datetime]) -> Optional[datetime]:
+        return naive_utc(v)
+
+class CreateBulkVitalsSchema(BaseModel):
+    # Items are validated one by one so a bad reading doesn't reject the whole batch
+    readings: List[Dict[str, Any]] = Field(..., min_length=1)
+
+class BulkVitalsItemResult(BaseModel):
+    index: int
+    status: str
+    id: Optional[uuid.UUID] = None
+    errors: Optional[List[str]] = None
+
+class BulkVitalsResponse(BaseModel):
+    data: List[BulkVitalsItemResult]
+    created: int
+    rejected: int
+
 class CreateConsultationNoteSchema(BaseModel):
     subjective: Optional[str] = None
     objective: Optional[str] = None
@@ -382,10 +528,16 @@ class ServiceRequestResponse(BaseModel):
     dueDate: Optional[datetime] = None
     createdAt: datetime
     updatedAt: datetime
+    # Set when the listing was filtered or sorted by distance
+    distanceKm: Optional[float] = None
 
     class Config:
         from_attributes = True
 
+class ServiceRequestPageResponse(BaseModel):
+    data: List[ServiceRequestResponse]
+    nextCursor: Optional[str] = None
+
 class CreateServiceRequestSchema(BaseModel):
     title: str
     description: Optional[str] = None
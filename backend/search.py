@@ -0,0 +1,127 @@
+import uuid
+from datetime import datetime
+from typing import Any, Dict, List
+from sqlalchemy import event, text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from backend.database import Base
+
+# Patient-scoped full-text search over consultation notes and timeline descriptions.
+#
+# SQLite: one FTS5 table (clinical_search) fed by triggers on both source tables.
+# The patient is an indexed column holding a single token ("p<hex>"), so scoping
+# is part of the MATCH instead of a post-filter over every patient's hits.
+# Postgres: a generated tsvector column with a GIN index on each source table.
+# Either way the index is maintained by the database on every insert.
+
+NOTE_TEXT = "coalesce(new.subjective, '') || char(10) || coalesce(new.objective, '') || char(10) || coalesce(new.assessment, '') || char(10) || coalesce(new.plan, '')"
+
+SQLITE_DDL = [
+    "CREATE VIRTUAL TABLE IF NOT EXISTS clinical_search USING fts5("
+    "body, patientKey, sourceType UNINDEXED, sourceId UNINDEXED, occurredAt UNINDEXED, tokenize='porter unicode61')",
+    f"""CREATE TRIGGER IF NOT EXISTS consultation_notes_search_insert AFTER INSERT ON consultation_notes BEGIN
+        INSERT INTO clinical_search (body, patientKey, sourceType, sourceId, occurredAt)
+        VALUES ({NOTE_TEXT}, 'p' || new."patientId", 'CONSULTATION_NOTE', new.id, new."consultationDate");
+    END""",
+    """CREATE TRIGGER IF NOT EXISTS consultation_notes_search_delete AFTER DELETE ON consultation_notes BEGIN
+        DELETE FROM clinical_search WHERE clinical_search MATCH 'patientKey:p' || old."patientId" AND sourceId = old.id;
+    END""",
+    """CREATE TRIGGER IF NOT EXISTS timeline_events_search_insert AFTER INSERT ON timeline_events BEGIN
+        INSERT INTO clinical_search (body, patientKey, sourceType, sourceId, occurredAt)
+        VALUES (new.description, 'p' || new."patientId", 'TIMELINE_EVENT', new.id, new."timestamp");
+    END""",
+    """CREATE TRIGGER IF NOT EXISTS timeline_events_search_delete AFTER DELETE ON timeline_events BEGIN
+        DELETE FROM clinical_search WHERE clinical_search MATCH 'patientKey:p' || old."patientId" AND sourceId = old.id;
+    END""",
+]
+
+POSTGRES_DDL = [
+    """ALTER TABLE consultation_notes ADD COLUMN IF NOT EXISTS "searchVector" tsvector GENERATED ALWAYS AS (
+        to_tsvector('english', concat_ws(' ', subjective, objective, assessment, plan))) STORED""",
+    'CREATE INDEX IF NOT EXISTS idx_consultation_notes_searchVector ON consultation_notes USING GIN ("searchVector")',
+    """ALTER TABLE timeline_events ADD COLUMN IF NOT EXISTS "searchVector" tsvector GENERATED ALWAYS AS (
+        to_tsvector('english', coalesce(description, ''))) STORED""",
+    'CREATE INDEX IF NOT EXISTS idx_timeline_events_searchVector ON timeline_events USING GIN ("searchVector")',
+]
+
+@event.listens_for(Base.metadata, "after_create")
+def _create_search_index(target, connection, **kw):
+    if connection.dialect.name == "sqlite":
+        statements = SQLITE_DDL
+    elif connection.dialect.name == "postgresql":
+        statements = POSTGRES_DDL
+    else:
+        return
+    for statement in statements:
+        connection.exec_driver_sql(statement)
+
+SQLITE_SEARCH = text("""
+    SELECT sourceType, sourceId, occurredAt,
+           snippet(clinical_search, 0, '<mark>', '</mark>', '…', 24) AS snippet,
+           bm25(clinical_search) AS rank
+    FROM clinical_search
+    WHERE clinical_search MATCH :match
+    ORDER BY rank, occurredAt DESC
+    LIMIT :limit OFFSET :offset
+""")
+
+POSTGRES_SEARCH = text("""
+    WITH query AS (SELECT websearch_to_tsquery('english', :q) AS q),
+    hits AS (
+        SELECT 'CONSULTATION_NOTE' AS "sourceType", n.id AS "sourceId", n."consultationDate" AS "occurredAt",
+               concat_ws(E'\\n', n.subjective, n.objective, n.assessment, n.plan) AS body,
+               ts_rank(n."searchVector", query.q) AS rank
+        FROM consultation_notes n, query
+        WHERE n."patientId" = :patient_id AND n."searchVector" @@ query.q
+        UNION ALL
+        SELECT 'TIMELINE_EVENT', e.id, e."timestamp", e.description, ts_rank(e."searchVector", query.q)
+        FROM timeline_events e, query
+        WHERE e."patientId" = :patient_id AND e."searchVector" @@ query.q
+        ORDER BY rank DESC, "occurredAt" DESC
+        LIMIT :limit OFFSET :offset
+    )
+    -- ts_headline is costly, so it only runs for the rows on this page
+    SELECT "sourceType", "sourceId", "occurredAt",
+           ts_headline('english', body, query.q, 'StartSel=<mark>, StopSel=</mark>, MaxFragments=2, MaxWords=24') AS snippet,
+           -rank AS rank
+    FROM hits, query
+    ORDER BY rank, "occurredAt" DESC
+""")
+
+def fts5_query(q: str) -> str:
+    # Quote every term so user input can't hit FTS5 query syntax; the last term
+    # also matches as a prefix so results narrow while typing.
+    terms = [term.replace('"', '""') for term in q.split()]
+    if not terms:
+        return ""
+    return " ".join(f'"{term}"' for term in terms) + "*"
+
+async def search_patient_records(
+    db: AsyncSession,
+    patient_id: uuid.UUID,
+    q: str,
+    limit: int,
+    offset: int
+) -> List[Dict[str, Any]]:
+    dialect = db.bind.dialect.name
+    if dialect == "postgresql":
+        result = await db.execute(POSTGRES_SEARCH, {"q": q, "patient_id": patient_id, "limit": limit, "offset": offset})
+    else:
+        match = fts5_query(q)
+        if not match:
+            return []
+        result = await db.execute(SQLITE_SEARCH, {
+            "match": f"patientKey:p{patient_id.hex} AND body:({match})", "limit": limit, "offset": offset
+        })
+
+    hits = []
+    for row in result.mappings():
+        occurred_at = row["occurredAt"]
+        hits.append({
+            "sourceType": row["sourceType"],
+            "sourceId": uuid.UUID(str(row["sourceId"])),
+            "occurredAt": occurred_at if isinstance(occurred_at, datetime) else datetime.fromisoformat(occurred_at),
+            "snippet": row["snippet"],
+            "score": round(-float(row["rank"]), 4),
+        })
+    return hits
@@ -0,0 +1,103 @@
+import uuid
+from datetime import datetime
+from typing import List, Optional, Tuple
+from sqlalchemy import exists, tuple_, union_all
+from sqlalchemy.orm import aliased
+from sqlalchemy.future import select
+from sqlalchemy.sql import Select
+
+from backend.geo import cells_within, chord_squared, chord_to_km, unit_vector
+from backend.models import User, Role, ServiceRequest, ServiceRequestStatus, ServiceRequestType
+
+# The service-request feed, newest first and keyset-paginated on (createdAt, id).
+# Each audience reads one index: patients (patientId, createdAt), admins (createdAt).
+# Volunteers and organizations see "pending or mine"; rather than an OR, which a
+# planner may answer by walking createdAt and filtering, the two halves are separate
+# index range scans of at most limit + 1 rows each, merged by a UNION ALL.
+#
+# `mine` narrows volunteers and organizations to the requests they claimed, any
+# status, on their claimant index alone.
+#
+# With `near` (latitude, longitude, radius km) rows are restricted to the grid cells
+# around the point and then to the exact radius; `by_distance` orders nearest first.
+
+Near = Tuple[float, float, float]
+
+def _chord_sq(entity, point: Tuple[float, float, float]):
+    x, y, z = point
+    return (entity.geoX - x) * (entity.geoX - x) + (entity.geoY - y) * (entity.geoY - y) + (entity.geoZ - z) * (entity.geoZ - z)
+
+def _filtered(
+    query: Select,
+    statuses: Optional[List[ServiceRequestStatus]],
+    request_types: Optional[List[ServiceRequestType]],
+    due_after: Optional[datetime],
+    due_before: Optional[datetime],
+    city: Optional[str],
+    near: Optional[Near],
+    cursor: Optional[Tuple[datetime, uuid.UUID]]
+) -> Select:
+    if statuses:
+        query = query.where(ServiceRequest.status.in_(statuses))
+    if request_types:
+        query = query.where(ServiceRequest.requestType.in_(request_types))
+    if due_after:
+        query = query.where(ServiceRequest.dueDate >= due_after)
+    if due_before:
+        query = query.where(ServiceRequest.dueDate < due_before)
+    if city:
+        # Checked per row by primary key, so the feed keeps walking its createdAt index
+        query = query.where(exists().where(User.id == ServiceRequest.patientId, User.city == city))
+    if near:
+        latitude, longitude, radius_km = near
+        query = query.where(
+            ServiceRequest.geoCell.in_(cells_within(latitude, longitude, radius_km)),
+            _chord_sq(ServiceRequest, unit_vector(latitude, longitude)) <= chord_squared(radius_km)
+        )
+    if cursor:
+        query = query.where(tuple_(ServiceRequest.createdAt, ServiceRequest.id) < tuple_(*cursor))
+    return query
+
+def _ordered(query: Select, entity, limit: int, near: Optional[Near], by_distance: bool) -> Select:
+    nearest = [_chord_sq(entity, unit_vector(near[0], near[1]))] if near and by_distance else []
+    return query.order_by(*nearest, entity.createdAt.desc(), entity.id.desc()).limit(limit)
+
+def feed_query(
+    user: User,
+    limit: int,
+    cursor: Optional[Tuple[datetime, uuid.UUID]] = None,
+    mine: bool = False,
+    statuses: Optional[List[ServiceRequestStatus]] = None,
+    request_types: Optional[List[ServiceRequestType]] = None,
+    due_after: Optional[datetime] = None,
+    due_before: Optional[datetime] = None,
+    city: Optional[str] = None,
+    near: Optional[Near] = None,
+    by_distance: bool = False
+) -> Select:
+    """Up to `limit` ServiceRequest rows of the caller's feed after `cursor`."""
+    filters = (statuses, request_types, due_after, due_before, city, near, cursor)
+    base = select(ServiceRequest)
+
+    if user.role in [Role.VOLUNTEER, Role.ORGANIZATION]:
+        claimant = ServiceRequest.volunteerId if user.role == Role.VOLUNTEER else ServiceRequest.organizationId
+        if mine:
+            return _ordered(_filtered(base.where(claimant == user.id), *filters), ServiceRequest, limit, near, by_distance)
+        pending = _filtered(base.where(ServiceRequest.status == ServiceRequestStatus.PENDING), *filters)
+        # Own requests that went back to PENDING are already in the first half
+        mine = _filtered(base.where(claimant == user.id, ServiceRequest.status != ServiceRequestStatus.PENDING), *filters)
+        merged = union_all(
+            select(_ordered(pending, ServiceRequest, limit, near, by_distance).subquery()),
+            select(_ordered(mine, ServiceRequest, limit, near, by_distance).subquery())
+        ).subquery()
+        feed = aliased(ServiceRequest, merged)
+        return _ordered(select(feed), feed, limit, near, by_distance)
+
+    if user.role == Role.PATIENT:
+        base = base.where(ServiceRequest.patientId == user.id)
+    return _ordered(_filtered(base, *filters), ServiceRequest, limit, near, by_distance)
+
+def distance_km(request: ServiceRequest, latitude: float, longitude: float) -> Optional[float]:
+    if request.geoX is None:
+        return None
+    return round(chord_to_km(_chord_sq(request, unit_vector(latitude, longitude))), 2)
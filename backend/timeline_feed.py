@@ -0,0 +1,79 @@
+import json
+import uuid
+import asyncio
+from datetime import datetime
+from typing import AsyncIterator, Dict, Any, Optional, Set, Tuple
+from fastapi import Request
+from sqlalchemy import tuple_
+from sqlalchemy.future import select
+
+from backend import pubsub
+from backend.config import settings
+from backend.database import ReadOnlySessionLocal
+from backend.models import TimelineEvent
+from backend.schemas import TimelineEventResponse
+from backend.pagination import encode_cursor
+
+# Live timeline push. Writers publish each new TimelineEvent after commit; the SSE
+# stream sends it to subscribers with the keyset cursor as the event id, so a
+# reconnecting client's Last-Event-ID resumes exactly where it stopped.
+
+def timeline_channel(patient_id: uuid.UUID) -> str:
+    return f"timeline:{patient_id}"
+
+async def publish_timeline_event(event: TimelineEvent):
+    payload = TimelineEventResponse.model_validate(event).model_dump(mode="json")
+    await pubsub.publish(timeline_channel(event.patientId), payload)
+
+def _format(payload: Dict[str, Any]) -> str:
+    event_id = encode_cursor(datetime.fromisoformat(payload["timestamp"]), uuid.UUID(payload["id"]))
+    return f"id: {event_id}\nevent: timeline\ndata: {json.dumps(payload)}\n\n"
+
+RESYNC = "event: resync\ndata: {}\n\n"
+
+async def event_stream(
+    request: Request,
+    patient_id: uuid.UUID,
+    resume_from: Optional[Tuple[datetime, uuid.UUID]] = None
+) -> AsyncIterator[str]:
+    # Subscribe before reading the backlog so nothing written in between is lost
+    sub = pubsub.hub.subscribe(timeline_channel(patient_id))
+    try:
+        sent: Set[str] = set()
+        if resume_from:
+            async with ReadOnlySessionLocal() as db:
+                result = await db.execute(
+                    select(TimelineEvent)
+                    .where(
+                        TimelineEvent.patientId == patient_id,
+                        tuple_(TimelineEvent.timestamp, TimelineEvent.id) > tuple_(*resume_from)
+                    )
+                    .order_by(TimelineEvent.timestamp, TimelineEvent.id)
+                    .limit(settings.TIMELINE_STREAM_RESUME_LIMIT)
+                )
+                backlog = result.scalars().all()
+            if len(backlog) >= settings.TIMELINE_STREAM_RESUME_LIMIT:
+                # Too far behind to replay; the client should refetch the timeline page
+                yield RESYNC
+                return
+            for event in backlog:
+                payload = TimelineEventResponse.model_validate(event).model_dump(mode="json")
+                sent.add(payload["id"])
+                yield _format(payload)
+
+        while True:
+            if sub.overflowed and sub.queue.empty():
+                yield RESYNC
+                return
+            try:
+                payload = await asyncio.wait_for(sub.queue.get(), settings.TIMELINE_STREAM_HEARTBEAT_SECONDS)
+            except asyncio.TimeoutError:
+                if await request.is_disconnected():
+                    return
+                yield ": keep-alive\n\n"
+                continue
+            if payload["id"] in sent:
+                continue
+            yield _format(payload)
+    finally:
+        pubsub.hub.unsubscribe(sub)
@@ -0,0 +1,9 @@
+from datetime import datetime, timezone
+from typing import Optional
+
+# Timestamp columns are naive UTC; client-supplied datetimes may carry an offset.
+
+def naive_utc(value: Optional[datetime]) -> Optional[datetime]:
+    if value is not None and value.tzinfo is not None:
+        return value.astimezone(timezone.utc).replace(tzinfo=None)
+    return value
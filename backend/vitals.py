@@ -0,0 +1,150 @@
+import re
+import uuid
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+from sqlalchemy import and_, case, func
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.future import select
+
+from backend.models import VitalsRollup
+
+# Vitals trends are served from hourly and daily rollups (vitals_rollups) that the
+# write paths keep current with an upsert. Hourly charts read the hourly rows; daily
+# and weekly charts re-aggregate the daily rows in SQL, so a year of readings is a
+# couple of thousand rows regardless of how many readings the devices sent.
+
+METRICS = ("heartRate", "temperature", "oxygenSaturation", "systolic", "diastolic")
+INTERVALS = ("hour", "day", "week")
+RESOLUTIONS = ("hour", "day")
+
+_BLOOD_PRESSURE = re.compile(r"^\s*(\d{2,3})\s*/\s*(\d{2,3})\s*$")
+
+def parse_blood_pressure(value: Optional[str]) -> Tuple[Optional[int], Optional[int]]:
+    match = _BLOOD_PRESSURE.match(value or "")
+    if not match:
+        return None, None
+    return int(match.group(1)), int(match.group(2))
+
+def metric_values(reading: Dict[str, Any]) -> Dict[str, Any]:
+    return {metric: reading[metric] for metric in METRICS if reading.get(metric) is not None}
+
+def truncate(value: datetime, resolution: str) -> datetime:
+    value = value.replace(minute=0, second=0, microsecond=0)
+    return value.replace(hour=0) if resolution == "day" else value
+
+def _rollup_rows(patient_id: uuid.UUID, readings: Iterable[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    rollups: Dict[Tuple[str, datetime, str], Dict[str, Any]] = {}
+    for reading in readings:
+        recorded_at = reading["recordedAt"]
+        for metric, value in metric_values(reading).items():
+            for resolution in RESOLUTIONS:
+                bucket_start = truncate(recorded_at, resolution)
+                rollup = rollups.get((resolution, bucket_start, metric))
+                if rollup is None:
+                    rollups[(resolution, bucket_start, metric)] = {
+                        "patientId": patient_id, "resolution": resolution, "bucketStart": bucket_start,
+                        "metric": metric, "readingCount": 1, "total": value, "minValue": value,
+                        "maxValue": value, "lastValue": value, "lastAt": recorded_at,
+                    }
+                    continue
+                rollup["readingCount"] += 1
+                rollup["total"] += value
+                rollup["minValue"] = min(rollup["minValue"], value)
+                rollup["maxValue"] = max(rollup["maxValue"], value)
+                if recorded_at >= rollup["lastAt"]:
+                    rollup["lastValue"], rollup["lastAt"] = value, recorded_at
+    return list(rollups.values())
+
+async def record_rollups(db: AsyncSession, patient_id: uuid.UUID, readings: Iterable[Dict[str, Any]]):
+    """Fold new readings (dicts with recordedAt and the VitalsRecord value columns,
+    including the parsed systolic/diastolic) into the rollups, inside the caller's transaction."""
+    rows = _rollup_rows(patient_id, readings)
+    if not rows:
+        return
+    dialect_insert = postgresql.insert if db.bind.dialect.name == "postgresql" else sqlite.insert
+    stmt = dialect_insert(VitalsRollup)
+    new = stmt.excluded
+    stmt = stmt.on_conflict_do_update(
+        index_elements=["patientId", "resolution", "bucketStart", "metric"],
+        set_={
+            "readingCount": VitalsRollup.readingCount + new.readingCount,
+            "total": VitalsRollup.total + new.total,
+            "minValue": case((new.minValue < VitalsRollup.minValue, new.minValue), else_=VitalsRollup.minValue),
+            "maxValue": case((new.maxValue > VitalsRollup.maxValue, new.maxValue), else_=VitalsRollup.maxValue),
+            "lastValue": case((new.lastAt >= VitalsRollup.lastAt, new.lastValue), else_=VitalsRollup.lastValue),
+            "lastAt": case((new.lastAt >= VitalsRollup.lastAt, new.lastAt), else_=VitalsRollup.lastAt),
+        }
+    )
+    await db.execute(stmt, rows)
+
+def _bucket(dialect: str, interval: str):
+    bucket_start = VitalsRollup.bucketStart
+    if interval in RESOLUTIONS:
+        return bucket_start
+    if dialect == "postgresql":
+        return func.date_trunc(interval, bucket_start)
+    return func.date(bucket_start, "weekday 0", "-6 days")  # Monday of the week
+
+def _bucket_start(value: Any) -> datetime:
+    return value if isinstance(value, datetime) else datetime.fromisoformat(value)
+
+def _empty_stat() -> Dict[str, Any]:
+    return {"count": 0, "min": None, "max": None, "mean": None, "last": None}
+
+async def aggregate_vitals(
+    db: AsyncSession,
+    patient_id: uuid.UUID,
+    interval: str,
+    since: datetime,
+    until: datetime
+) -> List[Dict[str, Any]]:
+    """min/max/mean/last per metric per bucket. Ranges are widened to whole hours
+    for hourly buckets and whole days otherwise."""
+    resolution = "hour" if interval == "hour" else "day"
+    bucket = _bucket(db.bind.dialect.name, interval).label("bucket")
+    grouped = (
+        select(
+            VitalsRollup.metric,
+            bucket,
+            func.sum(VitalsRollup.readingCount).label("count"),
+            func.sum(VitalsRollup.total).label("total"),
+            func.min(VitalsRollup.minValue).label("min"),
+            func.max(VitalsRollup.maxValue).label("max"),
+            func.max(VitalsRollup.bucketStart).label("lastBucket"),
+        )
+        .where(
+            VitalsRollup.patientId == patient_id,
+            VitalsRollup.resolution == resolution,
+            VitalsRollup.bucketStart >= truncate(since, resolution),
+            VitalsRollup.bucketStart < until
+        )
+        .group_by(VitalsRollup.metric, bucket)
+        .subquery()
+    )
+    # A bucket's last value is the last value of its latest rollup row: one PK lookup per group
+    latest = VitalsRollup.__table__.alias("latest")
+    result = await db.execute(
+        select(grouped, latest.c.lastValue)
+        .join(latest, and_(
+            latest.c.patientId == patient_id,
+            latest.c.resolution == resolution,
+            latest.c.bucketStart == grouped.c.lastBucket,
+            latest.c.metric == grouped.c.metric
+        ))
+        .order_by(grouped.c.bucket)
+    )
+
+    buckets: Dict[Any, Dict[str, Any]] = {}
+    for row in result.mappings():
+        item = buckets.get(row["bucket"])
+        if item is None:
+            item = buckets[row["bucket"]] = {"bucket": _bucket_start(row["bucket"]), **{m: _empty_stat() for m in METRICS}}
+        item[row["metric"]] = {
+            "count": row["count"],
+            "min": row["min"],
+            "max": row["max"],
+            "mean": round(row["total"] / row["count"], 2),
+            "last": row["lastValue"],
+        }
+    return list(buckets.values())
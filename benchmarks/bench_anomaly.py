@@ -0,0 +1,85 @@
+"""Scoring throughput of the streaming vitals anomaly detector, its memory per
+patient, and the time to rebuild state from vitals_records.
+
+    python -m benchmarks.bench_anomaly
+"""
+import os
+import sys
+import time
+import random
+import asyncio
+import tempfile
+import uuid
+from datetime import datetime, timedelta
+
+_db_path = os.path.join(tempfile.mkdtemp(), "bench.db")
+os.environ["DATABASE_URL"] = f"sqlite:///{_db_path}"
+
+from sqlalchemy import insert
+
+from backend.database import engine, Base, AsyncSessionLocal
+from backend.models import User, Role, AccountStatus, VitalsRecord
+from backend.anomaly import AnomalyDetector
+
+PATIENTS = 1000
+READINGS = 200_000
+REBUILD_READINGS = 100_000
+
+
+def reading():
+    return {
+        "heartRate": random.randint(60, 90),
+        "temperature": round(random.uniform(36.4, 37.4), 1),
+        "oxygenSaturation": random.randint(94, 99),
+        "systolic": random.randint(110, 140),
+        "diastolic": random.randint(70, 90),
+    }
+
+
+def bench_scoring():
+    detector = AnomalyDetector()
+    detector.ready = True
+    patients = [uuid.uuid4() for _ in range(PATIENTS)]
+    stream = [(random.choice(patients), reading()) for _ in range(READINGS)]
+    start = time.perf_counter()
+    alerts = 0
+    for patient_id, values in stream:
+        state = detector._patient_state(patient_id)
+        alerts += len(detector.score(state, values))
+        detector.fold(state, values)
+    elapsed = time.perf_counter() - start
+    state = next(iter(detector._state.values()))
+    print(f"scoring: {READINGS / elapsed:,.0f} readings/s over {PATIENTS} patients ({alerts} alerts)")
+    print(f"state:   {sys.getsizeof(state)} bytes per patient")
+
+
+async def bench_rebuild():
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    async with AsyncSessionLocal() as db:
+        patients = [
+            User(email=f"p{i}@bench", passwordHash="x", firstName="P", lastName="B", role=Role.PATIENT, accountStatus=AccountStatus.ACTIVE)
+            for i in range(100)
+        ]
+        db.add_all(patients)
+        await db.flush()
+        now = datetime(2026, 1, 1)
+        rows = [
+            {"id": uuid.uuid4(), "patientId": patients[i % len(patients)].id, "recordedAt": now + timedelta(minutes=i), **reading()}
+            for i in range(REBUILD_READINGS)
+        ]
+        for offset in range(0, len(rows), 5000):
+            await db.execute(insert(VitalsRecord), rows[offset:offset + 5000])
+        await db.commit()
+
+    detector = AnomalyDetector()
+    start = time.perf_counter()
+    await detector.rebuild()
+    elapsed = time.perf_counter() - start
+    print(f"rebuild: {REBUILD_READINGS:,} readings in {elapsed:.2f}s ({REBUILD_READINGS / elapsed:,.0f} readings/s)")
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    bench_scoring()
+    asyncio.run(bench_rebuild())
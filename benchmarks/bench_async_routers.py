@@ -0,0 +1,80 @@
+"""Throughput of the ported clinical/services routers under concurrent load.
+
+The handlers are native coroutines, so throughput should track event-loop
+concurrency and stay flat when Starlette's threadpool is shrunk to 1 token.
+
+    python -m benchmarks.bench_async_routers
+"""
+import os
+import time
+import asyncio
+import tempfile
+
+_db_path = os.path.join(tempfile.mkdtemp(), "bench.db")
+os.environ["DATABASE_URL"] = f"sqlite:///{_db_path}"
+
+import anyio.to_thread
+import httpx
+
+from backend.main import app
+from backend.database import engine, Base, AsyncSessionLocal
+from backend.models import User, Role, AccountStatus, TimelineEvent, TimelineEventType
+from backend.auth import create_access_token
+
+REQUESTS = 2000
+ENDPOINTS = [
+    "/api/v1/clinical/timeline/{patient_id}",
+    "/api/v1/clinical/care-plans/{patient_id}",
+    "/api/v1/services/requests",
+]
+
+
+async def seed():
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    async with AsyncSessionLocal() as db:
+        doctor = User(email="doc@bench", passwordHash="x", firstName="D", lastName="B", role=Role.DOCTOR, accountStatus=AccountStatus.ACTIVE)
+        patient = User(email="pat@bench", passwordHash="x", firstName="P", lastName="B", role=Role.PATIENT, accountStatus=AccountStatus.ACTIVE)
+        db.add_all([doctor, patient])
+        await db.flush()
+        db.add_all([
+            TimelineEvent(patientId=patient.id, authorId=doctor.id, eventType=TimelineEventType.VITAL, description=f"event {i}")
+            for i in range(50)
+        ])
+        await db.commit()
+        return doctor, patient
+
+
+async def run(client, paths, concurrency):
+    queue = asyncio.Queue()
+    for i in range(REQUESTS):
+        queue.put_nowait(paths[i % len(paths)])
+
+    async def worker():
+        while not queue.empty():
+            response = await client.get(queue.get_nowait())
+            assert response.status_code == 200, response.text
+
+    start = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return REQUESTS / (time.perf_counter() - start)
+
+
+async def main():
+    doctor, patient = await seed()
+    paths = [p.format(patient_id=patient.id) for p in ENDPOINTS]
+    cookies = {"access_token": create_access_token(str(doctor.id), doctor.role, doctor.email)}
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench", cookies=cookies) as client:
+        await run(client, paths, 1)  # warm up
+        print(f"{'threadpool':>10} {'concurrency':>11} {'req/s':>10}")
+        for tokens in (1, 40):
+            anyio.to_thread.current_default_thread_limiter().total_tokens = tokens
+            for concurrency in (1, 8, 32, 128):
+                rps = await run(client, paths, concurrency)
+                print(f"{tokens:>10} {concurrency:>11} {rps:>10.1f}")
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
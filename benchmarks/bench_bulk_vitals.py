@@ -0,0 +1,70 @@
+"""Vitals ingestion throughput: one reading per request vs. the bulk endpoint.
+
+    python -m benchmarks.bench_bulk_vitals
+"""
+import os
+import time
+import asyncio
+import tempfile
+
+_db_path = os.path.join(tempfile.mkdtemp(), "bench.db")
+os.environ["DATABASE_URL"] = f"sqlite:///{_db_path}"
+
+import httpx
+
+from backend.main import app
+from backend.database import engine, Base, AsyncSessionLocal
+from backend.models import User, Role, AccountStatus
+from backend.auth import create_access_token
+
+READINGS = 2000
+BATCH_SIZES = (50, 200, 1000)
+
+
+def reading(i):
+    return {"heartRate": 60 + i % 40, "oxygenSaturation": 90 + i % 10, "temperature": 36.5, "bloodPressure": "120/80"}
+
+
+async def seed():
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    async with AsyncSessionLocal() as db:
+        nurse = User(email="nurse@bench", passwordHash="x", firstName="N", lastName="B", role=Role.NURSE, accountStatus=AccountStatus.ACTIVE)
+        patient = User(email="pat@bench", passwordHash="x", firstName="P", lastName="B", role=Role.PATIENT, accountStatus=AccountStatus.ACTIVE)
+        db.add_all([nurse, patient])
+        await db.commit()
+        return nurse, patient
+
+
+async def single(client, patient_id):
+    start = time.perf_counter()
+    for i in range(READINGS):
+        response = await client.post(f"/api/v1/clinical/tools/vitals?patient_id={patient_id}", json=reading(i))
+        assert response.status_code == 200, response.text
+    return READINGS / (time.perf_counter() - start)
+
+
+async def bulk(client, patient_id, batch_size):
+    start = time.perf_counter()
+    for offset in range(0, READINGS, batch_size):
+        batch = [reading(i) for i in range(offset, min(offset + batch_size, READINGS))]
+        response = await client.post(f"/api/v1/clinical/tools/vitals/bulk?patient_id={patient_id}", json={"readings": batch})
+        assert response.status_code == 200 and response.json()["created"] == len(batch), response.text
+    return READINGS / (time.perf_counter() - start)
+
+
+async def main():
+    nurse, patient = await seed()
+    cookies = {"access_token": create_access_token(str(nurse.id), nurse.role, nurse.email), "csrf_token": "bench"}
+    headers = {"x-csrf-token": "bench"}
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench", cookies=cookies, headers=headers) as client:
+        print(f"{'path':>12} {'readings/s':>12}")
+        print(f"{'single':>12} {await single(client, patient.id):>12.1f}")
+        for batch_size in BATCH_SIZES:
+            print(f"{f'bulk x{batch_size}':>12} {await bulk(client, patient.id, batch_size):>12.1f}")
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
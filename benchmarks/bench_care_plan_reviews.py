@@ -0,0 +1,96 @@
+"""Care-plan review scheduling at 100k plans: heap rebuild time and latency of
+the per-clinician "reviews due this week" endpoint.
+
+    python -m benchmarks.bench_care_plan_reviews
+"""
+import os
+import time
+import random
+import asyncio
+import statistics
+import tempfile
+import uuid
+from datetime import datetime, timedelta
+
+_db_path = os.path.join(tempfile.mkdtemp(), "bench.db")
+os.environ["DATABASE_URL"] = f"sqlite:///{_db_path}"
+
+import httpx
+from sqlalchemy import insert
+
+from backend.main import app
+from backend.database import engine, Base, AsyncSessionLocal
+from backend.models import User, Role, AccountStatus, CarePlan, CarePlanStatus, ClinicalAssignment, ClinicalRoleContext
+from backend.auth import create_access_token
+from backend.care_plan_reviews import ReviewScheduler
+
+PLANS = 100_000
+PATIENTS = 10_000
+CASELOAD = 200
+RUNS = 50
+
+
+async def seed():
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    async with AsyncSessionLocal() as db:
+        doctor = User(email="doc@bench", passwordHash="x", firstName="D", lastName="B", role=Role.DOCTOR, accountStatus=AccountStatus.ACTIVE)
+        db.add(doctor)
+        patients = [
+            {"id": uuid.uuid4(), "email": f"p{i}@bench", "passwordHash": "x", "firstName": "P", "lastName": f"B{i}",
+             "role": Role.PATIENT, "accountStatus": AccountStatus.ACTIVE}
+            for i in range(PATIENTS)
+        ]
+        await db.execute(insert(User), patients)
+        await db.flush()
+        db.add_all([
+            ClinicalAssignment(clinicianId=doctor.id, patientId=p["id"], roleContext=ClinicalRoleContext.PRIMARY_PHYSICIAN)
+            for p in patients[:CASELOAD]
+        ])
+        today = datetime.utcnow().date()
+        statuses = [CarePlanStatus.ACTIVE, CarePlanStatus.DRAFT, CarePlanStatus.COMPLETED, CarePlanStatus.ARCHIVED]
+        plans = [
+            {"id": uuid.uuid4(), "patientId": patients[i % PATIENTS]["id"], "status": random.choice(statuses),
+             "reviewDate": today + timedelta(days=random.randint(-30, 180)), "goals": [], "createdAt": datetime.utcnow(),
+             "updatedAt": datetime.utcnow()}
+            for i in range(PLANS)
+        ]
+        for offset in range(0, PLANS, 5000):
+            await db.execute(insert(CarePlan), plans[offset:offset + 5000])
+        await db.commit()
+        return doctor
+
+
+async def main():
+    doctor = await seed()
+
+    scheduler = ReviewScheduler()
+    start = time.perf_counter()
+    await scheduler.rebuild()
+    print(f"heap rebuild: {len(scheduler._scheduled):,} open plans in {(time.perf_counter() - start) * 1000:.0f}ms")
+    start = time.perf_counter()
+    due = scheduler.pop_due(datetime.utcnow().date())
+    print(f"pop due:      {len(due):,} plans in {(time.perf_counter() - start) * 1000:.1f}ms")
+
+    cookies = {"access_token": create_access_token(str(doctor.id), doctor.role, doctor.email)}
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench", cookies=cookies) as client:
+        timings, pages = [], 0
+        for _ in range(RUNS):
+            cursor, pages = None, 0
+            while True:
+                start = time.perf_counter()
+                response = await client.get("/api/v1/clinical/care-plans/reviews/due", params={"limit": 50, **({"cursor": cursor} if cursor else {})})
+                timings.append((time.perf_counter() - start) * 1000)
+                assert response.status_code == 200, response.text
+                pages += 1
+                cursor = response.json()["nextCursor"]
+                if not cursor:
+                    break
+        timings.sort()
+        print(f"due endpoint: {pages} pages per caseload of {CASELOAD}, p50 {statistics.median(timings):.1f}ms, p95 {timings[int(len(timings) * 0.95) - 1]:.1f}ms")
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
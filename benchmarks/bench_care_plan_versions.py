@@ -0,0 +1,99 @@
+"""Care-plan history storage: 200 small edits to a plan with 40 goals and ~20KB of
+notes, comparing bytes stored as diffs against a full copy per version, and the
+latency of reconstructing versions through the API.
+
+    python -m benchmarks.bench_care_plan_versions
+"""
+import os
+import json
+import time
+import random
+import asyncio
+import statistics
+import tempfile
+import uuid
+
+_db_path = os.path.join(tempfile.mkdtemp(), "bench.db")
+os.environ["DATABASE_URL"] = f"sqlite:///{_db_path}"
+
+import httpx
+from sqlalchemy.future import select
+
+from backend.main import app
+from backend.config import settings
+from backend.database import engine, Base, AsyncSessionLocal
+from backend.models import User, Role, AccountStatus, CarePlanVersion
+from backend.auth import create_access_token
+
+EDITS = 200
+GOALS = 40
+NOTE_WORDS = 3000
+WORDS = ["pain", "stable", "nausea", "morphine", "family", "sleep", "appetite", "visit", "review", "comfort", "breathing", "mobility"]
+
+
+async def seed():
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    async with AsyncSessionLocal() as db:
+        doctor = User(email="doc@bench", passwordHash="x", firstName="D", lastName="B", role=Role.DOCTOR, accountStatus=AccountStatus.ACTIVE)
+        patient = User(email="pat@bench", passwordHash="x", firstName="P", lastName="B", role=Role.PATIENT, accountStatus=AccountStatus.ACTIVE)
+        db.add_all([doctor, patient])
+        await db.commit()
+        return doctor, patient
+
+
+def edit(plan):
+    # A typical tweak: reword a few words of the notes, sometimes touch one goal
+    words = plan["notes"].split(" ")
+    for _ in range(3):
+        words[random.randrange(len(words))] = random.choice(WORDS)
+    body = {"notes": " ".join(words), "expectedVersion": plan["version"]}
+    if random.random() < 0.3:
+        goals = list(plan["goals"])
+        goals[random.randrange(len(goals))] = f"goal {random.randint(0, 10_000)}"
+        body["goals"] = goals
+    return body
+
+
+async def main():
+    random.seed(7)
+    doctor, patient = await seed()
+    cookies = {"access_token": create_access_token(str(doctor.id), doctor.role, doctor.email), "csrf_token": "bench"}
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench", cookies=cookies, headers={"x-csrf-token": "bench"}) as client:
+        response = await client.post(f"/api/v1/clinical/care-plans/{patient.id}", json={
+            "goals": [f"goal {i}" for i in range(GOALS)],
+            "notes": " ".join(random.choice(WORDS) for _ in range(NOTE_WORDS))
+        })
+        plan = response.json()
+        full_copies = 0
+        timings = []
+        for _ in range(EDITS):
+            start = time.perf_counter()
+            response = await client.patch(f"/api/v1/clinical/care-plans/plans/{plan['id']}", json=edit(plan))
+            timings.append((time.perf_counter() - start) * 1000)
+            assert response.status_code == 200, response.text
+            plan = response.json()
+            full_copies += len(json.dumps({field: plan[field] for field in ("status", "reviewDate", "goals", "notes")}))
+        print(f"patch:       p50 {statistics.median(timings):.1f}ms over {EDITS} edits")
+
+        async with AsyncSessionLocal() as db:
+            rows = (await db.execute(select(CarePlanVersion.data).where(CarePlanVersion.planId == uuid.UUID(plan["id"])))).scalars().all()
+        stored = sum(len(json.dumps(data)) for data in rows)
+        print(f"storage:     {stored / 1024:.0f}KB as diffs+snapshots vs {full_copies / 1024:.0f}KB as full copies "
+              f"({full_copies / stored:.1f}x smaller, snapshot every {settings.CARE_PLAN_SNAPSHOT_INTERVAL})")
+
+        timings = []
+        for _ in range(100):
+            version = random.randint(1, plan["version"])
+            start = time.perf_counter()
+            response = await client.get(f"/api/v1/clinical/care-plans/plans/{plan['id']}/versions/{version}")
+            timings.append((time.perf_counter() - start) * 1000)
+            assert response.status_code == 200, response.text
+        timings.sort()
+        print(f"reconstruct: p50 {statistics.median(timings):.1f}ms, p95 {timings[94]:.1f}ms")
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
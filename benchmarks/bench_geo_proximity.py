@@ -0,0 +1,129 @@
+"""Proximity matching at 50k open service requests located across US zip codes:
+latency of "pending requests within N km" (newest first and nearest first) through
+the API, against a full scan computing every request's distance, and a check that
+both return the same requests.
+
+    python -m benchmarks.bench_geo_proximity
+"""
+import os
+import time
+import random
+import asyncio
+import statistics
+import tempfile
+import uuid
+from datetime import datetime, timedelta
+
+_db_path = os.path.join(tempfile.mkdtemp(), "bench.db")
+os.environ["DATABASE_URL"] = f"sqlite:///{_db_path}"
+
+import httpx
+from sqlalchemy import insert, text
+from sqlalchemy.future import select
+
+from backend.main import app
+from backend.database import engine, Base, AsyncSessionLocal
+from backend.models import User, Role, AccountStatus, ServiceRequest, ServiceRequestStatus, ServiceRequestType
+from backend.auth import create_access_token
+from backend.geo import BUNDLED_DATASET, load_zip_locations, location_columns, haversine_km, zip_location
+
+REQUESTS = 50_000
+PATIENTS = 10_000
+QUERIES = 40
+RADII_KM = [10, 25, 50, 100]
+
+
+async def seed(zips):
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    async with AsyncSessionLocal() as db:
+        volunteer = User(email="vol@bench", passwordHash="x", firstName="V", lastName="B", role=Role.VOLUNTEER, accountStatus=AccountStatus.ACTIVE)
+        db.add(volunteer)
+        patients = [
+            {"id": uuid.uuid4(), "email": f"p{i}@bench", "passwordHash": "x", "firstName": "P", "lastName": f"B{i}",
+             "role": Role.PATIENT, "accountStatus": AccountStatus.ACTIVE, "zipCode": random.choice(zips)}
+            for i in range(PATIENTS)
+        ]
+        await db.execute(insert(User), patients)
+        now = datetime.utcnow()
+        rows = []
+        for i in range(REQUESTS):
+            patient = random.choice(patients)
+            rows.append({
+                "id": uuid.uuid4(), "patientId": patient["id"], "title": f"Request {i}",
+                "requestType": random.choice(list(ServiceRequestType)), "status": ServiceRequestStatus.PENDING,
+                "createdAt": now - timedelta(seconds=i), "updatedAt": now, **location_columns(patient["zipCode"])
+            })
+        for offset in range(0, REQUESTS, 5000):
+            await db.execute(insert(ServiceRequest), rows[offset:offset + 5000])
+        await db.commit()
+    async with engine.begin() as conn:
+        await conn.execute(text("ANALYZE"))
+    return volunteer
+
+
+async def full_scan(latitude, longitude, radius_km):
+    # Baseline: read every pending request with its patient's zip and measure each one
+    async with AsyncSessionLocal() as db:
+        result = await db.execute(
+            select(ServiceRequest.id, User.zipCode)
+            .join(User, User.id == ServiceRequest.patientId)
+            .where(ServiceRequest.status == ServiceRequestStatus.PENDING)
+        )
+        hits = {}
+        for request_id, zip_code in result:
+            location = zip_location(zip_code)
+            if location and haversine_km(latitude, longitude, *location) <= radius_km:
+                hits[request_id] = haversine_km(latitude, longitude, *location)
+        return hits
+
+
+def p50(timings):
+    return statistics.median(timings)
+
+
+async def main():
+    random.seed(5)
+    zips = sorted(load_zip_locations(BUNDLED_DATASET))
+    volunteer = await seed(zips)
+    cookies = {"access_token": create_access_token(str(volunteer.id), volunteer.role, volunteer.email)}
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench", cookies=cookies) as client:
+        await client.get("/api/v1/services/requests", params={"radiusKm": 10, "zipCode": "10001"})
+        for radius in RADII_KM:
+            recent, nearest, scans, found = [], [], [], []
+            for origin in random.sample(zips, QUERIES):
+                latitude, longitude = zip_location(origin)
+
+                start = time.perf_counter()
+                response = await client.get("/api/v1/services/requests", params={"radiusKm": radius, "zipCode": origin, "limit": 50})
+                recent.append((time.perf_counter() - start) * 1000)
+                assert response.status_code == 200, response.text
+
+                start = time.perf_counter()
+                response = await client.get("/api/v1/services/requests", params={"radiusKm": radius, "zipCode": origin, "sort": "distance", "limit": 100})
+                nearest.append((time.perf_counter() - start) * 1000)
+                page = response.json()["data"]
+
+                start = time.perf_counter()
+                expected = await full_scan(latitude, longitude, radius)
+                scans.append((time.perf_counter() - start) * 1000)
+
+                # Same requests as the scan, nearest first, with matching distances
+                closest = sorted(expected.items(), key=lambda item: item[1])[:100]
+                assert [r["distanceKm"] for r in page] == [round(d, 2) for _, d in closest], origin
+                assert {uuid.UUID(r["id"]) for r in page} <= set(expected), origin
+                found.append(len(expected))
+            print(f"{radius:>4}km: ~{statistics.mean(found):.0f} matches | newest first p50 {p50(recent):.1f}ms | "
+                  f"nearest first p50 {p50(nearest):.1f}ms | full scan p50 {p50(scans):.0f}ms")
+
+    async with engine.connect() as conn:
+        plan = await conn.execute(text(
+            'EXPLAIN QUERY PLAN SELECT id FROM service_requests WHERE status = \'PENDING\' AND "geoCell" IN (1, 2, 3)'
+        ))
+        print("plan:", " | ".join(row[-1] for row in plan))
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,130 @@
+"""Query latency of patient-scoped full-text search on a synthetic corpus:
+end to end through the endpoint, and the search query alone next to an unranked
+per-patient LIKE scan over the same rows.
+
+    python -m benchmarks.bench_search
+"""
+import os
+import time
+import random
+import asyncio
+import statistics
+import tempfile
+import uuid
+from datetime import datetime, timedelta
+
+_db_path = os.path.join(tempfile.mkdtemp(), "bench.db")
+os.environ["DATABASE_URL"] = f"sqlite:///{_db_path}"
+
+import httpx
+from sqlalchemy import insert, or_, select
+
+from backend.main import app
+from backend.database import engine, Base, AsyncSessionLocal
+from backend.models import User, Role, AccountStatus, ConsultationNote, TimelineEvent, TimelineEventType
+from backend.auth import create_access_token
+from backend.search import search_patient_records
+
+PATIENTS = 200
+NOTES_PER_PATIENT = 50
+EVENTS_PER_PATIENT = 200
+RUNS = 50
+QUERIES = ["breakthrough pain", "nausea", "morphine dose", "family meeting", "constip"]
+
+CLINICAL_WORDS = (
+    "pain nausea vomiting fatigue breathless appetite sleep anxious family meeting morphine dose increased "
+    "reduced oxycodone paracetamol laxative constipation mouth care pressure area breakthrough episodes "
+    "overnight mobility walking frame visit nurse review stable improving worse"
+).split()
+# Zipf-distributed vocabulary: clinical terms are mid-frequency among filler words
+FILLER = [f"w{i}" for i in range(5000)]
+VOCABULARY = FILLER[:20] + CLINICAL_WORDS + FILLER[20:]
+WEIGHTS = [1 / (rank + 1) for rank in range(len(VOCABULARY))]
+
+
+def sentence(n):
+    return " ".join(random.choices(VOCABULARY, WEIGHTS, k=n))
+
+
+async def seed():
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    async with AsyncSessionLocal() as db:
+        doctor = User(email="doc@bench", passwordHash="x", firstName="D", lastName="B", role=Role.DOCTOR, accountStatus=AccountStatus.ACTIVE)
+        patients = [
+            User(email=f"p{i}@bench", passwordHash="x", firstName="P", lastName="B", role=Role.PATIENT, accountStatus=AccountStatus.ACTIVE)
+            for i in range(PATIENTS)
+        ]
+        db.add(doctor)
+        db.add_all(patients)
+        await db.flush()
+        start = datetime(2026, 1, 1)
+        for patient in patients:
+            notes = [
+                {"id": uuid.uuid4(), "patientId": patient.id, "doctorId": doctor.id, "subjective": sentence(30),
+                 "objective": sentence(20), "assessment": sentence(10), "plan": sentence(15),
+                 "consultationDate": start + timedelta(days=i)}
+                for i in range(NOTES_PER_PATIENT)
+            ]
+            events = [
+                {"id": uuid.uuid4(), "patientId": patient.id, "authorId": doctor.id, "eventType": TimelineEventType.SYMPTOM,
+                 "description": sentence(12), "timestamp": start + timedelta(hours=i)}
+                for i in range(EVENTS_PER_PATIENT)
+            ]
+            await db.execute(insert(ConsultationNote), notes)
+            await db.execute(insert(TimelineEvent), events)
+        await db.commit()
+        return doctor, patients[0]
+
+
+async def like_scan(patient_id, q):
+    pattern = f"%{q}%"
+    async with AsyncSessionLocal() as db:
+        notes = await db.execute(select(ConsultationNote.id).where(
+            ConsultationNote.patientId == patient_id,
+            or_(ConsultationNote.subjective.ilike(pattern), ConsultationNote.objective.ilike(pattern),
+                ConsultationNote.assessment.ilike(pattern), ConsultationNote.plan.ilike(pattern))
+        ))
+        events = await db.execute(select(TimelineEvent.id).where(
+            TimelineEvent.patientId == patient_id, TimelineEvent.description.ilike(pattern)
+        ))
+        return len(notes.all()) + len(events.all())
+
+
+async def timed(fn):
+    timings = []
+    for _ in range(RUNS):
+        start = time.perf_counter()
+        await fn()
+        timings.append((time.perf_counter() - start) * 1000)
+    timings.sort()
+    return statistics.median(timings), timings[int(len(timings) * 0.95) - 1]
+
+
+async def main():
+    doctor, patient = await seed()
+    corpus = PATIENTS * (NOTES_PER_PATIENT + EVENTS_PER_PATIENT)
+    print(f"corpus: {corpus:,} documents across {PATIENTS} patients")
+    cookies = {"access_token": create_access_token(str(doctor.id), doctor.role, doctor.email)}
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench", cookies=cookies) as client:
+        url = f"/api/v1/clinical/patients/{patient.id}/search"
+        print(f"{'query':>18} {'http p50':>9} {'http p95':>9} {'query p50':>10} {'like p50':>9}")
+        for q in QUERIES:
+            async def endpoint():
+                response = await client.get(url, params={"q": q, "limit": 20})
+                assert response.status_code == 200, response.text
+
+            async def query():
+                async with AsyncSessionLocal() as db:
+                    await search_patient_records(db, patient.id, q, 20, 0)
+
+            http_p50, http_p95 = await timed(endpoint)
+            query_p50, _ = await timed(query)
+            like_p50, _ = await timed(lambda: like_scan(patient.id, q))
+            print(f"{q:>18} {http_p50:>8.1f}ms {http_p95:>8.1f}ms {query_p50:>9.1f}ms {like_p50:>8.1f}ms")
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,114 @@
+"""Contended service-request claims: CLAIMERS volunteers and organizations claim
+the same request at once, ROUNDS times. Checks exactly one claim wins each round
+(200, row assigned to the winner) and every other gets 409, reports claim latency,
+and shows how many "winners" the old read-check-write flow produced on the same load.
+
+    python -m benchmarks.bench_service_claims
+"""
+import os
+import time
+import asyncio
+import statistics
+import tempfile
+import uuid
+from datetime import datetime
+
+_db_path = os.path.join(tempfile.mkdtemp(), "bench.db")
+os.environ["DATABASE_URL"] = f"sqlite:///{_db_path}"
+
+import httpx
+from sqlalchemy import insert
+from sqlalchemy.future import select
+
+from backend.main import app
+from backend.database import engine, Base, AsyncSessionLocal
+from backend.models import User, Role, AccountStatus, ServiceRequest, ServiceRequestStatus, ServiceRequestType
+from backend.auth import create_access_token
+
+CLAIMERS = 300
+ROUNDS = 10
+
+
+async def seed():
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    async with AsyncSessionLocal() as db:
+        patient = User(email="pat@bench", passwordHash="x", firstName="P", lastName="B", role=Role.PATIENT, accountStatus=AccountStatus.ACTIVE)
+        db.add(patient)
+        claimers = [
+            {"id": uuid.uuid4(), "email": f"c{i}@bench", "passwordHash": "x", "firstName": "C", "lastName": f"B{i}",
+             "role": Role.VOLUNTEER if i % 4 else Role.ORGANIZATION, "accountStatus": AccountStatus.ACTIVE}
+            for i in range(CLAIMERS)
+        ]
+        await db.execute(insert(User), claimers)
+        await db.flush()
+        requests = [
+            {"id": uuid.uuid4(), "patientId": patient.id, "title": f"Ride {i}", "requestType": ServiceRequestType.TRANSPORT,
+             "status": ServiceRequestStatus.PENDING, "createdAt": datetime.utcnow(), "updatedAt": datetime.utcnow()}
+            for i in range(ROUNDS * 2)
+        ]
+        await db.execute(insert(ServiceRequest), requests)
+        await db.commit()
+        return claimers, [r["id"] for r in requests]
+
+
+async def read_check_write(request_id: uuid.UUID, claimer) -> bool:
+    # The previous claim flow: SELECT, check status in Python, then write
+    async with AsyncSessionLocal() as db:
+        req = (await db.execute(select(ServiceRequest).where(ServiceRequest.id == request_id))).scalars().first()
+        if req.status != ServiceRequestStatus.PENDING:
+            return False
+        await asyncio.sleep(0)
+        req.volunteerId = claimer["id"]
+        req.status = ServiceRequestStatus.ASSIGNED
+        await db.commit()
+        return True
+
+
+async def main():
+    claimers, request_ids = await seed()
+    transport = httpx.ASGITransport(app=app)
+    clients = [
+        httpx.AsyncClient(
+            transport=transport, base_url="http://bench", headers={"x-csrf-token": "bench"},
+            cookies={"access_token": create_access_token(str(c["id"]), c["role"], c["email"]), "csrf_token": "bench"}
+        )
+        for c in claimers
+    ]
+
+    async def claim(client, request_id):
+        start = time.perf_counter()
+        response = await client.patch(f"/api/v1/services/requests/{request_id}/claim", json={})
+        return response, (time.perf_counter() - start) * 1000
+
+    latencies = {200: [], 409: []}
+    for request_id in request_ids[:ROUNDS]:
+        results = await asyncio.gather(*(claim(client, request_id) for client in clients))
+        codes = [response.status_code for response, _ in results]
+        assert set(codes) <= {200, 409}, set(codes)
+        assert codes.count(200) == 1, f"{codes.count(200)} winners"
+        winner = next(response.json() for response, _ in results if response.status_code == 200)
+        async with AsyncSessionLocal() as db:
+            row = (await db.execute(select(ServiceRequest).where(ServiceRequest.id == request_id))).scalars().first()
+        assert row.status == ServiceRequestStatus.ASSIGNED
+        assert (row.volunteerId or row.organizationId) == uuid.UUID(winner["volunteerId"] or winner["organizationId"])
+        for response, ms in results:
+            latencies[response.status_code].append(ms)
+    print(f"atomic claim:      {ROUNDS} rounds x {CLAIMERS} claimers, exactly one winner each round")
+    for code, timings in latencies.items():
+        timings.sort()
+        print(f"  {code}: p50 {statistics.median(timings):.1f}ms, p95 {timings[int(len(timings) * 0.95) - 1]:.1f}ms")
+
+    winners = []
+    for request_id in request_ids[ROUNDS:]:
+        results = await asyncio.gather(*(read_check_write(request_id, c) for c in claimers), return_exceptions=True)
+        winners.append(sum(1 for won in results if won is True))
+    print(f"read-check-write:  {statistics.mean(winners):.0f} claims reported success per round on average (lost updates)")
+
+    for client in clients:
+        await client.aclose()
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
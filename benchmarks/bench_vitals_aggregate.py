@@ -0,0 +1,92 @@
+"""Latency of the vitals rollup endpoint for a patient with 100k readings
+spread over a year (one every ~5 minutes). Readings are written through the
+same rollup upsert as the API write paths.
+
+    python -m benchmarks.bench_vitals_aggregate
+"""
+import os
+import time
+import random
+import asyncio
+import statistics
+import tempfile
+import uuid
+from datetime import datetime, timedelta
+
+_db_path = os.path.join(tempfile.mkdtemp(), "bench.db")
+os.environ["DATABASE_URL"] = f"sqlite:///{_db_path}"
+
+import httpx
+from sqlalchemy import insert
+
+from backend.main import app
+from backend.database import engine, Base, AsyncSessionLocal
+from backend.models import User, Role, AccountStatus, VitalsRecord
+from backend.auth import create_access_token
+from backend.vitals import record_rollups
+
+READINGS = 100_000
+RUNS = 20
+END = datetime(2026, 1, 1)
+START = END - timedelta(days=365)
+# (interval, range) pairs a trend chart would request
+QUERIES = [
+    ("hour", timedelta(days=7)),
+    ("day", timedelta(days=90)),
+    ("week", timedelta(days=365)),
+    ("day", timedelta(days=365)),
+]
+
+
+async def seed():
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    async with AsyncSessionLocal() as db:
+        nurse = User(email="nurse@bench", passwordHash="x", firstName="N", lastName="B", role=Role.NURSE, accountStatus=AccountStatus.ACTIVE)
+        patient = User(email="pat@bench", passwordHash="x", firstName="P", lastName="B", role=Role.PATIENT, accountStatus=AccountStatus.ACTIVE)
+        db.add_all([nurse, patient])
+        await db.flush()
+        step = (END - START) / READINGS
+        rows = []
+        for i in range(READINGS):
+            systolic, diastolic = random.randint(100, 160), random.randint(60, 100)
+            rows.append({
+                "id": uuid.uuid4(),
+                "patientId": patient.id,
+                "recordedById": nurse.id,
+                "heartRate": random.randint(55, 110),
+                "temperature": round(random.uniform(36.0, 38.5), 1),
+                "oxygenSaturation": random.randint(88, 100),
+                "bloodPressure": f"{systolic}/{diastolic}",
+                "systolic": systolic,
+                "diastolic": diastolic,
+                "recordedAt": START + i * step,
+            })
+        for offset in range(0, READINGS, 5000):
+            await db.execute(insert(VitalsRecord), rows[offset:offset + 5000])
+            await record_rollups(db, patient.id, rows[offset:offset + 5000])
+        await db.commit()
+        return nurse, patient
+
+
+async def main():
+    nurse, patient = await seed()
+    cookies = {"access_token": create_access_token(str(nurse.id), nurse.role, nurse.email)}
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench", cookies=cookies) as client:
+        print(f"{'interval':>8} {'range':>9} {'buckets':>8} {'p50 ms':>8} {'max ms':>8}")
+        for interval, span in QUERIES:
+            params = {"patient_id": str(patient.id), "interval": interval, "since": (END - span).isoformat(), "until": END.isoformat()}
+            timings = []
+            for _ in range(RUNS):
+                start = time.perf_counter()
+                response = await client.get("/api/v1/clinical/tools/vitals/aggregate", params=params)
+                timings.append((time.perf_counter() - start) * 1000)
+                assert response.status_code == 200, response.text
+            buckets = len(response.json()["data"])
+            print(f"{interval:>8} {span.days:>8}d {buckets:>8} {statistics.median(timings):>8.1f} {max(timings):>8.1f}")
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,130 @@
+"""Query-plan check for the service-request feed: builds every audience/filter
+combination with backend.service_requests.feed_query over 50k seeded requests,
+runs EXPLAIN QUERY PLAN and fails if any step scans a table instead of an index.
+Also prints first-page and deep-page latency for the volunteer feed.
+
+    python -m benchmarks.check_service_feed_plans
+"""
+import os
+import re
+import sys
+import time
+import random
+import asyncio
+import statistics
+import tempfile
+import uuid
+from datetime import datetime, timedelta
+
+_db_path = os.path.join(tempfile.mkdtemp(), "bench.db")
+os.environ["DATABASE_URL"] = f"sqlite:///{_db_path}"
+
+import httpx
+from sqlalchemy import insert, text
+
+from backend.main import app
+from backend.database import engine, Base, AsyncSessionLocal
+from backend.models import User, Role, AccountStatus, ServiceRequest, ServiceRequestStatus, ServiceRequestType
+from backend.auth import create_access_token
+from backend.service_requests import feed_query
+from backend.geo import BUNDLED_DATASET, load_zip_locations, location_columns
+
+REQUESTS = 50_000
+PATIENTS = 2_000
+CITIES = ["Pune", "Mumbai", "Nashik", "Nagpur", "Kolhapur"]
+# "SCAN table" reads every row; "SCAN table USING INDEX" walks an index in order and
+# stops at the LIMIT. Scans of the union's own subqueries (anon_*) are of <= 2 pages.
+TABLE_SCAN = re.compile(r"^SCAN (service_requests|users)$")
+
+
+async def seed():
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    zips = sorted(load_zip_locations(BUNDLED_DATASET))
+    async with AsyncSessionLocal() as db:
+        users = {
+            role: User(email=f"{role.value.lower()}@bench", passwordHash="x", firstName="U", lastName="B", role=role, accountStatus=AccountStatus.ACTIVE)
+            for role in [Role.VOLUNTEER, Role.ORGANIZATION, Role.ADMIN]
+        }
+        db.add_all(users.values())
+        patients = [
+            {"id": uuid.uuid4(), "email": f"p{i}@bench", "passwordHash": "x", "firstName": "P", "lastName": f"B{i}",
+             "role": Role.PATIENT, "accountStatus": AccountStatus.ACTIVE, "city": random.choice(CITIES),
+             "zipCode": random.choice(zips)}
+            for i in range(PATIENTS)
+        ]
+        await db.execute(insert(User), patients)
+        await db.flush()
+        now = datetime.utcnow()
+        statuses = list(ServiceRequestStatus)
+        rows = []
+        for i in range(REQUESTS):
+            status = random.choice(statuses)
+            claimed = status != ServiceRequestStatus.PENDING and random.random() < 0.02
+            patient = random.choice(patients)
+            rows.append({
+                "id": uuid.uuid4(), "patientId": patient["id"], "title": f"Request {i}", **location_columns(patient["zipCode"]),
+                "requestType": random.choice(list(ServiceRequestType)), "status": status,
+                "volunteerId": users[Role.VOLUNTEER].id if claimed and i % 2 else None,
+                "organizationId": users[Role.ORGANIZATION].id if claimed and not i % 2 else None,
+                "dueDate": now + timedelta(hours=random.randint(-500, 500)),
+                "createdAt": now - timedelta(seconds=i * 30), "updatedAt": now
+            })
+        for offset in range(0, REQUESTS, 5000):
+            await db.execute(insert(ServiceRequest), rows[offset:offset + 5000])
+        await db.commit()
+        users[Role.PATIENT] = await db.get(User, patients[0]["id"])
+    async with engine.begin() as conn:
+        await conn.execute(text("ANALYZE"))
+    return users
+
+
+def variants(now: datetime):
+    cursor = (now - timedelta(days=3), uuid.uuid4())
+    yield "no filters", {}
+    yield "cursor", {"cursor": cursor}
+    yield "mine", {"mine": True}
+    yield "mine cursor", {"mine": True, "cursor": cursor}
+    yield "pending", {"statuses": [ServiceRequestStatus.PENDING]}
+    yield "requestType", {"request_types": [ServiceRequestType.TRANSPORT, ServiceRequestType.MEAL_DELIVERY]}
+    yield "due window", {"due_after": now, "due_before": now + timedelta(days=2)}
+    yield "city", {"city": "Pune"}
+    yield "radius", {"near": (40.75, -73.99, 25)}
+    yield "nearest", {"near": (40.75, -73.99, 25), "by_distance": True}
+    yield "all filters", {"cursor": cursor, "request_types": [ServiceRequestType.TRANSPORT], "due_after": now, "due_before": now + timedelta(days=2), "city": "Pune"}
+
+
+async def main():
+    random.seed(11)
+    users = await seed()
+    now = datetime.utcnow()
+    failures = 0
+    async with engine.connect() as conn:
+        for role, user in users.items():
+            for label, filters in variants(now):
+                stmt = feed_query(user, 51, **filters)
+                compiled = stmt.compile(engine, compile_kwargs={"literal_binds": True})
+                plan = [row[-1] for row in await conn.execute(text(f"EXPLAIN QUERY PLAN {compiled}"))]
+                scans = [step for step in plan if TABLE_SCAN.match(step)]
+                status = "FAIL" if scans else "ok"
+                failures += bool(scans)
+                print(f"{status:4} {role.value:12} {label:12} {' | '.join(plan)}")
+    print(f"{failures} plans with table scans")
+
+    cookies = {"access_token": create_access_token(str(users[Role.VOLUNTEER].id), Role.VOLUNTEER, users[Role.VOLUNTEER].email)}
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench", cookies=cookies) as client:
+        timings, cursor = [], None
+        for _ in range(100):
+            start = time.perf_counter()
+            response = await client.get("/api/v1/services/requests", params={"limit": 50, **({"cursor": cursor} if cursor else {})})
+            timings.append((time.perf_counter() - start) * 1000)
+            assert response.status_code == 200, response.text
+            cursor = response.json()["nextCursor"]
+        print(f"volunteer feed: 100 consecutive pages, first {timings[0]:.1f}ms, p50 {statistics.median(timings):.1f}ms, last {timings[-1]:.1f}ms")
+    await engine.dispose()
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -470,62 +470,94 @@ function loadNursePanel() {
   loadClinicalPanel('NURSE');
 }
 
-async function loadVolunteerPanel() {
+function servicesUrl(params, cursor) {
+  const query = new URLSearchParams(params);
+  if (cursor) query.set('cursor', cursor);
+  return '/api/v1/services/requests?' + query.toString();
+}
+
+// Appends a "Load more" button that fetches the page after nextCursor
+function appendLoadMore(list, nextCursor, load) {
+  if (!nextCursor) return;
+  const button = document.createElement('button');
+  button.className = 'btn-secondary w-full';
+  button.style = 'font-size:0.75rem;';
+  button.textContent = 'Load more';
+  button.onclick = () => {
+    button.remove();
+    load(nextCursor);
+  };
+  list.appendChild(button);
+}
+
+function loadVolunteerPanel() {
+  loadVolunteerAvailable();
+  loadVolunteerClaimed();
+}
+
+async function loadVolunteerAvailable(cursor) {
   const availableList = document.getElementById('volunteer-available-tasks-list');
+  try {
+    const page = await fetchApi(servicesUrl({ status: 'PENDING' }, cursor));
+    const available = page && page.data;
+    if (available && available.length > 0) {
+      if (!cursor) availableList.innerHTML = '';
+      available.forEach(r => {
+        const div = document.createElement('div');
+        div.className = 'connection-card';
+        div.style = 'padding: 1rem; border: 1px solid var(--border-color); border-radius: var(--radius-md); margin-bottom: 0.5rem;';
+        div.innerHTML = 
+          <div style="display:flex; justify-content:space-between; margin-bottom:0.5rem;">
+            <h4 style="margin:0; font-size:1rem;"></h4>
+            <span class="badge badge-pending"></span>
+          </div>
+          <p style="margin:0 0 1rem 0; font-size:0.85rem; color:var(--text-secondary);"></p>
+          <button class="btn-primary w-full" onclick="claimServiceRequest('')">Claim Task</button>
+        ;
+        availableList.appendChild(div);
+      });
+      appendLoadMore(availableList, page.nextCursor, loadVolunteerAvailable);
+    }
+  } catch (err) {
+    console.error('Failed to load volunteer tasks', err);
+  }
+}
+
+// Claimed tasks are the caller's own requests, which the pending feed may not reach
+async function loadVolunteerClaimed(cursor) {
   const claimedList = document.getElementById('volunteer-claimed-tasks-list');
-  
   try {
-    const data = await fetchApi('/api/v1/services/requests');
-    if (data && data.length > 0) {
-      const available = data.filter(r => r.status === 'PENDING');
-      const claimed = data.filter(r => r.status !== 'PENDING');
-      
-      if (available.length > 0) {
-        availableList.innerHTML = '';
-        available.forEach(r => {
-          const div = document.createElement('div');
-          div.className = 'connection-card';
-          div.style = 'padding: 1rem; border: 1px solid var(--border-color); border-radius: var(--radius-md); margin-bottom: 0.5rem;';
-          div.innerHTML = 
-            <div style="display:flex; justify-content:space-between; margin-bottom:0.5rem;">
-              <h4 style="margin:0; font-size:1rem;"></h4>
-              <span class="badge badge-pending"></span>
-            </div>
-            <p style="margin:0 0 1rem 0; font-size:0.85rem; color:var(--text-secondary);"></p>
-            <button class="btn-primary w-full" onclick="claimServiceRequest('')">Claim Task</button>
-          ;
-          availableList.appendChild(div);
-        });
-      }
-      
-      if (claimed.length > 0) {
-        claimedList.innerHTML = '';
-        claimed.forEach(r => {
-          const div = document.createElement('div');
-          div.className = 'connection-card';
-          div.style = 'padding: 1rem; border: 1px solid var(--border-color); border-radius: var(--radius-md); margin-bottom: 0.5rem; display:flex; justify-content:space-between; align-items:center;';
-          div.innerHTML = 
-            <div>
-              <h4 style="margin:0; font-size:1rem;"></h4>
-              <p style="margin:0; font-size:0.8rem; color:var(--text-secondary);">Status: </p>
-            </div>
-            <button class="btn-secondary" style="font-size:0.75rem;" onclick="alert('Update status UI not built yet')">Update Status</button>
-          ;
-          claimedList.appendChild(div);
-        });
-      }
+    const page = await fetchApi(servicesUrl({ mine: 'true' }, cursor));
+    const claimed = page && page.data;
+    if (claimed && claimed.length > 0) {
+      if (!cursor) claimedList.innerHTML = '';
+      claimed.forEach(r => {
+        const div = document.createElement('div');
+        div.className = 'connection-card';
+        div.style = 'padding: 1rem; border: 1px solid var(--border-color); border-radius: var(--radius-md); margin-bottom: 0.5rem; display:flex; justify-content:space-between; align-items:center;';
+        div.innerHTML = 
+          <div>
+            <h4 style="margin:0; font-size:1rem;"></h4>
+            <p style="margin:0; font-size:0.8rem; color:var(--text-secondary);">Status: </p>
+          </div>
+          <button class="btn-secondary" style="font-size:0.75rem;" onclick="alert('Update status UI not built yet')">Update Status</button>
+        ;
+        claimedList.appendChild(div);
+      });
+      appendLoadMore(claimedList, page.nextCursor, loadVolunteerClaimed);
     }
   } catch (err) {
     console.error('Failed to load volunteer tasks', err);
   }
 }
 
-async function loadOrganizationPanel() {
+async function loadOrganizationPanel(cursor) {
   const list = document.getElementById('org-requests-list');
   try {
-    const data = await fetchApi('/api/v1/services/requests');
+    const page = await fetchApi(servicesUrl({}, cursor));
+    const data = page && page.data;
     if (data && data.length > 0) {
-      list.innerHTML = '';
+      if (!cursor) list.innerHTML = '';
       data.forEach(r => {
         const div = document.createElement('div');
         div.className = 'connection-card';
@@ -539,18 +571,20 @@ async function loadOrganizationPanel() {
         ;
         list.appendChild(div);
       });
+      appendLoadMore(list, page.nextCursor, loadOrganizationPanel);
     }
   } catch (err) {
     console.error('Failed to load org requests', err);
   }
 }
 
-async function loadPatientServices() {
+async function loadPatientServices(cursor) {
   const list = document.getElementById('patient-services-list');
   try {
-    const data = await fetchApi('/api/v1/services/requests');
+    const page = await fetchApi(servicesUrl({}, cursor));
+    const data = page && page.data;
     if (data && data.length > 0) {
-      list.innerHTML = '';
+      if (!cursor) list.innerHTML = '';
       data.forEach(r => {
         const div = document.createElement('div');
         div.className = 'connection-card';
@@ -568,6 +602,7 @@ async function loadPatientServices() {
         ;
         list.appendChild(div);
       });
+      appendLoadMore(list, page.nextCursor, loadPatientServices);
     }
   } catch (err) {
     console.error('Failed to load patient services', err);